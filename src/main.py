@@ -1,8 +1,12 @@
 import os
+import sys
 import argparse
 
 from view.output_view import OutputView
-from model.font_builder import FontBuilder
+from model.build_options import TRACE_BACKEND_NAMES, BUILD_MODES, WEB_FORMATS
+from model.build_planner import BuildPlanner
+from model.layout_spec import LayoutSpec
+from model.image_source import SHEET_COLUMNS, is_directory_input
 
 
 def main():
@@ -14,6 +18,27 @@ def main():
     args = _setup_args(base_dir)
     potrace_execute = _setup_potrace(base_dir)
 
+    if args.command in ("plan", "check"):
+        _run_plan(args, view)
+    elif args.command == "batch":
+        _run_batch(args, view, potrace_execute)
+    elif args.command == "watch":
+        _run_watch(args, view, potrace_execute)
+    elif args.command == "preview":
+        _run_preview(args, view)
+    elif args.command == "verify":
+        _run_verify(args, view)
+    else:
+        _run_build(args, view, potrace_execute)
+
+
+# fontTools / NumPy / Pillow 는 빌드할 때만 불러옴 (plan / check 빠른 시작)
+def _run_build(args, view, potrace_execute):
+    from model.font_builder import FontBuilder
+    from model.build_trace import BuildTrace
+
+    trace = BuildTrace(enabled=args.profile or args.trace_json is not None)
+
     try:
         builder = FontBuilder(
             image_dir=args.image_dir,
@@ -21,6 +46,25 @@ def main():
             font_path=args.font_path,
             potrace_path=potrace_execute,
             font_name=args.font_name,
+            jobs=args.jobs,
+            svg_cache=not args.no_svg_cache,
+            threshold=args.threshold,
+            denoise=args.denoise,
+            simplify=args.simplify,
+            glyph_cache=not args.no_glyph_cache,
+            incremental=args.incremental,
+            mode=args.mode,
+            dedup=args.dedup,
+            layout_spec=args.layout_spec,
+            sheet_columns=args.sheet_columns,
+            trace=trace,
+            web_formats=args.web_formats,
+            web_slice=args.web_slice,
+            web_order=args.web_order,
+            svg_pipe=not args.no_pipe,
+            trace_backend=args.backend,
+            direct=args.direct,
+            write_svg=args.write_svg,
             step_call=view.display_step,
             subtask_call=view.display_subtask,
             progress_call=view.display_progress,
@@ -30,15 +74,200 @@ def main():
     except Exception as e:
         view.display_error(f"Font Build : {e}")
 
+    if args.profile:
+        view.display_profile(trace.summary())
+    if args.trace_json:
+        trace.save(args.trace_json)
+
+
+# manifest 의 여러 폰트를 한 프로세스에서 빌드 (트레이싱 / 글리프 컴파일 풀 공유)
+def _run_batch(args, view, potrace_execute):
+    from model.batch_builder import BatchBuilder
+
+    if not args.manifest:
+        view.display_error("batch 명령에는 --manifest 가 필요합니다.")
+        return
+
+    try:
+        batch = BatchBuilder(
+            args.manifest,
+            potrace_execute,
+            jobs=args.jobs,
+            options=_builder_options(args),
+            subtask_call=view.display_subtask,
+            error_call=view.display_error,
+        )
+        view.display_step(1, 1, f"일괄 빌드 : {args.manifest}")
+        batch.build_all()
+    except Exception as e:
+        view.display_error(f"{e}")
+
+
+# 전체 빌드 후 PNG 폴더를 감시하며 바뀐 부품만 다시 빌드 (Ctrl+C 로 종료)
+def _run_watch(args, view, potrace_execute):
+    from model.font_watcher import FontWatcher
+
+    if not is_directory_input(args.image_dir):
+        view.display_error("watch 명령은 PNG 폴더 입력만 지원합니다.")
+        return
+
+    try:
+        watcher = FontWatcher(
+            args.image_dir,
+            args.svg_dir,
+            args.font_path,
+            potrace_execute,
+            font_name=args.font_name,
+            jobs=args.jobs,
+            options=_builder_options(args),
+            step_call=view.display_step,
+            subtask_call=view.display_subtask,
+            progress_call=view.display_progress,
+            error_call=view.display_error,
+        )
+        watcher.run()
+    except Exception as e:
+        view.display_error(f"Watch : {e}")
+
+
+# 폰트를 빌드하지 않고 PNG 부품을 겹친 미리보기 이미지 저장
+def _run_preview(args, view):
+    from model.preview import SyllablePreview
+
+    try:
+        preview = SyllablePreview(args.image_dir, cell_size=args.cell_size, columns=args.columns,
+                                  sheet_columns=args.sheet_columns, subtask_call=view.display_subtask)
+        view.display_step(1, 1, f"미리보기 : {args.text}")
+        preview.render(args.text, args.preview_path)
+    except Exception as e:
+        view.display_error(f"{e}")
+
+
+# 빌드된 폰트(-o) 검증, 문제가 있으면 종료 코드 1 (--compare : 이전 빌드와 바뀐 글리프 목록)
+def _run_verify(args, view):
+    from model.font_verifier import FontVerifier
+
+    try:
+        verifier = FontVerifier(args.font_path, compare_path=args.compare_path)
+        ok = verifier.verify()
+    except Exception as e:
+        view.display_error(f"{e}")
+        sys.exit(1)
+
+    view.display_verify(verifier)
+    if not ok:
+        sys.exit(1)
+
+
+# batch / watch 에서 FontBuilder 에 넘기는 공통 옵션
+def _builder_options(args):
+    return {
+        "svg_cache": not args.no_svg_cache,
+        "threshold": args.threshold,
+        "denoise": args.denoise,
+        "simplify": args.simplify,
+        "glyph_cache": not args.no_glyph_cache,
+        "incremental": args.incremental,
+        "mode": args.mode,
+        "dedup": args.dedup,
+        "layout_spec": args.layout_spec,
+        "sheet_columns": args.sheet_columns,
+        "svg_pipe": not args.no_pipe,
+        "trace_backend": args.backend,
+        "direct": args.direct,
+        "write_svg": args.write_svg,
+        "web_formats": args.web_formats,
+        "web_slice": args.web_slice,
+        "web_order": args.web_order,
+    }
+
+
+# 빌드 전 부품 점검 : plan 은 보고만, check 는 빠진 부품이 있으면 종료 코드 1
+def _run_plan(args, view):
+    try:
+        layout_spec = LayoutSpec(args.layout_spec) if args.layout_spec else None
+        planner = BuildPlanner(args.image_dir, args.svg_dir, direct=args.direct, layout_spec=layout_spec,
+                               sheet_columns=args.sheet_columns)
+        complete = planner.plan()
+    except Exception as e:
+        view.display_error(f"{e}")
+        sys.exit(1)
+
+    view.display_plan(planner)
+    if args.command == "check" and not complete:
+        sys.exit(1)
+
 
 def _setup_args(base_dir):
     parser = argparse.ArgumentParser()
 
-    parser.add_argument(  # 기본 png 폴더 경로 : ImgToFont/image/png/
+    parser.add_argument(  # 기본 명령 : build (폰트 하나 빌드)
+        "command",
+        nargs="?",
+        choices=["build", "batch", "watch", "preview", "plan", "check", "verify"],
+        default="build",
+        help="실행할 명령"
+    )
+
+    parser.add_argument(  # batch 명령 : 빌드할 폰트 목록 JSON
+        "-m", "--manifest",
+        dest="manifest",
+        default=None,
+        help="일괄 빌드 manifest"
+    )
+
+    parser.add_argument(  # verify 명령 : 비교할 이전 빌드 폰트
+        "--compare",
+        dest="compare_path",
+        default=None,
+        metavar="PATH",
+        help="비교할 이전 폰트"
+    )
+
+    parser.add_argument(  # preview 명령 : 미리볼 문장
+        "-t", "--text",
+        dest="text",
+        default="다람쥐 헌 쳇바퀴에 타고파",
+        help="미리보기 문장"
+    )
+
+    parser.add_argument(  # preview 명령 : 미리보기 이미지 경로
+        "--preview-path",
+        dest="preview_path",
+        default=os.path.join(base_dir, "font", "preview.png"),
+        help="미리보기 이미지 경로"
+    )
+
+    parser.add_argument(  # preview 명령 : 글자 한 칸 크기 (px)
+        "--cell",
+        dest="cell_size",
+        type=int,
+        default=128,
+        help="미리보기 칸 크기"
+    )
+
+    parser.add_argument(  # preview 명령 : 한 줄 글자 수
+        "--columns",
+        dest="columns",
+        type=int,
+        default=20,
+        help="미리보기 한 줄 글자 수"
+    )
+
+    parser.add_argument(  # 기본 png 폴더 경로 : ImgToFont/image/png/ (zip / tar 압축 파일, 시트 PNG 도 가능)
         "-i", "--input",
         dest="image_dir",
         default=os.path.join(base_dir, "image", "png"),
-        help="PNG 폴더"
+        help="PNG 폴더 / 압축 파일 / 시트 PNG"
+    )
+
+    parser.add_argument(  # 시트 PNG 입력 : 가로 칸 수 (칸 순서는 plan 의 부품 순서)
+        "--sheet-columns",
+        dest="sheet_columns",
+        type=int,
+        default=SHEET_COLUMNS,
+        metavar="N",
+        help="시트 PNG 가로 칸 수"
     )
 
     parser.add_argument(  # 기본 svg 폴더 경로 : ImgToFont/image/svg/
@@ -62,15 +291,180 @@ def _setup_args(base_dir):
         help="Font Name"
     )
 
+    parser.add_argument(  # 기본 작업 수 : CPU 코어 수
+        "-j", "--jobs",
+        dest="jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="PNG → SVG 변환, 부품 글리프 컴파일 작업 수"
+    )
+
+    parser.add_argument(  # 변경되지 않은 PNG 도 모두 다시 변환
+        "--no-svg-cache",
+        dest="no_svg_cache",
+        action="store_true",
+        help="SVG 캐시 사용 안 함"
+    )
+
+    parser.add_argument(  # 흑백 변환 기준 밝기 (0~255), 없으면 Pillow 기본 변환 (디더링)
+        "--threshold",
+        dest="threshold",
+        type=int,
+        default=None,
+        help="흑백 변환 기준 밝기"
+    )
+
+    parser.add_argument(  # 티끌 / 바늘구멍 제거 강도 (주변 8칸 중 잉크 수 기준, 0 : 사용 안 함)
+        "--denoise",
+        dest="denoise",
+        type=int,
+        default=0,
+        choices=range(0, 5),
+        help="잡티 제거 강도"
+    )
+
+    parser.add_argument(  # 아웃라인 단순화 허용 오차 (폰트 단위), 단순화 전 / 후 점 수 보고
+        "--simplify",
+        dest="simplify",
+        type=_parse_tolerance,
+        default=None,
+        metavar="TOL",
+        help="아웃라인 단순화 허용 오차"
+    )
+
+    parser.add_argument(  # 컴파일된 부품 글리프 캐시 (SVG 폴더의 .glyph_cache) 사용 안 함
+        "--no-glyph-cache",
+        dest="no_glyph_cache",
+        action="store_true",
+        help="글리프 캐시 사용 안 함"
+    )
+
+    parser.add_argument(  # 이전 출력 폰트에서 바뀐 부품 글리프만 교체
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        help="증분 빌드"
+    )
+
+    parser.add_argument(  # 음절 구성 방식 : composite (합성 글리프) / gsub (ccmp 치환)
+        "--mode",
+        dest="mode",
+        choices=BUILD_MODES,
+        default="composite",
+        help="음절 구성 방식"
+    )
+
+    parser.add_argument(  # 윤곽선이 같거나 위치만 다른 부품은 대표 부품 하나를 옮겨 참조
+        "--dedup",
+        dest="dedup",
+        action="store_true",
+        help="중복 부품 윤곽선 제거"
+    )
+
+    parser.add_argument(  # 타입별 PNG 가 없는 부품은 자모 기본 그림을 변환(크기 / 위치)해 참조
+        "--layout-spec",
+        dest="layout_spec",
+        default=None,
+        metavar="PATH",
+        help="레이아웃 명세 JSON"
+    )
+
+    parser.add_argument(  # 단계별 시간 / 메모리 요약 출력
+        "--profile",
+        dest="profile",
+        action="store_true",
+        help="단계별 프로파일 출력"
+    )
+
+    parser.add_argument(  # Chrome trace event 형식 JSON 저장
+        "--trace-json",
+        dest="trace_json",
+        default=None,
+        help="빌드 트레이스 JSON 경로"
+    )
+
+    parser.add_argument(  # 웹 폰트 형식 (쉼표로 구분) : woff, woff2
+        "--web",
+        dest="web_formats",
+        type=_parse_web_formats,
+        default=None,
+        help="웹 폰트 형식 (woff,woff2)"
+    )
+
+    parser.add_argument(  # 음절을 SIZE 개씩 나눈 조각 웹 폰트 + @font-face CSS
+        "--slice",
+        dest="web_slice",
+        type=int,
+        default=0,
+        help="조각당 음절 수"
+    )
+
+    parser.add_argument(  # 조각 순서에 사용할 빈도순 텍스트 (UTF-8)
+        "--slice-order",
+        dest="web_order",
+        default=None,
+        help="음절 빈도순 텍스트 파일"
+    )
+
+    parser.add_argument(  # potrace 입출력을 stdin/stdout 대신 임시 BMP 파일로
+        "--no-pipe",
+        dest="no_pipe",
+        action="store_true",
+        help="임시 파일로 potrace 실행"
+    )
+
+    parser.add_argument(  # 기본 트레이싱 백엔드 : potrace
+        "-b", "--backend",
+        dest="backend",
+        choices=TRACE_BACKEND_NAMES,
+        default="potrace",
+        help="트레이싱 백엔드"
+    )
+
+    parser.add_argument(  # SVG 를 거치지 않고 트레이싱 결과로 바로 글리프 빌드
+        "--direct",
+        dest="direct",
+        action="store_true",
+        help="SVG 파일 없이 빌드"
+    )
+
+    parser.add_argument(  # --direct 에서도 확인용 SVG 저장
+        "--write-svg",
+        dest="write_svg",
+        action="store_true",
+        help="확인용 SVG 저장"
+    )
+
     args = parser.parse_args()
 
-    os.makedirs(args.image_dir, exist_ok=True)
-    os.makedirs(args.svg_dir, exist_ok=True)
-    os.makedirs(os.path.dirname(args.font_path), exist_ok=True)
+    if args.command in ("build", "watch"):
+        if is_directory_input(args.image_dir):
+            os.makedirs(args.image_dir, exist_ok=True)
+        if not args.direct or args.write_svg:
+            os.makedirs(args.svg_dir, exist_ok=True)
+        os.makedirs(os.path.dirname(args.font_path), exist_ok=True)
 
     return args
 
 
+def _parse_web_formats(value):
+    formats = [f.strip().lower() for f in value.split(",") if f.strip()]
+    for f in formats:
+        if f not in WEB_FORMATS:
+            raise argparse.ArgumentTypeError(f"지원하지 않는 형식 : {f}")
+    return formats
+
+
+def _parse_tolerance(value):
+    try:
+        tolerance = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"숫자가 아님 : {value}")
+    if not tolerance >= 0:
+        raise argparse.ArgumentTypeError(f"0 이상이어야 함 : {value}")
+    return tolerance
+
+
 def _setup_potrace(base_dir):
     potrace_execute = "potrace"  # 리눅스 환경
 
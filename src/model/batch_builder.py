@@ -0,0 +1,120 @@
+import os
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .font_builder import FontBuilder
+
+
+# 여러 폰트를 한 프로세스에서 함께 빌드
+#   manifest : {"jobs": [{"image_dir", "font_name", "output", "svg_dir"(선택)}, ...]} 또는 job 목록
+#   상대 경로는 manifest 파일 기준
+#   폰트마다 스레드 하나, 트레이싱 / 글리프 컴파일 작업은 모든 폰트가 공유하는 풀에서 실행
+class BatchBuilder:
+    def __init__(self, manifest_path, potrace_path, jobs = None, options = None,
+                 subtask_call = None, error_call = None):
+        self.manifest_path = manifest_path
+        self.potrace_path = potrace_path
+        self.jobs = jobs if jobs else (os.cpu_count() or 1)
+        self.options = options if options else {}  # FontBuilder 공통 옵션
+        self.subtask_call = subtask_call if subtask_call else lambda msg : None
+        self.error_call = error_call if error_call else lambda msg : None
+
+        self.results = []  # (폰트 이름, 출력 경로, 글리프 수, 소요 시간)
+        self.errors = []  # (폰트 이름, 오류 문구)
+
+    def build_all(self):
+        try:
+            font_jobs = self._load_manifest()
+        except Exception as e:
+            raise Exception(f"Batch : {e}")
+
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as trace_executor, \
+                self._glyph_executor() as glyph_executor, \
+                ThreadPoolExecutor(max_workers=len(font_jobs)) as font_executor:
+            futures = [
+                font_executor.submit(self._build_font, job, trace_executor, glyph_executor)
+                for job in font_jobs
+            ]
+            for future in futures:
+                future.result()
+
+        elapsed = time.perf_counter() - start
+        self._report(len(font_jobs), elapsed)
+
+        if len(self.errors) == len(font_jobs):
+            raise Exception(f"Batch : 모든 폰트 빌드 실패")
+
+    def _build_font(self, job, trace_executor, glyph_executor):
+        name = job["font_name"]
+        start = time.perf_counter()
+
+        try:
+            builder = FontBuilder(
+                image_dir=job["image_dir"],
+                svg_dir=job["svg_dir"],
+                font_path=job["output"],
+                potrace_path=self.potrace_path,
+                font_name=name,
+                jobs=self.jobs,
+                trace_executor=trace_executor,
+                glyph_executor=glyph_executor,
+                step_call=lambda num, tot, msg: self.subtask_call(f"[{name}] {num}/{tot} {msg}"),
+                subtask_call=lambda msg: self.subtask_call(f"[{name}]     {msg}"),
+                **self.options,
+            )
+            builder.build_all()
+        except Exception as e:
+            self.errors.append((name, str(e)))
+            self.error_call(f"[{name}] {e}")
+            return
+
+        glyph_count = len(builder.glyph_order)
+        self.results.append((name, job["output"], glyph_count, time.perf_counter() - start))
+        self.subtask_call(f"[{name}] 완료 : {glyph_count}개 글리프")
+
+    def _glyph_executor(self):
+        if self.jobs > 1:
+            return ProcessPoolExecutor(max_workers=self.jobs)
+        return ThreadPoolExecutor(max_workers=1)
+
+    def _report(self, font_count, elapsed):
+        glyphs = sum(result[2] for result in self.results)
+        rate = glyphs / elapsed if elapsed > 0 else 0
+
+        self.subtask_call(f"폰트 {len(self.results)}/{font_count}개 / 글리프 {glyphs}개 / "
+                          f"{elapsed:.2f}초 ({rate:.0f} glyphs/s)")
+
+    def _load_manifest(self):
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        font_jobs = manifest["jobs"] if isinstance(manifest, dict) else manifest
+        if not font_jobs:
+            raise Exception("manifest 에 job 이 없습니다.")
+
+        base_dir = os.path.dirname(os.path.abspath(self.manifest_path))
+        resolved = []
+        outputs = set()
+
+        for job in font_jobs:
+            for key in ("image_dir", "font_name", "output"):
+                if key not in job:
+                    raise Exception(f"manifest job 에 {key} 가 없습니다 : {job}")
+
+            output = os.path.join(base_dir, job["output"])
+            if output in outputs:
+                raise Exception(f"출력 경로 중복 : {job['output']}")
+            outputs.add(output)
+
+            svg_dir = job.get("svg_dir", os.path.splitext(job["output"])[0] + "_svg")
+            resolved.append({
+                "image_dir": os.path.join(base_dir, job["image_dir"]),
+                "font_name": job["font_name"],
+                "output": output,
+                "svg_dir": os.path.join(base_dir, svg_dir),
+            })
+
+        return resolved
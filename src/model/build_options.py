@@ -0,0 +1,11 @@
+# 명령줄 / manifest 에서 고를 수 있는 값
+#   plan / check 명령이 fontTools, NumPy, Pillow 를 불러오지 않고 인자를 확인할 수 있도록 따로 둠
+
+# 트레이싱 백엔드 (trace_backend.TRACE_BACKENDS 의 이름)
+TRACE_BACKEND_NAMES = ["potrace", "numpy"]
+
+# 음절 구성 방식 : composite (음절마다 합성 글리프) / gsub (ccmp 다중 치환)
+BUILD_MODES = ["composite", "gsub"]
+
+# 웹 폰트 형식
+WEB_FORMATS = ["woff", "woff2"]
@@ -0,0 +1,70 @@
+import os
+import time
+from collections import Counter
+
+from .syllable_layout import JAMO_MAP, SYLLABLE_COMPONENTS, component_names
+from .image_source import SHEET_COLUMNS, open_image_source
+
+
+# 빌드 전 점검 : PNG / SVG 폴더를 한 번씩만 훑어 필요한 부품과 비교
+#   트레이싱 / 글리프 컴파일 없이 빠진 부품과, 부품마다 .notdef 가 될 음절 수를 계산
+#   fontTools / NumPy / Pillow 를 불러오지 않으므로 바로 실행됨 (시트 PNG 입력은 디코딩 필요)
+class BuildPlanner:
+    def __init__(self, image_dir, svg_dir, direct = False, layout_spec = None, sheet_columns = SHEET_COLUMNS):
+        self.image_dir = image_dir
+        self.svg_dir = svg_dir
+        self.direct = direct  # --direct : SVG 를 쓰지 않으므로 PNG 만 인정
+        self.layout_spec = layout_spec  # LayoutSpec : 기본 그림이 있으면 타입별 PNG 가 없어도 됨
+        self.sheet_columns = sheet_columns
+
+        self.png_names = set()
+        self.svg_names = set()
+        self.missing = []  # (부품 이름, 깨지는 음절 수), 영향 큰 순
+        self.missing_jamo = []  # (코드 포인트, 부품 이름)
+        self.broken_syllables = 0
+        self.svg_only = []  # PNG 없이 SVG 만 있는 부품 (이전 변환 결과 사용)
+        self.derived = []  # 레이아웃 명세로 기본 그림을 변환해 만들 부품
+        self.unknown = []  # 명명 규칙에 없는 파일
+        self.elapsed = 0.0
+
+    def plan(self):
+        start = time.perf_counter()
+
+        try:
+            self.png_names = {name[:-len(".png")] for name in open_image_source(self.image_dir, self.sheet_columns).names()}
+            self.svg_names = set() if self.direct else self._scan(self.svg_dir, ".svg")
+        except OSError as e:
+            raise Exception(f"Plan : {e}")
+
+        required = component_names()
+        available = self.png_names | self.svg_names
+        self.derived = [name for name in required if name not in available and self._derivable(name, available)]
+        missing = {name for name in required if name not in available} - set(self.derived)
+
+        usage = Counter(name for components in SYLLABLE_COMPONENTS for name in components if name in missing)
+        self.missing = sorted(((name, usage[name]) for name in missing if name in usage),
+                              key=lambda item: (-item[1], required.index(item[0])))
+        self.missing_jamo = [(code, name) for code, name in JAMO_MAP.items() if name in missing]
+        self.broken_syllables = sum(1 for components in SYLLABLE_COMPONENTS
+                                    if not missing.isdisjoint(components))
+
+        known = set(required)
+        if self.layout_spec is not None:
+            known.update(self.layout_spec.extra_base_names(required))
+        self.svg_only = sorted(name for name in self.svg_names - self.png_names if name in known)
+        self.unknown = sorted(available - known)
+
+        self.elapsed = time.perf_counter() - start
+        return not missing
+
+    def _derivable(self, name, available):
+        derived = self.layout_spec.derive(name) if self.layout_spec is not None else None
+        return derived is not None and derived[0] in available
+
+    def _scan(self, directory, extension):
+        if not os.path.isdir(directory):
+            return set()
+
+        with os.scandir(directory) as entries:
+            return {entry.name[:-len(extension)] for entry in entries
+                    if entry.name.endswith(extension) and entry.is_file()}
@@ -0,0 +1,195 @@
+import os
+import sys
+import json
+import time
+import threading
+from concurrent.futures import Future
+
+try:
+    import resource  # 윈도우에는 없음 → 최대 메모리 기록 생략
+except ImportError:
+    resource = None
+
+
+TRACE_VERSION = 1
+
+
+# 작업 프로세스 / 스레드에서 실행 : 결과와 함께 실행 구간, 작업 CPU 시간 반환
+#   perf_counter 는 시스템 전체 단조 시계이므로 프로세스 간 비교 가능
+#   process_time 은 프로세스 전체 기준이므로 작업 프로세스(작업 하나씩 실행)에서만 의미 있음
+def timed_call(func, *args):
+    start = time.perf_counter()
+    cpu = time.process_time()
+    result = func(*args)
+    end = time.perf_counter()
+    return result, start, end, os.getpid(), threading.get_ident(), time.process_time() - cpu
+
+
+# 빌드 단계별 wall / CPU 시간, 최대 메모리, 파일별 작업 시간, 카운터 기록
+#   save() : Chrome trace event 형식 JSON (chrome://tracing, Perfetto 에서 열기 가능)
+#            + 비교용 요약 (stages, counters)
+class BuildTrace:
+    def __init__(self, enabled = True):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+
+        self.stages = []
+        self.events = []
+        self.counters = {}
+        self.worker_cpu = {}  # 작업 프로세스 pid → 작업 CPU 시간 합
+        self.lock = threading.Lock()
+
+        self.current = None
+
+    def stage(self, name):
+        if not self.enabled:
+            return
+
+        self._close_stage()
+        self.current = {
+            "name": name,
+            "start": time.perf_counter(),
+            "cpu": self._cpu_time(),
+        }
+
+    def finish(self):
+        if not self.enabled:
+            return
+        self._close_stage()
+
+    def count(self, name, value = 1):
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    # executor.submit 과 같지만 작업 구간을 이벤트로 기록, 반환 Future 의 결과는 func 결과 그대로
+    def submit(self, executor, category, name, func, *args):
+        if not self.enabled:
+            return executor.submit(func, *args)
+
+        outer = Future()
+        inner = executor.submit(timed_call, func, *args)
+
+        def done(future):
+            try:
+                result, start, end, pid, tid, cpu = future.result()
+            except Exception as e:
+                outer.set_exception(e)
+                return
+
+            if pid != self.pid:
+                with self.lock:
+                    self.worker_cpu[pid] = self.worker_cpu.get(pid, 0.0) + cpu
+            self._add_event(category, name, start, end, pid, tid, cpu)
+            outer.set_result(result)
+
+        inner.add_done_callback(done)
+        return outer
+
+    def summary(self):
+        return {
+            "stages": [
+                {key: stage[key] for key in ("name", "wall", "cpu", "peak_rss_kb")}
+                for stage in self.stages
+            ],
+            "total_wall": sum(stage["wall"] for stage in self.stages),
+            "total_cpu": sum(stage["cpu"] for stage in self.stages),
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def save(self, path):
+        events = [{
+            "name": "process_name", "ph": "M", "pid": self.pid,
+            "args": {"name": "ImgToFont"},
+        }]
+
+        for stage in self.stages:
+            events.append({
+                "name": stage["name"], "cat": "stage", "ph": "X",
+                "ts": stage["ts"], "dur": stage["dur"], "pid": self.pid, "tid": 0,
+                "args": {"cpu": stage["cpu"], "peak_rss_kb": stage["peak_rss_kb"]},
+            })
+
+        events.extend(self.events)
+
+        if self.stages:
+            last = self.stages[-1]
+            events.append({
+                "name": "counters", "ph": "C", "ts": last["ts"] + last["dur"],
+                "pid": self.pid, "args": dict(sorted(self.counters.items())),
+            })
+
+        trace = {"version": TRACE_VERSION, "traceEvents": events}
+        trace.update(self.summary())
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, indent=1, ensure_ascii=False)
+
+    def _close_stage(self):
+        if self.current is None:
+            return
+
+        end = time.perf_counter()
+        stage = self.current
+        self.stages.append({
+            "name": stage["name"],
+            "wall": round(end - stage["start"], 6),
+            "cpu": round(self._cpu_time() - stage["cpu"], 6),
+            "peak_rss_kb": self._peak_rss_kb(),
+            "ts": self._us(stage["start"]),
+            "dur": self._us(end) - self._us(stage["start"]),
+        })
+        self.current = None
+
+    def _add_event(self, category, name, start, end, pid, tid, cpu):
+        event = {
+            "name": name, "cat": category, "ph": "X",
+            "ts": self._us(start), "dur": self._us(end) - self._us(start),
+            "pid": pid, "tid": tid,
+        }
+        if pid != self.pid:
+            event["args"] = {"cpu": round(cpu, 6)}
+        with self.lock:
+            self.events.append(event)
+
+    def _us(self, t):
+        return int((t - self.origin) * 1_000_000)
+
+    # 자식 프로세스(potrace, 작업 프로세스) CPU 시간 포함
+    #   os.times 의 children 은 wait 가 끝난 자식만 세므로, 아직 살아 있는 작업 프로세스(batch / watch 의
+    #   공유 풀)는 작업마다 잰 CPU 시간을 더하고, 종료된 작업 프로세스는 children 에 이미 들어 있으므로 뺌
+    def _cpu_time(self):
+        t = os.times()
+        with self.lock:
+            workers = dict(self.worker_cpu)
+        running = sum(cpu for pid, cpu in workers.items() if self._alive(pid))
+        return t.user + t.system + t.children_user + t.children_system + running
+
+    # wait 가 끝나지 않은 자식 프로세스인지 (좀비 포함), 윈도우는 children 시간이 없으므로 항상 살아 있는 것으로 봄
+    def _alive(self, pid):
+        if os.name == "nt":  # 윈도우의 os.kill 은 프로세스를 종료함
+            return True
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    # 현재 프로세스와 자식 프로세스 중 최대값, 리눅스 기준 KB (macOS 는 byte 단위라 환산)
+    def _peak_rss_kb(self):
+        if resource is None:
+            return None
+
+        peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                   resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+        if sys.platform == "darwin":
+            peak //= 1024
+        return peak
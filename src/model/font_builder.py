@@ -1,20 +1,68 @@
 import os
+import copy
+import json
+import numpy as np
+from collections import Counter
+from contextlib import nullcontext
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
 from fontTools.fontBuilder import FontBuilder as TTFontBuilder
-from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphComponent
+import fontTools
+from fontTools.ttLib import TTFont, newTable
+from fontTools.ttLib.tables._g_l_y_f import Glyph
 from fontTools.pens.ttGlyphPen import TTGlyphPen
 
 from .png_to_svg import PngToSvg
-from .glyph_builder import GlyphBuilder
+from .glyph_builder import MAX_ERR, compile_component_glyph, count_points
+from .glyph_cache import CACHE_DIR, GlyphCache, hash_source
+from .glyf_writer import CompositeGlyfTable
+from .gsub_layout import build_ccmp_gsub
+from .outline_dedup import OutlineDeduplicator, reference_glyph, expand_reference, transformed_glyph
+from .layout_spec import LayoutSpec
+from .image_source import SHEET_COLUMNS
+from .build_trace import BuildTrace
+from .web_font import WebFontWriter
 from .syllable_layout import (
     LEADING_CONSONANTS, VOWELS, TRAILING_CONSONANTS, JAMO_MAP,
-    VOWEL_TYPE_VERTICAL_IDX, VOWEL_TYPE_HORIZONTAL_IDX, VOWEL_TYPE_MIXED_IDX
+    SYLLABLE_BASE, SYLLABLE_COUNT, SYLLABLE_TABLE, SYLLABLE_COMPONENTS,
+    leading_component_names, vowel_component_names, trailing_component_names, component_names
 )
 
 
+BUILD_INFO_SUFFIX = ".build.json"
+BUILD_INFO_VERSION = 1
+
+
+# 음절 테이블의 (초성, 중성, 종성, 레이아웃 타입) 인덱스 배열, 프로세스당 한 번만 생성
+@lru_cache(maxsize=None)
+def _syllable_indices():
+    indices = np.array(SYLLABLE_TABLE).T
+    indices.flags.writeable = False
+    return tuple(indices)
+
+
+# 부품 이름 → 참조하는 음절 수
+@lru_cache(maxsize=None)
+def _component_usage():
+    return Counter(name for components in SYLLABLE_COMPONENTS for name in components if name)
+
+
+def _percent(value, base):
+    return f"{(value - base) / base * 100:+.1f}%" if base else "-"
+
+
 class FontBuilder:
     def __init__(self, image_dir: str, svg_dir: str, font_path: str, potrace_path: str,
                  font_name: str = "Font", upm: int = 1000, fixed_width: int = 1000,
+                 jobs: int = None, svg_cache: bool = True, svg_pipe: bool = True,
+                 trace_backend: str = "potrace", direct: bool = False, write_svg: bool = False,
+                 threshold: int = None, denoise: int = 0, simplify: float = None,
+                 glyph_cache: bool = True, incremental: bool = False, mode: str = "composite", dedup: bool = False,
+                 layout_spec: str = None, sheet_columns: int = SHEET_COLUMNS,
+                 trace: BuildTrace = None,
+                 trace_executor=None, glyph_executor=None,
+                 web_formats: list = None, web_slice: int = 0, web_order: str = None,
                  step_call=None, subtask_call=None, progress_call=None):
 
         self.image_dir = image_dir
@@ -23,62 +71,148 @@ class FontBuilder:
         self.font_name = font_name
         self.upm = upm
         self.fixed_width = fixed_width
-        self.step_call = step_call if step_call else lambda msg: None
-        self.subtask_call = subtask_call if subtask_call else lambda  num, tot, msg : None
-        self.progress_call = progress_call if progress_call else lambda cur, tot : None
-
-        self.png_converter = PngToSvg(potrace_path, subtask_call=subtask_call, progress_call=self.progress_call)
-        self.glyph_builder = GlyphBuilder()
-
-        self.fb = TTFontBuilder(unitsPerEm=self.upm, isTTF=True)
-        self.font = self.fb.font
-
-        self.glyphs = {}
+        self.jobs = jobs if jobs else (os.cpu_count() or 1)
+        self.simplify = simplify  # 아웃라인 단순화 허용 오차 (None : 단순화 안 함)
+        self.glyph_cache = GlyphCache(os.path.join(svg_dir, CACHE_DIR), upm=upm, max_err=MAX_ERR,
+                                      simplify=simplify) if glyph_cache else None
+        self.direct = direct
+        self.incremental = incremental
+        self.mode = mode  # composite : 음절마다 합성 글리프 / gsub : ccmp 다중 치환으로 부품 조합
+        self.deduplicator = OutlineDeduplicator() if dedup else None  # 같은 윤곽선 부품은 대표 글리프 참조로 저장
+        self.layout_spec = LayoutSpec(layout_spec) if layout_spec else None  # 타입별 PNG 가 없는 부품은 기본 그림 변환
+        self.trace = trace if trace else BuildTrace(enabled=False)
+        self.glyph_executor = glyph_executor  # 여러 폰트를 함께 빌드할 때 공유하는 프로세스 풀
+        self.web_writer = None
+        if web_formats or web_slice:
+            self.web_writer = WebFontWriter(font_path, font_name, formats=web_formats, slice_size=web_slice,
+                                            order_path=web_order, subtask_call=subtask_call)
+            self.web_writer.check()
+        self.write_svg = write_svg
+        self.step_call = step_call if step_call else lambda num, tot, msg : None
+        self.subtask_call = subtask_call if subtask_call else lambda msg : None
+        self.progress_call = progress_call if progress_call else lambda cur, tot, msg=None : None
+
+        self.png_converter = PngToSvg(potrace_path, jobs=jobs, threshold=threshold, denoise=denoise,
+                                      use_cache=svg_cache, use_pipe=svg_pipe,
+                                      backend=trace_backend, trace=self.trace, executor=trace_executor,
+                                      sheet_columns=sheet_columns, subtask_call=subtask_call, progress_call=self.progress_call)
+
+        self._new_font()
+
+        self.glyphs = {}  # 단순 글리프
         self.metrics = {}
         self.cmap_data = {}
         self.glyph_order = [".notdef"]
 
+        # 음절(합성) 글리프는 Glyph 객체 대신 배열로 보관 → CompositeGlyfTable
+        self.composite_names = []
+        self.component_names = []
+        self.component_refs = np.empty((0, 3), dtype=np.int32)
+        self.composite_bounds = np.empty((0, 4), dtype=np.int16)
+        self.substitutions = {}  # gsub 모드 : 음절 글리프 → 부품 글리프 시퀀스
+        self.duplicates = {}  # --dedup : 글리프 이름 → (대표 글리프 이름, dx, dy)
+        self.derived = {}  # --layout-spec : 글리프 이름 → (기본 그림 글리프 이름, (xx, xy, yx, yy, dx, dy))
+
+        self.component_hashes = {}  # 부품 파일 이름 → 원본 해시 (증분 빌드 비교용)
+        self.simplify_stats = {}  # 부품 글리프 이름 → (단순화 전 점 수, 단순화 후 점 수)
+
         self.x_min, self.y_min = float("inf"), float("inf")
         self.x_max, self.y_max = -float("inf"), -float("inf")
 
     def build_all(self):
         try:
-            self.step_call(1,6,"PNG → SVG 변환")
-            self.png_converter.convert_all(self.image_dir, self.svg_dir)
-            self.subtask_call("PNG → SVG 변환 완료")
-
-            self.step_call(2,6,"필수 글리프 생성")
-            self._build_notdef_glyph()
-            self._build_null_glyph()
-            self._build_nonmarkingreturn_glyph()
-            self.subtask_call("필수 글리프 생성 완료")
-
-            self.step_call(3,6,"부품 글리프 빌드")
-            self._build_base_glyphs()
-            self.subtask_call("부품 글리프 빌드 완료")
-
-            self.step_call(4,6,"음절 글리프 빌드")
+            if self.direct:
+                self._step(1, "PNG → 아웃라인 변환")
+                self.png_converter.trace_all(self.image_dir, self.svg_dir if self.write_svg else None)
+                self.subtask_call("PNG → 아웃라인 변환 완료")
+            else:
+                self._step(1, "PNG → SVG 변환")
+                self.png_converter.convert_all(self.image_dir, self.svg_dir)
+                self.subtask_call("PNG → SVG 변환 완료")
+
+            changed = None
+            if self.incremental:
+                self._step(2, "이전 폰트 불러오기")
+                changed = self._load_previous_build()
+
+            if changed is None:
+                self._step(2, "필수 글리프 생성")
+                self._build_notdef_glyph()
+                self._build_null_glyph()
+                self._build_nonmarkingreturn_glyph()
+                self.subtask_call("필수 글리프 생성 완료")
+
+                self._step(3, "부품 글리프 빌드")
+                self._build_base_glyphs()
+                self.subtask_call("부품 글리프 빌드 완료")
+            else:
+                self._step(3, "변경된 부품 글리프 빌드")
+                self._build_base_glyphs(changed)
+                self.subtask_call(f"부품 {len(changed)}개 교체 / 영향받는 음절 {self._count_affected(changed)}개")
+
+            self._build_component_references()
+
+            self._step(4, "음절 글리프 빌드")
             self._build_syllable_glyphs()
             self.subtask_call("음절 글리프 빌드 완료")
 
-            self.step_call(5,6,"폰트 테이블 설정")
-            all_glyphs = list(self.glyphs.keys())
-            if ".notdef" in all_glyphs:
-                all_glyphs.remove(".notdef")
-
-            self.glyph_order = [".notdef"] + sorted(all_glyphs)
+            self._step(5, "폰트 테이블 설정")
+            self._setup_glyph_order()
             self.subtask_call(f"{len(self.glyph_order)}개 글리프 설정")
-            self.fb.setupGlyphOrder(self.glyph_order)
             self._fill_tables()
             self.subtask_call("폰트 테이블 설정 완료")
 
-            self.step_call(6,6,"폰트 파일 저장")
+            self._step(6, "폰트 파일 저장")
             self._save_font()
+            self._save_build_info()
+            if self.web_writer is not None:
+                self.web_writer.write_all()
             self.subtask_call("폰트 파일 저장 완료")
+            self.trace.finish()
 
         except Exception as e:
             raise Exception(f"Font Build : {e}")
 
+    # 감시 모드 : 바뀐 PNG 만 다시 변환하고 해당 부품 글리프만 교체한 뒤 다시 저장
+    #   png_files : 추가 / 수정 / 삭제된 PNG 파일 이름, build_all() 이후에 호출
+    def rebuild(self, png_files):
+        try:
+            if self.glyph_cache is not None:
+                self.glyph_cache.hits = self.glyph_cache.misses = 0
+
+            if self.direct:
+                self.png_converter.trace_files(self.image_dir, png_files, self.svg_dir if self.write_svg else None)
+            else:
+                self.png_converter.convert_files(self.image_dir, self.svg_dir, png_files)
+
+            changed = {os.path.splitext(file)[0] for file in png_files}
+            for file_name in changed:
+                self.component_hashes.pop(file_name, None)
+                self.glyphs.pop(self._glyph_name(file_name), None)
+
+            self._build_base_glyphs(changed)
+            self._build_component_references()
+            self._build_syllable_glyphs()
+
+            self._new_font()
+            self._setup_glyph_order()
+            self._fill_tables()
+            self._save_font()
+            self._save_build_info()
+            if self.web_writer is not None:
+                self.web_writer.write_all()
+
+        except Exception as e:
+            raise Exception(f"Font Rebuild : {e}")
+
+    def _new_font(self):
+        self.fb = TTFontBuilder(unitsPerEm=self.upm, isTTF=True)
+        self.font = self.fb.font
+
+    def _step(self, step_num, message):
+        self.trace.stage(message)
+        self.step_call(step_num, 6, message)
+
     def _build_notdef_glyph(self):
         pen = TTGlyphPen(None)
         width, height = 600, 800
@@ -109,7 +243,10 @@ class FontBuilder:
 
     def _add_glyph_to_font(self, glyph_name: str, pen: TTGlyphPen,
                            advance_width: int = None):
-        glyph = pen.glyph()
+        self._add_compiled_glyph(glyph_name, pen.glyph(), advance_width)
+
+    def _add_compiled_glyph(self, glyph_name: str, glyph: Glyph,
+                            advance_width: int = None):
         self.glyphs[glyph_name] = glyph
 
         width = advance_width if advance_width is not None else self.fixed_width
@@ -122,7 +259,21 @@ class FontBuilder:
             self.x_max = max(self.x_max, glyph.xMax)
             self.y_max = max(self.y_max, glyph.yMax)
 
-    def _load_svg_as_glyph(self, file_name: str, unicode_val: int = None):
+    # 부품 글리프 원본 : ("outline", 펜 명령) / ("svg", 경로) / None (없음)
+    def _component_source(self, file_name: str):
+        if self.direct:
+            outline = self.png_converter.outlines.get(file_name)
+            return ("outline", outline) if outline is not None else None
+
+        svg_path = os.path.join(self.svg_dir, file_name + ".svg")
+        return ("svg", svg_path) if os.path.exists(svg_path) else None
+
+    # 부품 파일 이름 → 글리프 이름 (자모는 uniXXXX)
+    def _glyph_name(self, file_name: str):
+        unicode_val = next((code for code, name in JAMO_MAP.items() if name == file_name), None)
+        return f"uni{unicode_val:04X}" if unicode_val else file_name
+
+    def _add_component_glyph(self, file_name: str, unicode_val: int, source, future):
         if unicode_val:
             glyph_name = f"uni{unicode_val:04X}"
         else:
@@ -131,170 +282,444 @@ class FontBuilder:
         if glyph_name in self.glyphs:
             return True
 
-        svg_path = os.path.join(self.svg_dir, file_name + ".svg")
-
-        if not os.path.exists(svg_path):
+        if source is None:
+            if self.layout_spec is None or self.layout_spec.derive(file_name) is None:
+                self.trace.count("missing_sources")
             if unicode_val:
                 self.subtask_call(f"{file_name}.svg 파일 X → .notdef")
                 self.cmap_data[unicode_val] = ".notdef"
+                self.trace.count("notdef_fallbacks")
             return False
 
         try:
-            pen = self.glyph_builder.build_svg_to_glyph(svg_path)
-            self._add_glyph_to_font(glyph_name, pen)
+            glyph = future.result()
+            self._add_compiled_glyph(glyph_name, glyph)
+            self.trace.count("components")
+
+            if self.simplify is not None:
+                self._record_simplify(glyph_name, glyph)
 
             if unicode_val:
                 self.cmap_data[unicode_val] = glyph_name
             return True
         except Exception as e:
+            self.trace.count("glyph_errors")
             if unicode_val:
                 self.cmap_data[unicode_val] = ".notdef"
+                self.trace.count("notdef_fallbacks")
             return False
 
-    def _build_base_glyphs(self):
-        total_jamo = len(JAMO_MAP)
-        total_l = len(LEADING_CONSONANTS) * 6
-        total_v = len(VOWELS) * 2
-        total_t = (len(TRAILING_CONSONANTS) - 1) * 3
-
-        self.subtask_call(f"자모 빌드 (U+3131~U+3163)")
-        jamo_count = 0
-
-        for unicode_val, glyph_name in JAMO_MAP.items():
-            if self._load_svg_as_glyph(glyph_name, unicode_val):
-                jamo_count += 1
-                self.progress_call(jamo_count, total_jamo)
-
-        self.subtask_call(f"부품 빌드")
-
-        l_count = 0
-        for l_idx in range(len(LEADING_CONSONANTS)):
-            for layout_type in range(1, 7):
-                glyph_name = f"L_{l_idx}_type{layout_type}"
-                if self._load_svg_as_glyph(glyph_name):
-                    l_count += 1
-                    self.progress_call(l_count, total_l, "[초성]")
-
-        v_count = 0
-        for v_idx in range(len(VOWELS)):
-            types_to_build = []
-            if v_idx in VOWEL_TYPE_VERTICAL_IDX:
-                types_to_build = [1, 4]
-            elif v_idx in VOWEL_TYPE_HORIZONTAL_IDX:
-                types_to_build = [2, 5]
-            elif v_idx in VOWEL_TYPE_MIXED_IDX:
-                types_to_build = [3, 6]
-
-            for layout_type in types_to_build:
-                glyph_name = f"V_{v_idx}_type{layout_type}"
-                if self._load_svg_as_glyph(glyph_name):
-                    v_count += 1
-                    self.progress_call(v_count, total_v, "[중성]")
-
-        t_count = 0
-        for t_idx in range(1, len(TRAILING_CONSONANTS)):
-            for layout_type in range(4, 7):
-                glyph_name = f"T_{t_idx}_type{layout_type}"
-                if self._load_svg_as_glyph(glyph_name):
-                    t_count += 1
-                    self.progress_call(t_count, total_t, "[종성]")
+    # 부품 글리프는 작업자에서 병렬 컴파일, 결과는 직렬 빌드와 같은 순서로 병합
+    # only : 지정하면 해당 부품만 빌드 (증분 빌드)
+    def _build_base_glyphs(self, only=None):
+        groups = [
+            (None, [(glyph_name, unicode_val) for unicode_val, glyph_name in JAMO_MAP.items()]),
+            ("[초성]", [(name, None) for name in leading_component_names()]),
+            ("[중성]", [(name, None) for name in vowel_component_names()]),
+            ("[종성]", [(name, None) for name in trailing_component_names()]),
+        ]
+        if self.layout_spec is not None:
+            groups.append(("[기본 그림]", [(name, None) for name in self._extra_base_names()]))
+        if only is not None:
+            groups = [(label, [task for task in tasks if task[0] in only]) for label, tasks in groups]
+
+        with self._component_executor() as executor:
+            jobs = []
+            for _, tasks in groups:
+                for file_name, unicode_val in tasks:
+                    source = self._component_source(file_name)
+                    future = self._submit_component(executor, file_name, source)
+                    jobs.append((file_name, unicode_val, source, future))
+
+            jobs = iter(jobs)
+            self.subtask_call(f"자모 빌드 (U+3131~U+3163)")
+
+            for label, tasks in groups:
+                if label == "[초성]":
+                    self.subtask_call(f"부품 빌드")
+
+                count = 0
+                for _ in tasks:
+                    if self._add_component_glyph(*next(jobs)):
+                        count += 1
+                        self.progress_call(count, len(tasks), label)
+
+        if self.glyph_cache is not None:
+            removed = self.glyph_cache.evict()
+            self.subtask_call(f"글리프 캐시 적중 {self.glyph_cache.hits}개 / "
+                              f"미스 {self.glyph_cache.misses}개 / 삭제 {removed}개")
+
+        if self.simplify is not None:
+            self._report_simplify()
+
+    def _record_simplify(self, glyph_name, glyph):
+        before = getattr(glyph, "source_points", None)
+        after = count_points(glyph)
+        self.simplify_stats[glyph_name] = (before, after)
+
+        if before is not None:
+            self.trace.count("simplify_points_before", before)
+            self.trace.count("simplify_points_after", after)
+
+    # 단순화 보고 : 부품별 / 폰트 전체 점 수 (단순화 전 점 수는 글리프 캐시에도 함께 저장됨)
+    #   음절 참조 점 수 = 모든 음절이 참조하는 부품 점 수 합 (렌더링할 때 처리하는 점 수)
+    def _report_simplify(self):
+        measured = {name: stats for name, stats in self.simplify_stats.items() if stats[0] is not None}
+        if measured:
+            before = sum(b for b, _ in measured.values())
+            after = sum(a for _, a in measured.values())
+            self.subtask_call(f"단순화 (허용 오차 {self.simplify:g}) : 부품 {len(measured)}개 "
+                              f"점 {before:,}개 → {after:,}개 ({_percent(after, before)})")
+
+            largest = sorted(measured.items(), key=lambda item: item[1][1] - item[1][0])[:5]
+            self.subtask_call("많이 줄어든 부품 : " + ", ".join(f"{name} {b}→{a}" for name, (b, a) in largest))
+
+        points = {name: count_points(glyph) for name, glyph in self.glyphs.items()}
+        usage = _component_usage()
+        total_after = sum(points.values())
+        referenced_after = sum(points.get(name, 0) * count for name, count in usage.items())
+        message = f"폰트 전체 : 부품 점 {total_after:,}개 / 음절 참조 점 {referenced_after:,}개"
+
+        # 증분 빌드에서 이전 폰트에서 가져온 부품은 단순화 전 점 수를 모르므로 모든 부품을 이번 빌드에서 만들었을 때만 계산
+        components = {self._glyph_name(name) for name in component_names()} & points.keys()
+        if components <= measured.keys():
+            source = dict(points, **{name: b for name, (b, _) in measured.items()})
+            referenced_before = sum(source.get(name, 0) * count for name, count in usage.items())
+            message += f" (단순화 전 {sum(source.values()):,}개 / {referenced_before:,}개)"
+        self.subtask_call(message)
+
+    # 캐시에 있는 부품은 컴파일하지 않고 완료된 Future 로 반환
+    def _submit_component(self, executor, file_name, source):
+        if source is None:
+            return None
+
+        digest = self._source_hash(file_name, source)
+        if self.glyph_cache is None:
+            return self._compile_component(executor, file_name, source)
+
+        key = self.glyph_cache.key(digest)
+        glyph = self.glyph_cache.get(key)
+        if glyph is not None:
+            self.trace.count("glyph_cache_hits")
+            future = Future()
+            future.set_result(glyph)
+            return future
+
+        future = self._compile_component(executor, file_name, source)
+        future.add_done_callback(lambda done: self._store_component(key, done))
+        return future
+
+    def _compile_component(self, executor, file_name, source):
+        self.trace.count("glyphs_compiled")
+        return self.trace.submit(executor, "glyph", file_name, compile_component_glyph, *source, self.upm, self.simplify)
+
+    def _store_component(self, key, future):
+        if future.exception() is not None:
+            return
+
+        try:  # 저장 시 bounds 가 계산되므로 복사본 사용
+            self.glyph_cache.put(key, copy.copy(future.result()))
+        except OSError:
+            pass
 
+    def _source_hash(self, file_name, source):
+        if file_name not in self.component_hashes:
+            self.component_hashes[file_name] = hash_source(*source)
+        return self.component_hashes[file_name]
+
+    def _component_executor(self):
+        if self.glyph_executor is not None:
+            return nullcontext(self.glyph_executor)
+        if self.jobs > 1:
+            return ProcessPoolExecutor(max_workers=self.jobs)
+        return ThreadPoolExecutor(max_workers=1)
+
+    # 증분 빌드 : 이전 폰트의 단순 글리프를 그대로 가져오고, 원본이 바뀐 부품 이름 집합 반환
+    #   이전 빌드 정보가 없거나 설정 / 부품 구성이 달라졌으면 None (전체 빌드)
+    def _load_previous_build(self):
+        info = self._load_build_info()
+        if info is None or not os.path.exists(self.font_path):
+            self.subtask_call("이전 빌드 정보 없음 → 전체 빌드")
+            return None
+
+        for file_name in component_names() + self._extra_base_names():
+            source = self._component_source(file_name)
+            if source is not None:
+                self._source_hash(file_name, source)
+
+        if set(self.component_hashes) != set(info["sources"]):
+            self.subtask_call("부품 추가 / 삭제 → 전체 빌드")
+            return None
+
+        syllable_names = {f"uni{SYLLABLE_BASE + i:04X}" for i in range(SYLLABLE_COUNT)}
+        try:
+            font = TTFont(self.font_path)
+            glyf = font["glyf"]
+            hmtx = font["hmtx"]
+
+            for glyph_name in font.getGlyphOrder():
+                glyph = glyf.glyphs[glyph_name]
+                if getattr(glyph, "data", b"")[:2] == b"\xff\xff":  # numberOfContours = -1 : 합성 글리프
+                    if glyph_name in syllable_names:
+                        continue
+                    glyph = expand_reference(glyf, glyph_name)  # --dedup 으로 참조가 된 부품
+                glyph.expand(glyf)
+                self.glyphs[glyph_name] = glyph
+                self.metrics[glyph_name] = hmtx[glyph_name]
+
+            for unicode_val in JAMO_MAP:
+                glyph_name = f"uni{unicode_val:04X}"
+                self.cmap_data[unicode_val] = glyph_name if glyph_name in self.glyphs else ".notdef"
+        except Exception as e:
+            self.subtask_call(f"이전 폰트 읽기 실패 ({e}) → 전체 빌드")
+            self.glyphs, self.metrics, self.cmap_data = {}, {}, {}
+            return None
+
+        changed = {name for name, digest in self.component_hashes.items() if info["sources"][name] != digest}
+        for file_name in changed:
+            self.glyphs.pop(self._glyph_name(file_name), None)
+
+        return changed
+
+    def _count_affected(self, changed):
+        if self.layout_spec is not None:  # 기본 그림이 바뀌면 그 그림을 참조하는 부품도 바뀜
+            changed = set(changed)
+            for name in component_names():
+                derived = self.layout_spec.derive(name)
+                if derived and derived[0] in changed and self._component_source(name) is None:
+                    changed.add(name)
+        return sum(1 for components in SYLLABLE_COMPONENTS if not changed.isdisjoint(components))
+
+    def _build_info_path(self):
+        return os.path.splitext(self.font_path)[0] + BUILD_INFO_SUFFIX
+
+    # 결과 폰트에 영향을 주는 설정, 달라지면 증분 빌드 불가
+    def _build_settings(self):
+        return {
+            "font_name": self.font_name,
+            "upm": self.upm,
+            "fixed_width": self.fixed_width,
+            "max_err": MAX_ERR,
+            "simplify": self.simplify,
+            "mode": self.mode,
+            "dedup": self.deduplicator is not None,
+            "layout_spec": self.layout_spec.digest if self.layout_spec is not None else None,
+            "fonttools": fontTools.version,
+        }
+
+    def _load_build_info(self):
+        try:
+            with open(self._build_info_path(), "r", encoding="utf-8") as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if info.get("version") != BUILD_INFO_VERSION or info.get("settings") != self._build_settings():
+            return None
+        return info
+
+    def _save_build_info(self):
+        info_path = self._build_info_path()
+        temp_path = info_path + ".tmp"
+        info = {
+            "version": BUILD_INFO_VERSION,
+            "settings": self._build_settings(),
+            "sources": dict(sorted(self.component_hashes.items())),
+        }
+
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(info, f, indent=1)
+        os.replace(temp_path, info_path)
+
+    # 부품 bounds 는 한 번만 계산하고, 음절 bbox 는 (초성, 중성, 종성) 인덱스 배열로 일괄 계산
     def _build_syllable_glyphs(self):
-        BASE_CODE = 0xAC00
-        TOTAL = 11172
-
-        success_count = 0
-
-        for i in range(TOTAL):
-            char_code = BASE_CODE + i
-
-            t_idx = i % 28
-            v_idx = (i // 28) % 21
-            l_idx = (i // 28) // 21
-
-            layout_type = self._get_layout_type(v_idx, t_idx)
-
-            l_name = f"L_{l_idx}_type{layout_type}"
-            v_name = f"V_{v_idx}_type{layout_type}"
-            t_name = f"T_{t_idx}_type{layout_type}" if t_idx > 0 else None
-
-            if self._add_composite_glyph(char_code, l_name, v_name, t_name):
-                success_count += 1
-
-            if i % 50 == 0 or i == TOTAL - 1:
+        # 다시 빌드할 때 (감시 모드, gsub 모드의 증분 빌드) 이전 음절 글리프 정리
+        for i in range(SYLLABLE_COUNT):
+            glyph_name = f"uni{SYLLABLE_BASE + i:04X}"
+            self.glyphs.pop(glyph_name, None)
+            self.metrics.pop(glyph_name, None)
+        self.substitutions = {}
+
+        for glyph in self.glyphs.values():
+            glyph.recalcBounds(None)
+
+        if self.trace.enabled:
+            self.trace.count("points", sum(len(g.coordinates) for g in self.glyphs.values() if g.numberOfContours > 0))
+
+        l_idx, v_idx, t_idx, layout_type = _syllable_indices()
+
+        self.component_names = []
+        l_bounds, l_refs = self._component_bounds("L", len(LEADING_CONSONANTS))
+        v_bounds, v_refs = self._component_bounds("V", len(VOWELS))
+        t_bounds, t_refs = self._component_bounds("T", len(TRAILING_CONSONANTS))
+
+        refs = np.stack([
+            l_refs[l_idx, layout_type],
+            v_refs[v_idx, layout_type],
+            t_refs[t_idx, layout_type],
+        ], axis=1)
+        found = (refs[:, 0] >= 0) & (refs[:, 1] >= 0) & ((refs[:, 2] >= 0) | (t_idx == 0))
+
+        parts = np.stack([
+            l_bounds[l_idx, layout_type],
+            v_bounds[v_idx, layout_type],
+            t_bounds[t_idx, layout_type],
+        ])
+        bounds = np.concatenate([parts[..., :2].min(axis=0), parts[..., 2:].max(axis=0)], axis=1)
+        bounds[~np.isfinite(bounds[:, 0])] = 0  # 모든 부품이 빈 글리프
+
+        syllable_names = []
+
+        for i, is_found in enumerate(found.tolist()):
+            char_code = SYLLABLE_BASE + i
+
+            if is_found:
+                glyph_name = f"uni{char_code:04X}"
+                syllable_names.append(glyph_name)
+                self.metrics[glyph_name] = (self.fixed_width, 0)
+                self.cmap_data[char_code] = glyph_name
+            else:
+                self.cmap_data[char_code] = ".notdef"
+
+            if i % 50 == 0 or i == SYLLABLE_COUNT - 1:
                 current_char = chr(char_code)
-                self.progress_call(i+1, TOTAL, f"음절({current_char})")
-
-        self.subtask_call(f"{success_count}/{TOTAL}개 음절 생성")
+                self.progress_call(i+1, SYLLABLE_COUNT, f"음절({current_char})")
 
-    def _get_layout_type(self, v_idx, t_idx) -> int:
-        if t_idx == 0:
-            if v_idx in VOWEL_TYPE_HORIZONTAL_IDX:
-                return 2
-            if v_idx in VOWEL_TYPE_MIXED_IDX:
-                return 3
-            return 1
+        if self.mode == "gsub":
+            self._build_syllable_substitutions(syllable_names, refs[found])
         else:
-            if v_idx in VOWEL_TYPE_HORIZONTAL_IDX:
-                return 5
-            if v_idx in VOWEL_TYPE_MIXED_IDX:
-                return 6
-            return 4
-
-    def _create_component(self, glyph_name, x, y, flags):
-        comp = GlyphComponent()
-        comp.glyphName = glyph_name
-        comp.x = x
-        comp.y = y
-        comp.flags = flags
-        return comp
-
-    def _add_composite_glyph(self, char_code, l_name, v_name, t_name) -> bool:
-        glyph_name = f"uni{char_code:04X}"
-
-        if l_name not in self.glyphs or v_name not in self.glyphs:
-            self.cmap_data[char_code] = ".notdef"
-            return False
-
-        if t_name and t_name not in self.glyphs:
-            self.cmap_data[char_code] = ".notdef"
-            return False
-
-        glyph = Glyph()
-        glyph.numberOfContours = -1
-        glyph.components = []
-
-        flags = 0x0004  #  0x0002
-
-        glyph.components.append(
-            self._create_component(l_name, 0, 0, flags)
-        )
-
-        glyph.components.append(
-            self._create_component(v_name, 0, 0, flags)
-        )
-
-        if t_name:
-            glyph.components.append(
-                self._create_component(t_name, 0, 0, flags)
-            )
-
-        try:
-            glyph.recalcBounds(self.glyphs)
-        except Exception:
-            pass
-
-        self.glyphs[glyph_name] = glyph
-        self.metrics[glyph_name] = (self.fixed_width, 0)
-        self.cmap_data[char_code] = glyph_name
-
-        return True
-
+            self.composite_names = syllable_names
+            self.component_refs = refs[found]
+            self.composite_bounds = bounds[found].astype(np.int16)
+
+        self.trace.count("syllables", len(syllable_names))
+        self.trace.count("notdef_fallbacks", SYLLABLE_COUNT - len(syllable_names))
+        self.subtask_call(f"{len(syllable_names)}/{SYLLABLE_COUNT}개 음절 생성")
+
+    # gsub 모드 : 음절은 빈 글리프로 cmap 에만 두고, ccmp 에서 (초성, 중성, 종성) 부품으로 분해
+    #   부품은 모두 원점에 그려지므로 마지막 부품만 너비를 가짐
+    #   (초성 : 0, 중성 : 종성 없는 타입 1~3 만 fixed_width, 종성 : fixed_width)
+    #   부품마다 따로 배치되므로 lsb 는 xMin 과 같게 설정 (래스터라이저가 lsb 기준으로 옮기지 않도록)
+    def _build_syllable_substitutions(self, syllable_names, refs):
+        self.composite_names = []
+        self.component_refs = np.empty((0, 3), dtype=np.int32)
+        self.composite_bounds = np.empty((0, 4), dtype=np.int16)
+
+        for glyph_name, row in zip(syllable_names, refs.tolist()):
+            self.glyphs[glyph_name] = Glyph()
+            self.substitutions[glyph_name] = [self.component_names[ref] for ref in row if ref >= 0]
+
+        for glyph_name in self.component_names:
+            last = glyph_name.startswith("T_") or (glyph_name.startswith("V_") and glyph_name[-1] in "123")
+            self.metrics[glyph_name] = (self.fixed_width if last else 0, self.glyphs[glyph_name].xMin)
+
+    # 부품 bounds 배열 [인덱스, 레이아웃 타입] → (xMin, yMin, xMax, yMax)
+    #   빈 글리프는 (inf, inf, -inf, -inf) 로 두어 음절 bbox 에 반영되지 않도록 함
+    # 부품 참조 배열 [인덱스, 레이아웃 타입] → self.component_names 인덱스 (-1 : 없음)
+    def _component_bounds(self, prefix, count):
+        bounds = np.empty((count, 7, 4))
+        bounds[...] = (np.inf, np.inf, -np.inf, -np.inf)
+        refs = np.full((count, 7), -1, dtype=np.int32)
+
+        for idx in range(count):
+            for layout_type in range(1, 7):
+                glyph_name = f"{prefix}_{idx}_type{layout_type}"
+                glyph = self.glyphs.get(glyph_name)
+                if glyph is None:
+                    continue
+
+                refs[idx, layout_type] = len(self.component_names)
+                self.component_names.append(glyph_name)
+
+                if glyph.xMin == glyph.xMax and glyph.yMin == glyph.yMax:
+                    continue
+                bounds[idx, layout_type] = (glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax)
+
+        return bounds, refs
+
+    # 부품 글리프 빌드 후 : 레이아웃 명세로 빠진 부품 만들기 → 중복 부품 찾기
+    def _build_component_references(self):
+        if self.layout_spec is not None:
+            self._derive_components()
+        if self.deduplicator is not None:
+            self._find_duplicates()
+
+    # 레이아웃 명세의 종성 기본 그림 파일 이름 (초성 / 중성은 자모 그림 사용)
+    def _extra_base_names(self):
+        return self.layout_spec.extra_base_names(component_names()) if self.layout_spec is not None else []
+
+    # 타입별 원본(PNG / SVG)이 없는 부품 → 기본 그림을 명세의 변환으로 옮긴 글리프
+    #   메모리에는 변환한 윤곽선(bounds, 중복 비교용)을 두고, 저장할 때 기본 그림 참조로 바꿈
+    def _derive_components(self):
+        previous, self.derived = self.derived, {}
+
+        missing_bases = set()
+        for file_name in leading_component_names() + vowel_component_names() + trailing_component_names():
+            derived = self.layout_spec.derive(file_name)
+            if derived is None or self._component_source(file_name) is not None:
+                continue
+
+            base_name = self._glyph_name(derived[0])
+            base = self.glyphs.get(base_name)
+            if base is None:
+                missing_bases.add(derived[0])
+                if file_name in previous:  # 감시 모드에서 기본 그림이 삭제됨
+                    self.glyphs.pop(file_name, None)
+                    self.metrics.pop(file_name, None)
+                continue
+
+            self._add_compiled_glyph(file_name, transformed_glyph(base, derived[1]))
+            self.derived[file_name] = (base_name, derived[1])
+
+        self.trace.count("derived_components", len(self.derived))
+        self.subtask_call(f"레이아웃 명세 : 부품 {len(self.derived)}개를 기본 그림 참조로 생성")
+        if missing_bases:
+            self.subtask_call(f"기본 그림 없음 {len(missing_bases)}개 : {', '.join(sorted(missing_bases)[:10])}")
+
+    # 부품 윤곽선 해시로 같은 / 위치만 다른 부품 찾기 (글리프는 그대로 두고 저장할 때만 참조로 바꿈)
+    #   레이아웃 명세로 만든 부품과 그 기본 그림은 제외 (참조 깊이를 2 로 유지)
+    def _find_duplicates(self):
+        bases = {base for base, _ in self.derived.values()}
+        order = [self._glyph_name(name) for name in component_names()]
+        order = [name for name in order if name not in self.derived and name not in bases]
+        self.duplicates = self.deduplicator.find(self.glyphs, order)
+
+        self.trace.count("duplicate_components", len(self.duplicates))
+        self.subtask_call(f"윤곽선 해시 {self.deduplicator.hashes}개 / 중복 그룹 {self.deduplicator.groups}개 / "
+                          f"참조로 대체 {len(self.duplicates)}개 (점 {self.deduplicator.saved_points:,}개 절약)")
+        for name, (canonical, dx, dy) in list(self.duplicates.items())[:5]:
+            self.subtask_call(f"{name} → {canonical} ({dx:+d}, {dy:+d})")
+
+    # glyf 테이블에 넣을 단순 글리프 : 중복 부품 / 명세로 만든 부품은 다른 글리프를 참조하는 합성 글리프로
+    def _table_glyphs(self):
+        if not self.duplicates and not self.derived:
+            return self.glyphs
+
+        glyphs = dict(self.glyphs)
+        for name, (canonical, dx, dy) in self.duplicates.items():
+            glyphs[name] = reference_glyph(self.glyphs[name], canonical, dx, dy)
+        for name, (base, (xx, xy, yx, yy, dx, dy)) in self.derived.items():
+            glyphs[name] = reference_glyph(self.glyphs[name], base, dx, dy, (xx, xy, yx, yy))
+        return glyphs
+
+    def _setup_glyph_order(self):
+        all_glyphs = list(self.glyphs.keys()) + self.composite_names
+        if ".notdef" in all_glyphs:
+            all_glyphs.remove(".notdef")
+
+        self.glyph_order = [".notdef"] + sorted(all_glyphs)
+        self.fb.setupGlyphOrder(self.glyph_order)
 
     def _fill_tables(self):
-        self.fb.setupGlyf(self.glyphs)
+        # 음절 빌드 단계에서 bounds 계산 완료
+        self.font["loca"] = newTable("loca")
+        self.font["glyf"] = CompositeGlyfTable(self._table_glyphs(), self.composite_names, self.component_names,
+                                               self.component_refs, self.composite_bounds)
+        self.font["glyf"].glyphOrder = self.glyph_order
         self.fb.setupHorizontalMetrics(self.metrics)
         self.fb.setupCharacterMap(self.cmap_data)
+        if self.substitutions:
+            self.font["GSUB"] = build_ccmp_gsub(self.substitutions, self.glyph_order)
 
         xMin = int(self.x_min) if self.x_min != float("inf") else 0
         yMin = int(self.y_min) if self.y_min != float("inf") else 0
@@ -358,7 +783,8 @@ class FontBuilder:
             achVendID="HYEJ",
             fsSelection=(1 << 6) | (1 << 7),
             usFirstCharIndex=min(self.cmap_data.keys()) if self.cmap_data else 0,
-            usLastCharIndex=max(self.cmap_data.keys()) if self.cmap_data else 0
+            usLastCharIndex=max(self.cmap_data.keys()) if self.cmap_data else 0,
+            usMaxContext=1 if self.substitutions else 0  # ccmp 다중 치환 : 입력 글리프 1개
         )
 
         # post 테이블
@@ -368,6 +794,10 @@ class FontBuilder:
             underlineThickness=50
         )
 
+        # 저장 시 fontTools 가 모든 글리프를 다시 풀어 bounds 를 계산하지 않도록 직접 계산
+        self.font["glyf"].recalc_tables(self.font)
+        self.font.recalcBBoxes = False
+
     def _save_font(self):
         os.makedirs(os.path.dirname(self.font_path), exist_ok=True)
         self.fb.save(self.font_path)
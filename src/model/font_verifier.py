@@ -0,0 +1,219 @@
+import time
+import struct
+import hashlib
+import numpy as np
+from fontTools.ttLib import TTFont
+from fontTools.misc.arrayTools import calcIntBounds
+
+from .gsub_layout import read_ccmp_substitutions
+from .syllable_layout import JAMO_MAP, SYLLABLE_BASE, SYLLABLE_COUNT
+
+
+# 합성 글리프 부품 레코드 플래그 (OpenType glyf)
+ARG_1_AND_2_ARE_WORDS = 0x0001
+WE_HAVE_A_SCALE = 0x0008
+MORE_COMPONENTS = 0x0020
+WE_HAVE_AN_X_AND_Y_SCALE = 0x0040
+WE_HAVE_A_TWO_BY_TWO = 0x0080
+
+
+# 빌드된 폰트 검증 : 테이블을 필요할 때만 읽는 TTFont(lazy=True) 로 열어 몇 초 안에 끝냄 (CI 용)
+#   1) 음절 11,172자 + 자모 40자가 .notdef 가 아닌, 그릴 것이 있는 글리프에 연결되는지
+#      (빌드는 빠진 음절을 .notdef 로 두므로 cmap 에 없는 글자도 .notdef 로 셈)
+#      (gsub 모드 음절은 빈 글리프 + ccmp 치환이 있으면 통과)
+#   2) 합성 글리프가 참조하는 부품이 있는지, 순환 / maxp 보다 깊은 참조가 없는지
+#   3) 글리프 / head 의 bounds 가 실제 윤곽선과 같은지
+#   compare_path : 이전 빌드와 글리프별 바이너리 해시(glyf + hmtx + ccmp 치환)를 비교해 바뀐 글리프 목록
+class FontVerifier:
+    def __init__(self, font_path, compare_path = None):
+        self.font_path = font_path
+        self.compare_path = compare_path
+
+        self.glyph_count = 0
+        self.checked = 0  # 검사한 코드 포인트 수
+        self.notdef = []  # cmap 에 없거나 .notdef 로 연결된 코드 포인트
+        self.empty = []  # (코드 포인트, 글리프 이름) : 윤곽선도 ccmp 치환도 없는 글리프
+        self.bad_references = []  # (글리프 이름, 문제)
+        self.bad_bounds = []  # (글리프 이름, 기록된 bounds, 실제 bounds)
+
+        self.changed = []  # compare : 바뀐 글리프
+        self.added = []
+        self.removed = []
+        self.cmap_changes = 0  # compare : 연결된 글리프가 바뀐 코드 포인트 수
+        self.elapsed = 0.0
+
+    def verify(self):
+        start = time.perf_counter()
+
+        try:
+            font = TTFont(self.font_path, lazy=True)
+            order = font.getGlyphOrder()
+            self.glyph_count = len(order)
+            substitutions = read_ccmp_substitutions(font)
+
+            self._check_coverage(font, substitutions)
+            self._check_glyphs(font, order)
+
+            if self.compare_path is not None:
+                self._compare(font, substitutions)
+        except Exception as e:
+            raise Exception(f"Verify : {e}")
+
+        self.elapsed = time.perf_counter() - start
+        return self.ok()
+
+    def ok(self):
+        return not (self.notdef or self.empty or self.bad_references or self.bad_bounds)
+
+    def _check_coverage(self, font, substitutions):
+        cmap = font.getBestCmap() or {}
+        offsets = font["loca"]
+        index = font.getReverseGlyphMap()
+
+        codes = list(range(SYLLABLE_BASE, SYLLABLE_BASE + SYLLABLE_COUNT)) + list(JAMO_MAP)
+        self.checked = len(codes)
+
+        for code in codes:
+            name = cmap.get(code, ".notdef")
+            if name == ".notdef":
+                self.notdef.append(code)
+            else:
+                gid = index[name]
+                if offsets[gid + 1] == offsets[gid] and name not in substitutions:
+                    self.empty.append((code, name))
+
+    # 부품 → 합성 글리프 순으로 bounds 를 한 번씩만 계산 (위치만 옮긴 부품은 부품 bounds 를 평행 이동)
+    def _check_glyphs(self, font, order):
+        glyf = font["glyf"]
+        max_depth = font["maxp"].maxComponentDepth
+        bounds = {}  # 글리프 이름 → 실제 bounds (빈 글리프 None)
+        depths = {}
+
+        def measure(name, visiting):
+            if name in bounds:
+                return bounds[name], depths[name]
+            if name in visiting:
+                raise ValueError(f"순환 참조 : {' → '.join(visiting + [name])}")
+
+            glyph = glyf[name]
+            if glyph.numberOfContours == 0:
+                actual, depth = None, 0
+            elif not glyph.isComposite():
+                coords = np.asarray(glyph.coordinates.array).reshape(-1, 2)
+                actual, depth = (*coords.min(axis=0).tolist(), *coords.max(axis=0).tolist()), 0
+            else:
+                actual, depth = self._composite_bounds(glyf, glyph, visiting + [name], measure)
+
+            bounds[name], depths[name] = actual, depth
+            return actual, depth
+
+        for name in order:
+            try:
+                actual, depth = measure(name, [])
+            except (ValueError, KeyError, IndexError, struct.error) as e:
+                self.bad_references.append((name, f"{e}"))
+                continue
+
+            if depth > max_depth:
+                self.bad_references.append((name, f"참조 깊이 {depth} > maxp {max_depth}"))
+
+            glyph = glyf[name]
+            if actual is not None:
+                stored = (glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax)
+                if stored != actual:
+                    self.bad_bounds.append((name, stored, actual))
+
+        drawn = [box for box in bounds.values() if box is not None]
+        if drawn:
+            head = font["head"]
+            stored = (head.xMin, head.yMin, head.xMax, head.yMax)
+            actual = (min(b[0] for b in drawn), min(b[1] for b in drawn),
+                      max(b[2] for b in drawn), max(b[3] for b in drawn))
+            if stored != actual:
+                self.bad_bounds.append(("head", stored, actual))
+
+    def _composite_bounds(self, glyf, glyph, path, measure):
+        boxes, depth = [], 0
+        transformed = False
+
+        for comp in glyph.components:
+            if comp.glyphName not in glyf:
+                raise ValueError(f"없는 부품 참조 : {comp.glyphName}")
+            if comp.glyphName == ".notdef":
+                raise ValueError(".notdef 참조")
+
+            box, child_depth = measure(comp.glyphName, path)
+            depth = max(depth, child_depth + 1)
+            if hasattr(comp, "transform") or hasattr(comp, "firstPt"):  # fontTools 는 ARGS_ARE_XY_VALUES 를 지움
+                transformed = True
+            elif box is not None:
+                boxes.append((box[0] + comp.x, box[1] + comp.y, box[2] + comp.x, box[3] + comp.y))
+
+        if transformed:  # 변환 행렬 / 점 맞춤 부품 : 좌표를 풀어서 계산
+            coords, _, _ = glyph.getCoordinates(glyf)
+            return (calcIntBounds(coords) if len(coords) else None), depth
+
+        if not boxes:
+            return None, depth
+        return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes)), depth
+
+    def _compare(self, font, substitutions):
+        other = TTFont(self.compare_path, lazy=True)
+        other_substitutions = read_ccmp_substitutions(other)
+
+        digests = self._digests(font, substitutions, other.getGlyphOrder())
+        other_digests = self._digests(other, other_substitutions, font.getGlyphOrder())
+
+        self.changed = [name for name in digests if name in other_digests and digests[name] != other_digests[name]]
+        self.added = [name for name in digests if name not in other_digests]
+        self.removed = [name for name in other_digests if name not in digests]
+
+        cmap = font.getBestCmap() or {}
+        other_cmap = other.getBestCmap() or {}
+        self.cmap_changes = sum(1 for code in cmap.keys() | other_cmap.keys() if cmap.get(code) != other_cmap.get(code))
+
+    # 글리프 이름 → glyf 바이트 + (advance, lsb) + ccmp 치환 해시, glyf 는 loca 로 잘라 파싱하지 않음
+    #   두 폰트의 글리프 순서가 다르면 합성 글리프의 부품 ID 를 이름으로 바꿔 비교
+    def _digests(self, font, substitutions, other_order):
+        order = font.getGlyphOrder()
+        offsets = font["loca"]
+        data = font.reader["glyf"]
+        metrics = font["hmtx"].metrics
+        resolve = order != other_order
+
+        digests = {}
+        for gid, name in enumerate(order):
+            glyph_data = data[offsets[gid]:offsets[gid + 1]]
+            if resolve and glyph_data[:2] == b"\xff\xff":
+                glyph_data = self._resolve_components(glyph_data, order)
+
+            digest = hashlib.sha1(glyph_data)
+            digest.update(struct.pack(">Hh", *metrics[name]))
+            if name in substitutions:
+                digest.update("\0".join(substitutions[name]).encode())
+            digests[name] = digest.digest()
+        return digests
+
+    # 합성 글리프 바이트의 부품 글리프 ID → 글리프 이름 (나머지 바이트는 그대로)
+    def _resolve_components(self, glyph_data, order):
+        parts = [glyph_data[:10]]
+        offset = 10
+        flags = MORE_COMPONENTS
+
+        while flags & MORE_COMPONENTS:
+            flags, gid = struct.unpack(">HH", glyph_data[offset:offset + 4])
+            size = 4 if flags & ARG_1_AND_2_ARE_WORDS else 2
+            if flags & WE_HAVE_A_SCALE:
+                size += 2
+            elif flags & WE_HAVE_AN_X_AND_Y_SCALE:
+                size += 4
+            elif flags & WE_HAVE_A_TWO_BY_TWO:
+                size += 8
+
+            parts += [glyph_data[offset:offset + 2], order[gid].encode() + b"\0",
+                      glyph_data[offset + 4:offset + 4 + size]]
+            offset += 4 + size
+
+        parts.append(glyph_data[offset:])
+        return b"".join(parts)
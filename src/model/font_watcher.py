@@ -0,0 +1,161 @@
+import os
+import time
+import ctypes
+import ctypes.util
+import select
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .font_builder import FontBuilder
+
+
+# inotify 이벤트 : 쓰기 완료, 생성, 삭제, 이동(편집기의 임시 파일 저장 포함)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+DEBOUNCE = 0.05  # 한 번 저장에 이벤트가 여러 개 오므로 잠시 모아서 처리
+
+
+# 리눅스 inotify (ctypes) : 폴더에 변화가 생길 때까지 대기
+class InotifyWatch:
+    name = "inotify"
+
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK) < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, "inotify_add_watch")
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+
+        try:  # 이벤트 내용은 쓰지 않음 (폴더를 다시 훑어 비교)
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+# inotify 를 쓸 수 없는 환경 (윈도우, macOS 등) : 주기적으로 폴더를 다시 훑음
+class PollingWatch:
+    name = "polling"
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def wait(self, timeout):
+        time.sleep(timeout)
+        return True
+
+    def close(self):
+        pass
+
+
+# 감시 모드 : 처음 한 번 전체 빌드 후 FontBuilder, 트레이싱 결과, 컴파일된 부품을 메모리에 두고
+#   PNG 폴더가 바뀔 때마다 바뀐 PNG 만 다시 변환 → 부품 교체 → 폰트 저장
+#   트레이싱 / 글리프 컴파일 풀도 계속 유지 (변경마다 프로세스를 새로 띄우지 않음)
+class FontWatcher:
+    def __init__(self, image_dir, svg_dir, font_path, potrace_path, font_name = "Font",
+                 jobs = None, interval = 0.5, options = None,
+                 step_call = None, subtask_call = None, progress_call = None, error_call = None):
+        self.image_dir = image_dir
+        self.svg_dir = svg_dir
+        self.font_path = font_path
+        self.potrace_path = potrace_path
+        self.font_name = font_name
+        self.jobs = jobs if jobs else (os.cpu_count() or 1)
+        self.interval = interval  # polling 주기 (초)
+        self.options = options if options else {}  # FontBuilder 공통 옵션
+        self.step_call = step_call if step_call else lambda num, tot, msg : None
+        self.subtask_call = subtask_call if subtask_call else lambda msg : None
+        self.progress_call = progress_call if progress_call else lambda cur, tot, msg=None : None
+        self.error_call = error_call if error_call else lambda msg : None
+
+        self.rebuilds = 0
+
+    def run(self):
+        with ThreadPoolExecutor(max_workers=self.jobs) as trace_executor, \
+                self._glyph_executor() as glyph_executor:
+            builder = FontBuilder(
+                image_dir=self.image_dir,
+                svg_dir=self.svg_dir,
+                font_path=self.font_path,
+                potrace_path=self.potrace_path,
+                font_name=self.font_name,
+                jobs=self.jobs,
+                trace_executor=trace_executor,
+                glyph_executor=glyph_executor,
+                step_call=self.step_call,
+                subtask_call=self.subtask_call,
+                progress_call=self.progress_call,
+                **self.options,
+            )
+            builder.build_all()
+
+            snapshot = self._scan()
+            watch = self._create_watch()
+            self.subtask_call(f"{self.image_dir} 감시 중 ({watch.name}) - Ctrl+C 로 종료")
+
+            try:
+                while True:
+                    if not watch.wait(self.interval):
+                        continue
+
+                    time.sleep(DEBOUNCE)
+                    watch.wait(0)
+
+                    current = self._scan()
+                    changed = {file for file in snapshot.keys() | current.keys()
+                               if snapshot.get(file) != current.get(file)}
+                    snapshot = current
+
+                    if changed:
+                        self._rebuild(builder, changed)
+            except KeyboardInterrupt:
+                self.subtask_call(f"감시 종료 (다시 빌드 {self.rebuilds}회)")
+            finally:
+                watch.close()
+
+    def _rebuild(self, builder, changed):
+        start = time.perf_counter()
+        names = ", ".join(sorted(changed)[:3]) + (f" 외 {len(changed) - 3}개" if len(changed) > 3 else "")
+
+        try:
+            builder.rebuild(changed)
+        except Exception as e:
+            self.error_call(f"{names} : {e}")
+            return
+
+        self.rebuilds += 1
+        self.subtask_call(f"{names} → 저장 ({(time.perf_counter() - start) * 1000:.0f}ms)")
+
+    # PNG 파일 이름 → (수정 시각, 크기)
+    def _scan(self):
+        with os.scandir(self.image_dir) as entries:
+            return {entry.name: (entry.stat().st_mtime_ns, entry.stat().st_size)
+                    for entry in entries if entry.name.endswith(".png") and entry.is_file()}
+
+    def _create_watch(self):
+        try:
+            return InotifyWatch(self.image_dir)
+        except (OSError, AttributeError, TypeError):  # libc 에 inotify 가 없음
+            return PollingWatch(self.image_dir)
+
+    def _glyph_executor(self):
+        if self.jobs > 1:
+            return ProcessPoolExecutor(max_workers=self.jobs)
+        return ThreadPoolExecutor(max_workers=1)
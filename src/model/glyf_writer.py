@@ -0,0 +1,217 @@
+import numpy as np
+from fontTools.ttLib import OPTIMIZE_FONT_SPEED
+from fontTools.ttLib.tables._g_l_y_f import table__g_l_y_f, Glyph, GlyphComponent
+
+
+# 컴포넌트 플래그 (GlyphComponent.compile 과 같은 값)
+ARGS_ARE_XY_VALUES = 0x0002
+ROUND_XY_TO_GRID = 0x0004
+MORE_COMPONENTS = 0x0020
+
+COMPONENT_FLAGS = ROUND_XY_TO_GRID | ARGS_ARE_XY_VALUES
+
+
+# 음절(합성) 글리프를 Glyph 객체 없이 배열로 보관하고, 저장 시 바이너리 레코드로 바로 기록하는 glyf 테이블
+#   단순 글리프 : self.glyphs (fontTools Glyph)
+#   합성 글리프 : 이름 목록 + 부품 참조 배열 [N, 3] (-1 : 없음) + bbox 배열 [N, 4]
+#   모든 부품은 (0, 0) 위치, 변환 없음
+#   --dedup 의 중복 부품은 self.glyphs 안의 부품 하나짜리 합성 글리프 (음절에서 보면 깊이 2)
+class CompositeGlyfTable(table__g_l_y_f):
+    def __init__(self, glyphs, composite_names, component_names, component_refs, composite_bounds):
+        super().__init__("glyf")
+        self.glyphs = glyphs
+        self.composite_names = composite_names
+        self.component_names = component_names
+        self.component_refs = np.asarray(component_refs, dtype=np.int32).reshape(-1, 3)
+        self.composite_bounds = np.asarray(composite_bounds, dtype=np.int16).reshape(-1, 4)
+        self.composite_index = {name: i for i, name in enumerate(composite_names)}
+
+    def __getitem__(self, glyphName):
+        if glyphName in self.composite_index:
+            return self._composite_glyph(self.composite_index[glyphName])
+        return super().__getitem__(glyphName)
+
+    def __contains__(self, glyphName):
+        return glyphName in self.glyphs or glyphName in self.composite_index
+
+    def __len__(self):
+        return len(self.glyphs) + len(self.composite_names)
+
+    def keys(self):
+        return list(self.glyphs) + self.composite_names
+
+    def has_key(self, glyphName):
+        return glyphName in self
+
+    def get(self, glyphName, default=None):
+        return self[glyphName] if glyphName in self else default
+
+    def ensureDecompiled(self, recurse=False):
+        for glyph in self.glyphs.values():
+            glyph.expand(self)
+
+    def compile(self, ttFont):
+        optimizeSpeed = ttFont.cfg[OPTIMIZE_FONT_SPEED]
+        records = self._composite_records()
+
+        locations = []
+        currentLocation = 0
+        dataList = []
+        for glyphName in self.glyphOrder:
+            index = self.composite_index.get(glyphName)
+            if index is None:
+                glyphData = self.glyphs[glyphName].compile(self, False, optimizeSize=not optimizeSpeed)
+            else:
+                glyphData = records[index]
+
+            locations.append(currentLocation)
+            currentLocation += len(glyphData)
+            dataList.append(glyphData)
+        locations.append(currentLocation)
+
+        # 홀수 길이 글리프를 채워 short loca 를 쓸 수 있으면 사용 (fontTools 와 동일)
+        if currentLocation < 0x20000:
+            indices = [i for i, glyphData in enumerate(dataList) if len(glyphData) % 2 == 1]
+            if indices and currentLocation + len(indices) < 0x20000:
+                for i in indices:
+                    dataList[i] += b"\0"
+                currentLocation = 0
+                for i, glyphData in enumerate(dataList):
+                    locations[i] = currentLocation
+                    currentLocation += len(glyphData)
+                locations[len(dataList)] = currentLocation
+
+        data = b"".join(dataList)
+        if "loca" in ttFont:
+            ttFont["loca"].set(locations)
+        if "maxp" in ttFont:
+            ttFont["maxp"].numGlyphs = len(self)
+        return data if data else b"\0"
+
+    # font.recalcBBoxes = False 로 저장할 때 대신 maxp / head / hhea 값 계산
+    def recalc_tables(self, ttFont):
+        maxp = ttFont["maxp"]
+        head = ttFont["head"]
+        hhea = ttFont["hhea"]
+        metrics = ttFont["hmtx"].metrics
+
+        # 부품 배열 마지막 칸은 참조 없음(-1) 용 0
+        count = len(self.component_names)
+        points = np.zeros(count + 1, dtype=np.int64)
+        contours = np.zeros(count + 1, dtype=np.int64)
+
+        # 윤곽선이 있는 글리프 : 단순 글리프 + 다른 부품을 옮겨 참조하는 부품 (--dedup)
+        outlines = {}
+        for glyphName, glyph in self.glyphs.items():
+            glyph.expand(self)
+            if glyph.numberOfContours != 0:
+                outlines[glyphName] = glyph
+        simple = [glyph for glyph in outlines.values() if not glyph.isComposite()]
+        references = [glyph for glyph in outlines.values() if glyph.isComposite()]
+
+        def maxp_values(glyph):
+            if glyph.isComposite():
+                values = [outlines[comp.glyphName].getMaxpValues() for comp in glyph.components]
+                return sum(v[0] for v in values), sum(v[1] for v in values)
+            return glyph.getMaxpValues()
+
+        nested = np.zeros(count + 1, dtype=bool)
+        for i, name in enumerate(self.component_names):
+            if name in outlines:
+                points[i], contours[i] = maxp_values(outlines[name])
+                nested[i] = outlines[name].isComposite()
+
+        bounds = [(g.xMin, g.yMin, g.xMax, g.yMax) for g in outlines.values()]
+        bounds = np.array(bounds + self.composite_bounds.tolist(), dtype=np.int64).reshape(-1, 4)
+        lsb = np.array([metrics[name][1] for name in outlines]
+                       + [metrics[name][1] for name in self.composite_names], dtype=np.int64)
+        advance = np.array([metrics[name][0] for name in outlines]
+                           + [metrics[name][0] for name in self.composite_names], dtype=np.int64)
+
+        maxp.numGlyphs = len(self)
+        maxp.maxPoints = max((g.getMaxpValues()[0] for g in simple), default=0)
+        maxp.maxContours = max((g.getMaxpValues()[1] for g in simple), default=0)
+
+        composite_points = [maxp_values(g) for g in references]
+        refs = self.component_refs
+        if len(refs):
+            maxp.maxCompositePoints = int(points[refs].sum(axis=1).max())
+            maxp.maxCompositeContours = int(contours[refs].sum(axis=1).max())
+            maxp.maxComponentElements = int((refs >= 0).sum(axis=1).max())
+            maxp.maxComponentDepth = 2 if nested[refs].any() else 1
+        else:
+            maxp.maxCompositePoints = 0
+            maxp.maxCompositeContours = 0
+            maxp.maxComponentElements = 0
+            maxp.maxComponentDepth = 0
+
+        if references:
+            maxp.maxCompositePoints = max(maxp.maxCompositePoints, max(p for p, _ in composite_points))
+            maxp.maxCompositeContours = max(maxp.maxCompositeContours, max(c for _, c in composite_points))
+            maxp.maxComponentElements = max(maxp.maxComponentElements, max(len(g.components) for g in references))
+            maxp.maxComponentDepth = max(maxp.maxComponentDepth, 1)
+
+        if len(bounds):
+            head.xMin, head.yMin = (int(v) for v in bounds[:, :2].min(axis=0))
+            head.xMax, head.yMax = (int(v) for v in bounds[:, 2:].max(axis=0))
+        else:
+            head.xMin = head.yMin = head.xMax = head.yMax = 0
+
+        if np.all(lsb == bounds[:, 0]):
+            head.flags = head.flags | 0x2
+        else:
+            head.flags = head.flags & ~0x2
+
+        hhea.advanceWidthMax = max(adv for adv, _ in metrics.values())
+        if len(bounds):
+            width = bounds[:, 2] - bounds[:, 0]
+            hhea.minLeftSideBearing = int(lsb.min())
+            hhea.minRightSideBearing = int((advance - lsb - width).min())
+            hhea.xMaxExtent = int((lsb + width).max())
+        else:
+            hhea.minLeftSideBearing = 0
+            hhea.minRightSideBearing = 0
+            hhea.xMaxExtent = 0
+
+    # 합성 글리프 레코드 일괄 생성
+    #   헤더 (numberOfContours = -1, bbox) + 부품마다 (flags, glyphID, x = 0, y = 0 : int8)
+    def _composite_records(self):
+        count = len(self.composite_names)
+        if count == 0:
+            return []
+
+        glyph_ids = np.array([self.getGlyphID(name) for name in self.component_names] + [0], dtype=np.uint16)
+        refs = self.component_refs
+        has_t = refs[:, 2] >= 0
+
+        words = np.zeros((count, 14), dtype=">u2")
+        words[:, 0] = 0xFFFF
+        words[:, 1:5] = self.composite_bounds.astype(np.int16).view(np.uint16)
+        words[:, 5] = COMPONENT_FLAGS | MORE_COMPONENTS
+        words[:, 6] = glyph_ids[refs[:, 0]]
+        words[:, 8] = np.where(has_t, COMPONENT_FLAGS | MORE_COMPONENTS, COMPONENT_FLAGS)
+        words[:, 9] = glyph_ids[refs[:, 1]]
+        words[:, 11] = COMPONENT_FLAGS
+        words[:, 12] = glyph_ids[refs[:, 2]]
+
+        data = words.tobytes()
+        sizes = np.where(has_t, 28, 22)
+        return [data[i * 28:i * 28 + size] for i, size in enumerate(sizes.tolist())]
+
+    def _composite_glyph(self, index):
+        glyph = Glyph()
+        glyph.numberOfContours = -1
+        glyph.components = []
+
+        for ref in self.component_refs[index].tolist():
+            if ref < 0:
+                continue
+            comp = GlyphComponent()
+            comp.glyphName = self.component_names[ref]
+            comp.x = 0
+            comp.y = 0
+            comp.flags = ROUND_XY_TO_GRID
+            glyph.components.append(comp)
+
+        glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax = self.composite_bounds[index].tolist()
+        return glyph
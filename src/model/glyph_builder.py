@@ -1,48 +1,83 @@
 import os
 import re
+import math
+import numpy as np
 import xml.etree.ElementTree as ET
 
 from xml.etree.ElementTree import XMLParser
 from fontTools.pens.ttGlyphPen import TTGlyphPen
 from fontTools.pens.cu2quPen import Cu2QuPen
+from fontTools.pens.recordingPen import RecordingPen, replayRecording
 
+from .outline_simplify import SimplifyPen
 
+
+PATH_REGEX = re.compile(r"([MLHVCZmlhvcz])([^MLHVCZmlhvcz]*)")
+NUMBER_REGEX = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+TRANSFORM_REGEX = re.compile(r"(\w+)\s*\(([^)]*)\)")
+
+MAX_ERR = 1  # 3차 → 2차 곡선 변환 허용 오차
+
+
+# 파싱 상태를 인스턴스에 두지 않으므로 여러 스레드에서 함께 사용 가능
+#   simplify : 아웃라인 단순화 허용 오차 (None : 단순화 안 함)
 class GlyphBuilder:
-    def __init__(self, upm: int = 1000):
+    def __init__(self, upm: int = 1000, simplify: float = None):
         self.upm = upm
-        self.PATH_REGEX = re.compile(r"([MLCZmlcz])([^MLCZmlcz]*)")
-        self.current_x = 0
-        self.current_y = 0
-        self.current_y = 0
-        self.svg_height = None
-        self.y_flip = False
-
-        self.path_transform = ""
-        self.svg_transform = ""
+        self.simplify = simplify
 
     def build_svg_to_glyph(self, svg_path: str) -> TTGlyphPen:
-        svg_info = self._extract_svg_info(svg_path)
-
-        self.svg_height = svg_info.get("height", self.upm)
-        self.y_flip = svg_info.get("y_flip", False)
-        self.path_transform = svg_info.get("path_transform", "")
-        self.svg_transform = svg_info.get("svg_transform", "")
+        return self._build_svg_root_to_glyph(self._read_svg_root(svg_path))
 
-        path_d = svg_info["path_d"]
+    # SVG 파일 → 펜 명령 목록 (단순화 전 / 후 비교용)
+    def build_svg_to_outline(self, svg_path: str) -> list:
+        pen = RecordingPen()
+        self._draw_svg_root(self._read_svg_root(svg_path), pen)
+        return pen.value
 
+    # 트레이싱 단계의 아웃라인(펜 명령 목록)으로 바로 글리프 생성
+    def build_outline_to_glyph(self, outline) -> TTGlyphPen:
         result_pen = TTGlyphPen(None)
-        converter_pen = Cu2QuPen(result_pen, max_err=1)
-        self._parse_path_to_pen(path_d, converter_pen)
+        replayRecording(outline, self._converter_pen(result_pen))
 
         return result_pen
 
-    def _extract_svg_info(self, svg_path: str) -> dict:
+    def _read_svg_root(self, svg_path: str):
         if not os.path.exists(svg_path):
             raise FileNotFoundError(f"파일 X: {svg_path}")
 
         parser = XMLParser()
-        tree = ET.parse(svg_path, parser=parser)
-        root = tree.getroot()
+        return ET.parse(svg_path, parser=parser).getroot()
+
+    def _build_svg_root_to_glyph(self, root) -> TTGlyphPen:
+        result_pen = TTGlyphPen(None)
+        self._draw_svg_root(root, self._converter_pen(result_pen))
+
+        return result_pen
+
+    # 3차 → 2차 곡선 변환 (단순화 시 허용 오차만큼 곡선 점도 줄이고 SimplifyPen 을 거침)
+    def _converter_pen(self, result_pen):
+        if self.simplify is None:
+            return Cu2QuPen(result_pen, max_err=MAX_ERR)
+        return Cu2QuPen(SimplifyPen(result_pen, self.simplify), max_err=max(MAX_ERR, self.simplify))
+
+    # SVG 아웃라인을 폰트 좌표로 변환해 임의의 펜에 그림
+    def draw_svg_text(self, svg_text: str, pen):
+        self._draw_svg_root(ET.fromstring(svg_text), pen)
+
+    def _draw_svg_root(self, root, pen):
+        svg_info = self._extract_svg_info(root)
+
+        matrix = self._compile_transform(
+            svg_info.get("svg_transform", ""),
+            svg_info.get("path_transform", ""),
+            svg_info.get("height", self.upm),
+            svg_info.get("y_flip", False),
+        )
+
+        self._parse_path_to_pen(svg_info["path_d"], pen, matrix)
+
+    def _extract_svg_info(self, root) -> dict:
         ns = {"svg": "http://www.w3.org/2000/svg"}
 
         svg_transform = root.get("transform") or ""
@@ -95,131 +130,159 @@ class GlyphBuilder:
             "path_transform": path_transform,
         }
 
-    # 평행 이동
-    def _translate_point(self, x, y, tx, ty):
-        return x + tx, y + ty
+    # 변환 문자열 → 3x3 아핀 행렬 (SVG 규칙 : 왼쪽 변환이 바깥쪽)
+    def _parse_transform(self, transform_str) -> np.ndarray:
+        matrix = np.identity(3)
+        if not transform_str:
+            return matrix
 
-    # 확대 / 축소
-    def _scale_point(self, x, y, sx, sy):
-        return x * sx, y * sy
+        for name, args in TRANSFORM_REGEX.findall(transform_str):
+            vals = [float(v) for v in NUMBER_REGEX.findall(args)]
+            matrix = matrix @ self._transform_matrix(name, vals)
 
-    def _transform_point(self, x, y, transform_str):
-        if not transform_str:
-            return x, y
+        return matrix
 
-        transform_re = re.compile(r"(\w+)\(([^)]*)\)")
+    def _transform_matrix(self, name, vals) -> np.ndarray:
+        a, b, c, d, e, f = 1.0, 0.0, 0.0, 1.0, 0.0, 0.0
 
-        matches = transform_re.findall(transform_str)
+        if name == "matrix" and len(vals) == 6:
+            a, b, c, d, e, f = vals
 
-        for name, args in reversed(matches):
-            vals = [float(v) for v in re.split(r"[ ,]+", args.strip()) if v]
+        elif name == "translate" and vals:
+            e = vals[0]
+            f = vals[1] if len(vals) > 1 else 0
 
-            if name == "translate":
-                tx = vals[0]
-                ty = vals[1] if len(vals) > 1 else 0
-                x, y = self._translate_point(x, y, tx, ty)
+        elif name == "scale" and vals:
+            a = vals[0]
+            d = vals[1] if len(vals) > 1 else a
 
-            elif name == "scale":
-                sx = vals[0]
-                sy = vals[1] if len(vals) > 1 else sx
-                x, y = self._scale_point(x, y, sx, sy)
+        elif name == "rotate" and vals:
+            rad = math.radians(vals[0])
+            cos, sin = math.cos(rad), math.sin(rad)
+            a, b, c, d = cos, sin, -sin, cos
+            if len(vals) == 3:  # rotate(각도, cx, cy) = translate(cx, cy) rotate translate(-cx, -cy)
+                cx, cy = vals[1], vals[2]
+                e = cx - cos * cx + sin * cy
+                f = cy - sin * cx - cos * cy
 
-        return x, y
+        elif name == "skewX" and vals:
+            c = math.tan(math.radians(vals[0]))
 
-    def _apply_transform(self, x, y):
-        x, y = self._transform_point(x, y, self.path_transform)
-        x, y = self._transform_point(x, y, self.svg_transform)
+        elif name == "skewY" and vals:
+            b = math.tan(math.radians(vals[0]))
 
-        if not self.y_flip:
-            y = self.svg_height - y
+        return np.array([[a, c, e], [b, d, f], [0.0, 0.0, 1.0]])
 
-        return x, y
+    # path 변환 → svg 변환 → y 축 반전을 SVG 마다 한 번만 계산한 하나의 행렬
+    def _compile_transform(self, svg_transform, path_transform, svg_height, y_flip) -> np.ndarray:
+        matrix = self._parse_transform(svg_transform) @ self._parse_transform(path_transform)
 
-    def _transform_pt(self, x, y):
-        return self._apply_transform(x, y)
+        if not y_flip:
+            flip = np.array([[1.0, 0.0, 0.0], [0.0, -1.0, svg_height], [0.0, 0.0, 1.0]])
+            matrix = flip @ matrix
 
-    def _parse_path_to_pen(self, path_d, pen: Cu2QuPen):
-        self.current_x = 0
-        self.current_y = 0
+        return matrix
 
-        for command in self.PATH_REGEX.finditer(path_d):
-            cmd = command.group(1)
-            args = command.group(2).strip()
-            coords = self._get_coords(args)
-            absolute = cmd.isupper()
+    def _parse_path_to_pen(self, path_d, pen, matrix):
+        commands, points = self._parse_path(path_d)
+        if len(points):
+            points = points @ matrix[:2, :2].T + matrix[:2, 2]
 
-            if cmd in "Mm":
-                self._move_to(pen, coords, absolute)
-            elif cmd in "Ll":
-                self._line_to(pen, coords, absolute)
-            elif cmd in "Cc":
-                self._cubic(pen, coords, absolute)
-            elif cmd in "Zz":
-                pen.closePath()
+        points = points.tolist()
+        index = 0
 
-    def _get_coords(self, args):
-        if not args:
-            return []
-
-        args = re.sub(r'[MLCZmlcz]', '', args)
-        args = re.sub(r'(?<=\d)-', r' -', args)
-        coords = [float(x) for x in re.split(r'[\s,]+', args.strip()) if x]
-        return coords
-
-    def _resolve_abs(self, x, y, absolute):
-        if not absolute:
-            x += self.current_x
-            y += self.current_y
-        return x, y
-
-    def _move_to(self, pen, coords, absolute):
-        it = iter(coords)
-        x, y = next(it), next(it)
-        x, y = self._resolve_abs(x, y, absolute)
-
-        self.current_x, self.current_y = x, y
-        tx, ty = self._transform_pt(x, y)
-
-        pen.moveTo((tx, ty))
-
-        for x, y in zip(it, it):
-            x, y = self._resolve_abs(x, y, absolute)
-            self.current_x, self.current_y = x, y
-            pen.lineTo(self._transform_pt(x, y))
-
-    def _line_to(self, pen, coords, absolute):
-        it = iter(coords)
-        while True:
-            try:
-                x = next(it)
-                y = next(it)
-            except StopIteration:
-                break
-
-            x, y = self._resolve_abs(x, y, absolute)
-            self.current_x, self.current_y = x, y
-            pen.lineTo(self._transform_pt(x, y))
-
-    def _cubic(self, pen, coords, absolute):
-        it = iter(coords)
-        while True:
-            try:
-                c1x = next(it)
-                c1y = next(it)
-                c2x = next(it)
-                c2y = next(it)
-                ex = next(it)
-                ey = next(it)
-            except StopIteration:
-                break
-
-            c1x, c1y = self._resolve_abs(c1x, c1y, absolute)
-            c2x, c2y = self._resolve_abs(c2x, c2y, absolute)
-            ex, ey = self._resolve_abs(ex, ey, absolute)
-
-            t1 = self._transform_pt(c1x, c1y)
-            t2 = self._transform_pt(c2x, c2y)
-            te = self._transform_pt(ex, ey)
-
-            pen.curveTo(t1, t2, te)
-            self.current_x, self.current_y = ex, ey
+        for command, count in commands:
+            if command == "closePath":
+                pen.closePath()
+            elif command == "curveTo":
+                pen.curveTo(tuple(points[index]), tuple(points[index + 1]), tuple(points[index + 2]))
+            else:
+                getattr(pen, command)(tuple(points[index]))
+            index += count
+
+    # path 의 d 속성 → (펜 명령, 점 개수) 목록 + 절대 좌표 배열 (N, 2)
+    def _parse_path(self, path_d):
+        commands = []
+        chunks = []
+        current = np.zeros(2)
+        start = np.zeros(2)
+
+        for match in PATH_REGEX.finditer(path_d):
+            cmd = match.group(1)
+            coords = np.array(NUMBER_REGEX.findall(match.group(2)), dtype=float)
+            absolute = cmd.isupper()
+            op = cmd.upper()
+
+            if op == "Z":
+                commands.append(("closePath", 0))
+                current = start
+                continue
+
+            if op in "ML":
+                pts = coords[:len(coords) // 2 * 2].reshape(-1, 2)
+                if not len(pts):
+                    continue
+                pts = self._resolve_abs(pts, current, absolute)
+
+                if op == "M":
+                    commands.append(("moveTo", 1))
+                    commands.extend([("lineTo", 1)] * (len(pts) - 1))
+                    start = pts[0]
+                else:
+                    commands.extend([("lineTo", 1)] * len(pts))
+
+            elif op in "HV":
+                if not len(coords):
+                    continue
+                axis = 0 if op == "H" else 1
+                pts = np.repeat(current[None, :], len(coords), axis=0)
+                pts[:, axis] = coords if absolute else current[axis] + np.cumsum(coords)
+                commands.extend([("lineTo", 1)] * len(pts))
+
+            elif op == "C":
+                segs = coords[:len(coords) // 6 * 6].reshape(-1, 3, 2)
+                if not len(segs):
+                    continue
+                if not absolute:
+                    # 각 곡선의 기준점 = 직전 곡선의 끝점
+                    bases = self._resolve_abs(segs[:-1, 2], current, False)
+                    bases = np.vstack([current, bases])
+                    segs = segs + bases[:, None, :]
+                pts = segs.reshape(-1, 2)
+                commands.extend([("curveTo", 3)] * len(segs))
+
+            else:
+                continue
+
+            chunks.append(pts)
+            current = pts[-1]
+
+        points = np.vstack(chunks) if chunks else np.zeros((0, 2))
+        return commands, points
+
+    # 상대 좌표 → 절대 좌표 (누적 합, 앞에서부터 순서대로 더함)
+    def _resolve_abs(self, pts, current, absolute):
+        if absolute:
+            return pts
+        return np.cumsum(np.vstack([current, pts]), axis=0)[1:]
+
+
+# 작업 프로세스용 : 부품 하나를 TrueType 글리프로 컴파일
+#   source_type : "svg" (SVG 파일 경로) 또는 "outline" (펜 명령 목록)
+#   simplify 가 있으면 단순화 전 점 수를 glyph.source_points 에 기록 (보고용, 글리프 바이너리에는 없음)
+def compile_component_glyph(source_type, source, upm: int = 1000, simplify: float = None):
+    builder = GlyphBuilder(upm, simplify)
+
+    if simplify is None:
+        if source_type == "outline":
+            return builder.build_outline_to_glyph(source).glyph()
+        return builder.build_svg_to_glyph(source).glyph()
+
+    outline = source if source_type == "outline" else builder.build_svg_to_outline(source)
+    glyph = builder.build_outline_to_glyph(outline).glyph()
+    glyph.source_points = count_points(GlyphBuilder(upm).build_outline_to_glyph(outline).glyph())
+    return glyph
+
+
+def count_points(glyph) -> int:
+    return len(glyph.coordinates) if glyph.numberOfContours > 0 else 0
@@ -0,0 +1,102 @@
+import os
+import struct
+import hashlib
+
+import fontTools
+from fontTools.ttLib.tables._g_l_y_f import Glyph
+
+
+CACHE_DIR = ".glyph_cache"
+CACHE_VERSION = 3
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+NO_SOURCE_POINTS = 0xFFFFFFFF  # 단순화하지 않은 글리프 (source_points 없음)
+
+
+# 부품 원본 해시 : SVG 파일 내용 또는 아웃라인(펜 명령 목록)
+def hash_source(source_type, source):
+    if source_type == "outline":
+        data = repr(source).encode()
+    else:
+        with open(source, "rb") as f:
+            data = f.read()
+
+    return hashlib.sha256(source_type.encode() + b"\0" + data).hexdigest()
+
+
+# 컴파일된 부품 글리프(glyf 바이너리) 디스크 캐시
+#   파일 : 단순화 전 점 수 (uint32, 단순화 보고용) + glyf 바이너리
+#   키 : 원본(SVG 내용 / 아웃라인) + upm + max_err (+ 단순화 허용 오차) 해시
+#   용량 초과 시 가장 오래 사용하지 않은 파일부터 삭제 (mtime 기준 LRU)
+class GlyphCache:
+    def __init__(self, cache_dir, upm = 1000, max_err = 1, simplify = None, max_bytes = CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.settings = f"{CACHE_VERSION}:{fontTools.version}:{upm}:{max_err}".encode()
+        if simplify is not None:  # 단순화하지 않는 빌드의 기존 캐시 키는 그대로 유지
+            self.settings += f":simplify={simplify}".encode()
+
+        self.hits = 0
+        self.misses = 0
+
+    # source_digest : hash_source() 결과
+    def key(self, source_digest):
+        return hashlib.sha256(self.settings + b"\0" + source_digest.encode()).hexdigest()
+
+    def get(self, key):
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        source_points, = struct.unpack(">I", data[:4])
+        glyph = Glyph(data[4:])
+        glyph.expand(None)
+        if source_points != NO_SOURCE_POINTS:
+            glyph.source_points = source_points
+        return glyph
+
+    def put(self, key, glyph):
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+
+        # 단순 글리프만 저장되므로 glyf 테이블 없이 컴파일 가능
+        source_points = getattr(glyph, "source_points", NO_SOURCE_POINTS)
+        with open(temp_path, "wb") as f:
+            f.write(struct.pack(">I", source_points) + glyph.compile(None))
+        os.replace(temp_path, path)
+
+    def evict(self):
+        if not os.path.exists(self.cache_dir):
+            return 0
+
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".glyf"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".glyf")
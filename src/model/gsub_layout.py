@@ -0,0 +1,104 @@
+from fontTools.ttLib import newTable
+from fontTools.ttLib.tables import otTables as ot
+from fontTools.otlLib.builder import buildMultipleSubstSubtable
+
+
+# 서브테이블 하나의 음절 수 : 커버리지 오프셋(16비트)이 넘치지 않는 크기 (음절당 최대 10바이트)
+SUBTABLE_SIZE = 4000
+
+SCRIPT_TAGS = ["DFLT", "hang"]
+
+MULTIPLE_SUBST = 2
+EXTENSION_SUBST = 7
+
+
+# 음절 글리프 → 부품 글리프 시퀀스를 ccmp 다중 치환(LookupType 2)으로 기록하는 GSUB 테이블
+#   substitutions : {음절 글리프 이름: [초성, 중성, (종성)] 부품 글리프 이름}
+#   glyph_order   : 서브테이블을 글리프 ID 순으로 나눠 커버리지가 연속 구간으로 묶이도록 함
+#   서브테이블 합이 64KB 를 넘으므로 Extension(LookupType 7) 으로 감쌈
+#   (음절 11,172자 기준 fontTools 컴파일 약 0.3초, 직접 바이너리로 쓸 만큼의 차이가 아님)
+def build_ccmp_gsub(substitutions, glyph_order):
+    glyph_ids = {name: gid for gid, name in enumerate(glyph_order)}
+    items = sorted(substitutions.items(), key=lambda item: glyph_ids[item[0]])
+
+    lookup = ot.Lookup()
+    lookup.LookupType = EXTENSION_SUBST
+    lookup.LookupFlag = 0
+    lookup.SubTable = [_extension(buildMultipleSubstSubtable(dict(items[i:i + SUBTABLE_SIZE])))
+                       for i in range(0, len(items), SUBTABLE_SIZE)]
+    lookup.SubTableCount = len(lookup.SubTable)
+
+    gsub = ot.GSUB()
+    gsub.Version = 0x00010000
+    gsub.ScriptList = _script_list()
+    gsub.FeatureList = _feature_list()
+    gsub.LookupList = ot.LookupList()
+    gsub.LookupList.Lookup = [lookup]
+    gsub.LookupList.LookupCount = 1
+
+    table = newTable("GSUB")
+    table.table = gsub
+    return table
+
+
+def _extension(subtable):
+    extension = ot.ExtensionSubst()
+    extension.Format = 1
+    extension.ExtensionLookupType = MULTIPLE_SUBST
+    extension.ExtSubTable = subtable
+    return extension
+
+
+# 모든 스크립트가 같은 기본 LangSys (ccmp 기능 하나) 사용
+def _script_list():
+    lang_sys = ot.DefaultLangSys()
+    lang_sys.LookupOrder = None
+    lang_sys.ReqFeatureIndex = 0xFFFF
+    lang_sys.FeatureIndex = [0]
+    lang_sys.FeatureCount = 1
+
+    script_list = ot.ScriptList()
+    script_list.ScriptRecord = []
+    for tag in SCRIPT_TAGS:
+        record = ot.ScriptRecord()
+        record.ScriptTag = tag
+        record.Script = ot.Script()
+        record.Script.DefaultLangSys = lang_sys
+        record.Script.LangSysRecord = []
+        record.Script.LangSysCount = 0
+        script_list.ScriptRecord.append(record)
+    script_list.ScriptCount = len(SCRIPT_TAGS)
+    return script_list
+
+
+def _feature_list():
+    record = ot.FeatureRecord()
+    record.FeatureTag = "ccmp"
+    record.Feature = ot.Feature()
+    record.Feature.FeatureParams = None
+    record.Feature.LookupListIndex = [0]
+    record.Feature.LookupCount = 1
+
+    feature_list = ot.FeatureList()
+    feature_list.FeatureRecord = [record]
+    feature_list.FeatureCount = 1
+    return feature_list
+
+
+# 폰트의 ccmp 다중 치환을 {음절 글리프: 부품 시퀀스} 로 읽기 (검증용)
+def read_ccmp_substitutions(font):
+    if "GSUB" not in font:
+        return {}
+
+    gsub = font["GSUB"].table
+    substitutions = {}
+    for record in gsub.FeatureList.FeatureRecord:
+        if record.FeatureTag != "ccmp":
+            continue
+        for index in record.Feature.LookupListIndex:
+            for subtable in gsub.LookupList.Lookup[index].SubTable:
+                if subtable.LookupType == EXTENSION_SUBST:
+                    subtable = subtable.ExtSubTable
+                if getattr(subtable, "mapping", None) is not None:
+                    substitutions.update(subtable.mapping)
+    return substitutions
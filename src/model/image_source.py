@@ -0,0 +1,199 @@
+import io
+import os
+import hashlib
+import tarfile
+import zipfile
+
+from .syllable_layout import component_names
+
+
+ARCHIVE_EXTENSIONS = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+SHEET_EXTENSION = ".png"
+SHEET_COLUMNS = 20
+SHEET_INK = 128  # 시트 칸에 이 밝기 미만 점이 하나라도 있어야 부품으로 인정
+
+
+# 부품 PNG 입력 : 폴더 / 압축 파일 (zip, tar) / 스프라이트 시트 PNG 한 장
+#   names()   : 부품 PNG 파일 이름 목록 ("L_0_type1.png", ...)
+#   load()    : RasterPreprocessor 입력 (폴더 : 경로, 압축 : BytesIO, 시트 : 잘라 둔 Pillow 이미지)
+#   image()   : Pillow 이미지 (미리보기)
+#   digest()  : 내용 해시 (SVG 캐시 manifest)
+#   압축 / 시트는 한 번에 읽어 메모리에 두고, 파일을 풀지 않음
+def open_image_source(path, sheet_columns = SHEET_COLUMNS):
+    lower = path.lower()
+    if lower.endswith(ARCHIVE_EXTENSIONS):
+        return ArchiveSource(path)
+    if lower.endswith(SHEET_EXTENSION):
+        return SheetSource(path, sheet_columns)
+    return DirectorySource(path)
+
+
+# 폴더로 만들어야 하는 입력인지 (압축 파일 / 시트 PNG 가 아님)
+def is_directory_input(path):
+    return not path.lower().endswith(ARCHIVE_EXTENSIONS + (SHEET_EXTENSION,))
+
+
+class DirectorySource:
+    kind = "폴더"
+
+    def __init__(self, path):
+        self.path = path
+
+    def names(self):
+        if not os.path.isdir(self.path):
+            return []
+
+        with os.scandir(self.path) as entries:
+            return sorted(entry.name for entry in entries if entry.name.endswith(".png") and entry.is_file())
+
+    def exists(self, name):
+        return os.path.exists(self.location(name))
+
+    # 오류 메시지 / potrace 임시 파일 위치에 쓰는 경로
+    def location(self, name):
+        return os.path.join(self.path, name)
+
+    def load(self, name):
+        return self.location(name)
+
+    def image(self, name):
+        from PIL import Image
+        return Image.open(self.location(name))
+
+    def digest(self, name):
+        with open(self.location(name), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+
+# zip / tar 의 PNG 를 스트림으로 한 번 읽어 메모리에 보관 (하위 폴더는 무시하고 파일 이름만 사용)
+class ArchiveSource:
+    kind = "압축 파일"
+
+    def __init__(self, path):
+        self.path = path
+        self.members = {}  # 파일 이름 → PNG 바이트
+
+        try:
+            if path.lower().endswith(".zip"):
+                self._read_zip()
+            else:
+                self._read_tar()
+        except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+            raise Exception(f"Image Source : {path} : {e}")
+
+    def _read_zip(self):
+        with zipfile.ZipFile(self.path) as archive:
+            for info in archive.infolist():
+                name = os.path.basename(info.filename)
+                if not info.is_dir() and name.endswith(".png"):
+                    self.members[name] = archive.read(info)
+
+    def _read_tar(self):
+        with tarfile.open(self.path, "r|*") as archive:  # 앞에서부터 한 번만 읽음 (압축 tar 도 그대로)
+            for member in archive:
+                name = os.path.basename(member.name)
+                if member.isfile() and name.endswith(".png"):
+                    self.members[name] = archive.extractfile(member).read()
+
+    def names(self):
+        return sorted(self.members)
+
+    def exists(self, name):
+        return name in self.members
+
+    def location(self, name):
+        return os.path.join(self.path, name)
+
+    def load(self, name):
+        return io.BytesIO(self.members[name])
+
+    def image(self, name):
+        from PIL import Image
+        return Image.open(self.load(name))
+
+    def digest(self, name):
+        return hashlib.sha256(self.members[name]).hexdigest()
+
+
+# 템플릿 시트 한 장 : 가로 columns 칸의 정사각형 격자, 칸 순서는 component_names()
+#   (자모 → 초성 → 중성 → 종성, plan / 미리보기와 같은 순서)
+#   한 번 디코딩한 뒤 칸 한 줄씩 흑백 변환해 칸마다 잘라 보관, 잉크가 없는 칸은 부품이 없는 것으로 처리
+#   트레이싱 결과는 1000x1000 캔버스 기준으로 글리프에 배치되므로 칸은 load() 에서 캔버스 크기로 리샘플링
+#   1000px 칸 시트(20000x14000)는 Pillow 의 압축 폭탄 제한을 넘으므로 이 파일만 제한 없이 엶 (로컬 입력)
+class SheetSource:
+    kind = "시트"
+
+    def __init__(self, path, columns = SHEET_COLUMNS):
+        import numpy as np
+        from PIL import Image
+
+        self.path = path
+        self.columns = columns
+        self.cells = {}  # 파일 이름 → 칸 이미지 (흑백, 원래 칸 크기)
+
+        try:
+            with _open_unbounded(path) as sheet:
+                sheet.load()
+                width, height = sheet.size
+                cell = width // columns if columns > 0 else 0
+                if cell == 0 or width % columns or height % cell:
+                    raise ValueError(f"시트 크기 {width}x{height} 를 가로 {columns}칸의 정사각형 격자로 나눌 수 없음")
+
+                names = component_names()
+                rows = min(height // cell, -(-len(names) // columns))
+                for row in range(rows):
+                    band = _to_gray(sheet.crop((0, row * cell, width, (row + 1) * cell)))
+
+                    # 한 줄의 모든 칸 잉크 유무를 한 번에 계산 : [cell, columns, cell] → [columns]
+                    ink = (np.asarray(band) < SHEET_INK).reshape(cell, columns, cell).any(axis=(0, 2))
+                    for column, name in enumerate(names[row * columns:(row + 1) * columns]):
+                        if ink[column]:
+                            self.cells[name + ".png"] = band.crop((column * cell, 0, (column + 1) * cell, cell))
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            raise Exception(f"Image Source : {path} : {e}")
+
+    def names(self):
+        return sorted(self.cells)
+
+    def exists(self, name):
+        return name in self.cells
+
+    def location(self, name):
+        return os.path.join(self.path, name)
+
+    # 캔버스 크기로 리샘플링한 칸 (전처리 묶음 단위로만 만들어 메모리에 쌓이지 않음)
+    def load(self, name):
+        from PIL import Image
+        from .raster_preprocess import CANVAS_SIZE
+
+        cell = self.cells[name]
+        if cell.size == CANVAS_SIZE:
+            return cell
+        return cell.resize(CANVAS_SIZE, Image.LANCZOS)
+
+    def image(self, name):
+        return self.cells[name].copy()
+
+    def digest(self, name):
+        cell = self.cells[name]
+        return hashlib.sha256(f"{cell.size}".encode() + cell.tobytes()).hexdigest()
+
+
+def _open_unbounded(path):
+    from PIL import Image
+
+    limit = Image.MAX_IMAGE_PIXELS
+    Image.MAX_IMAGE_PIXELS = None
+    try:
+        return Image.open(path)
+    finally:
+        Image.MAX_IMAGE_PIXELS = limit
+
+
+# 투명 배경은 흰색 위에 합성 (RasterPreprocessor 와 같은 규칙)
+def _to_gray(img):
+    from PIL import Image
+
+    if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+        img = Image.alpha_composite(Image.new("RGBA", img.size, "white"), img.convert("RGBA"))
+    return img.convert("L")
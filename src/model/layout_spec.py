@@ -0,0 +1,82 @@
+import re
+import json
+import hashlib
+
+
+F2DOT14 = 1 << 14  # 합성 글리프 변환 행렬은 F2Dot14 로 저장되므로 미리 같은 값으로 맞춤
+
+COMPONENT_REGEX = re.compile(r"^([LVT])_(\d+)_type([1-6])$")
+
+# 역할별 기본 그림 (자모 하나를 한 번만 그린 PNG) 파일 이름
+#   초성 / 중성 : 자모 글리프와 같은 그림, 종성 : 겹받침이 있어 따로 그림
+BASE_NAMES = {
+    "L": "L_{index}_jamo",
+    "V": "V_{index}_jamo",
+    "T": "T_{index}_base",
+}
+
+
+# 레이아웃 명세 : 타입별 PNG 가 없는 부품을 기본 그림의 합성 참조(2×2 변환 + 위치)로 만듦
+#   {"L": {"type1": {"scale": [0.6, 0.8], "offset": [40, 150]}, ...}, "V": {...}, "T": {...}}
+#   scale : 숫자 하나 또는 [sx, sy], matrix : [xx, xy, yx, yy] (scale 대신), offset : [dx, dy] (폰트 단위)
+#   타입별 PNG / SVG 가 있으면 그 부품은 명세보다 우선
+#   fontTools / NumPy 를 불러오지 않음 (plan / check 에서도 사용)
+class LayoutSpec:
+    def __init__(self, path):
+        self.path = path
+        self.transforms = {}  # (역할, 레이아웃 타입) → (xx, xy, yx, yy, dx, dy)
+        self.digest = None
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            spec = json.loads(data)
+
+            for role, types in spec.items():
+                if role not in BASE_NAMES:
+                    raise ValueError(f"알 수 없는 역할 : {role} (L, V, T)")
+                for type_name, entry in types.items():
+                    match = re.fullmatch(r"type([1-6])", type_name)
+                    if not match:
+                        raise ValueError(f"알 수 없는 레이아웃 타입 : {role}.{type_name}")
+                    self.transforms[(role, int(match.group(1)))] = self._parse_transform(entry)
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            raise Exception(f"Layout Spec : {path} : {e}")
+
+        self.digest = hashlib.sha256(data).hexdigest()
+
+    # 부품 이름 → (기본 그림 파일 이름, 변환), 명세에 없으면 None
+    def derive(self, component_name):
+        match = COMPONENT_REGEX.match(component_name)
+        if not match:
+            return None
+
+        role, index, layout_type = match.group(1), match.group(2), int(match.group(3))
+        transform = self.transforms.get((role, layout_type))
+        if transform is None:
+            return None
+        return BASE_NAMES[role].format(index=index), transform
+
+    # 명세에 필요한 자모 글리프가 아닌 기본 그림 (종성)
+    def extra_base_names(self, component_names):
+        names = []
+        for component_name in component_names:
+            derived = self.derive(component_name)
+            if derived and not derived[0].endswith("_jamo") and derived[0] not in names:
+                names.append(derived[0])
+        return names
+
+    def _parse_transform(self, entry):
+        if "matrix" in entry:
+            xx, xy, yx, yy = (float(v) for v in entry["matrix"])
+        else:
+            scale = entry.get("scale", 1)
+            sx, sy = (scale, scale) if isinstance(scale, (int, float)) else scale
+            xx, xy, yx, yy = float(sx), 0.0, 0.0, float(sy)
+
+        matrix = tuple(round(v * F2DOT14) / F2DOT14 for v in (xx, xy, yx, yy))
+        if not all(-2 <= v < 2 for v in matrix):
+            raise ValueError(f"변환 값은 -2 이상 2 미만 : {entry}")
+
+        dx, dy = entry.get("offset", [0, 0])
+        return matrix + (int(round(dx)), int(round(dy)))
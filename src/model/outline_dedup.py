@@ -0,0 +1,121 @@
+import hashlib
+import numpy as np
+from array import array
+from fontTools.ttLib.tables import ttProgram
+from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphComponent, GlyphCoordinates, UNSCALED_COMPONENT_OFFSET
+
+from .glyf_writer import ROUND_XY_TO_GRID
+
+
+# 같은 그림에서 나온 부품 찾기 : 윤곽선을 (0, 0) 기준으로 옮긴 좌표 + 윤곽선 끝점 + on-curve 플래그를 해시
+#   해시가 같으면 좌표까지 비교해 확인하고, 그룹마다 order 가 가장 앞선 글리프 하나만 윤곽선으로 남김
+#   나머지는 (대표 글리프, dx, dy) → reference_glyph() 로 부품 하나짜리 합성 글리프
+class OutlineDeduplicator:
+    def __init__(self):
+        self.duplicates = {}  # 글리프 이름 → (대표 글리프 이름, dx, dy)
+        self.hashes = 0  # 윤곽선이 있는 글리프 수
+        self.groups = 0  # 중복이 있는 그룹 수
+        self.saved_points = 0
+
+    # glyphs : {글리프 이름: 단순 Glyph}, order : 대표로 고를 순서 (앞일수록 우선)
+    def find(self, glyphs, order):
+        rank = {name: i for i, name in enumerate(order)}
+        candidates = sorted((name for name in glyphs if name in rank and glyphs[name].numberOfContours > 0),
+                            key=rank.get)
+
+        buckets = {}
+        for name in candidates:
+            key, origin, outline = self._normalize(glyphs[name])
+            buckets.setdefault(key, []).append((name, origin, outline))
+
+        self.duplicates = {}
+        self.hashes = len(candidates)
+        self.groups = 0
+        self.saved_points = 0
+
+        for entries in buckets.values():
+            while len(entries) > 1:
+                (canonical, origin, outline), rest = entries[0], entries[1:]
+                entries = []  # 해시 충돌로 좌표가 다른 글리프는 다음 차례에 다시 비교
+                matches = 0
+                for name, other_origin, other_outline in rest:
+                    if not self._same(outline, other_outline):
+                        entries.append((name, other_origin, other_outline))
+                        continue
+
+                    dx, dy = (other_origin - origin).tolist()
+                    self.duplicates[name] = (canonical, dx, dy)
+                    self.saved_points += len(glyphs[name].coordinates)
+                    matches += 1
+
+                if matches:
+                    self.groups += 1
+
+        return self.duplicates
+
+    def _normalize(self, glyph):
+        coords = np.rint(np.asarray(glyph.coordinates.array, dtype=np.float64)).astype(np.int64).reshape(-1, 2)
+        origin = coords.min(axis=0)
+        ends = np.asarray(glyph.endPtsOfContours, dtype=np.int64)
+        on_curve = np.asarray(glyph.flags, dtype=np.uint8) & 0x01
+        outline = (coords - origin, ends, on_curve)
+
+        digest = hashlib.sha256()
+        for part in outline:
+            digest.update(part.tobytes())
+            digest.update(b"\0")
+        return digest.hexdigest(), origin, outline
+
+    def _same(self, outline, other):
+        return all(np.array_equal(a, b) for a, b in zip(outline, other))
+
+
+# 대표 글리프를 (dx, dy) 만큼 옮겨 참조하는 합성 글리프, bounds 는 원래 글리프와 같음
+#   matrix : (xx, xy, yx, yy) 2×2 변환 (레이아웃 명세), 위치는 변환하지 않음 (UNSCALED_COMPONENT_OFFSET)
+def reference_glyph(glyph, canonical, dx, dy, matrix = None):
+    comp = GlyphComponent()
+    comp.glyphName = canonical
+    comp.x = dx
+    comp.y = dy
+    comp.flags = ROUND_XY_TO_GRID
+    if matrix is not None and matrix != (1, 0, 0, 1):
+        xx, xy, yx, yy = matrix
+        comp.transform = [[xx, xy], [yx, yy]]
+        comp.flags |= UNSCALED_COMPONENT_OFFSET
+
+    reference = Glyph()
+    reference.numberOfContours = -1
+    reference.components = [comp]
+    reference.xMin, reference.yMin, reference.xMax, reference.yMax = glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax
+    return reference
+
+
+# reference_glyph() 가 그리는 윤곽선을 단순 글리프로 (bounds 계산, gsub 모드 lsb, 중복 비교용)
+#   좌표는 합성 글리프와 같게 x' = xx·x + yx·y + dx, y' = xy·x + yy·y + dy
+def transformed_glyph(glyph, transform):
+    xx, xy, yx, yy, dx, dy = transform
+    coords = np.asarray(glyph.coordinates.array, dtype=np.float64).reshape(-1, 2)
+    coords = coords @ np.array([[xx, xy], [yx, yy]]) + (dx, dy)
+
+    result = Glyph()
+    result.coordinates = GlyphCoordinates(coords.tolist())
+    result.endPtsOfContours = list(glyph.endPtsOfContours)
+    result.flags = array("B", glyph.flags)
+    result.numberOfContours = glyph.numberOfContours
+    result.program = ttProgram.Program()
+    result.program.fromBytecode(b"")
+    return result
+
+
+# 저장된 폰트의 참조 글리프 → 윤곽선을 풀어 놓은 단순 글리프 (증분 빌드에서 이전 폰트를 불러올 때)
+def expand_reference(glyf, glyph_name):
+    coords, ends, flags = glyf[glyph_name].getCoordinates(glyf)
+
+    glyph = Glyph()
+    glyph.coordinates = coords
+    glyph.endPtsOfContours = list(ends)
+    glyph.flags = array("B", (flag & 0x01 for flag in flags))
+    glyph.numberOfContours = len(glyph.endPtsOfContours)
+    glyph.program = ttProgram.Program()
+    glyph.program.fromBytecode(b"")
+    return glyph
@@ -0,0 +1,142 @@
+import math
+
+
+TINY_CONTOUR = 4  # 가로 / 세로 모두 허용 오차의 4배 미만인 윤곽은 제거
+
+
+# Cu2QuPen 뒤, TTGlyphPen 앞에서 2차 곡선 윤곽의 점을 줄이는 펜
+#   1) 조절점이 모두 현(시작점 → 끝점)에서 tolerance 이내인 곡선 → 직선
+#   2) 이어지는 직선 구간은 Douglas-Peucker 로 tolerance 이내의 점 제거 (한 직선 위의 점 병합)
+#   3) 가로 / 세로 모두 TINY_CONTOUR × tolerance 미만인 윤곽 제거
+#   곡선 자체의 점 수는 Cu2QuPen 의 max_err 로 줄임 (GlyphBuilder 참고)
+class SimplifyPen:
+    def __init__(self, out_pen, tolerance):
+        self.out_pen = out_pen
+        self.tolerance = tolerance
+
+        self.start = None
+        self.segments = []  # ("line", [끝점]) / ("qcurve", [조절점..., 끝점])
+        self.dropped_contours = 0
+
+    def moveTo(self, pt):
+        self.start = pt
+        self.segments = []
+
+    def lineTo(self, pt):
+        self.segments.append(("line", [pt]))
+
+    def qCurveTo(self, *points):
+        if self.start is None:  # 곡선 점이 없는 윤곽 : 그대로 전달
+            self.out_pen.qCurveTo(*points)
+            return
+        self.segments.append(("qcurve", list(points)))
+
+    def closePath(self):
+        self._flush(closed=True)
+
+    def endPath(self):
+        self._flush(closed=False)
+
+    def addComponent(self, glyph_name, transformation):
+        self.out_pen.addComponent(glyph_name, transformation)
+
+    def _flush(self, closed):
+        start, segments = self.start, self.segments
+        self.start, self.segments = None, []
+
+        if start is None:
+            self._close(closed)
+            return
+
+        if self._is_tiny(start, segments):
+            self.dropped_contours += 1
+            return
+
+        # 닫는 직선도 병합 대상에 포함 (끝점 = 시작점은 TTGlyphPen 이 제거)
+        if closed and segments and segments[-1][1][-1] != start:
+            segments.append(("line", [start]))
+
+        self.out_pen.moveTo(start)
+        for kind, points in self._merge_lines(start, self._flatten(start, segments)):
+            if kind == "line":
+                self.out_pen.lineTo(points[0])
+            else:
+                self.out_pen.qCurveTo(*points)
+        self._close(closed)
+
+    def _close(self, closed):
+        if closed:
+            self.out_pen.closePath()
+        else:
+            self.out_pen.endPath()
+
+    def _is_tiny(self, start, segments):
+        limit = TINY_CONTOUR * self.tolerance
+        xs = [start[0]] + [pt[0] for _, points in segments for pt in points]
+        ys = [start[1]] + [pt[1] for _, points in segments for pt in points]
+        return max(xs) - min(xs) < limit and max(ys) - min(ys) < limit
+
+    # 조절점이 모두 현에 가까운 곡선 → 직선 (곡선은 조절점의 볼록 껍질 안에 있으므로 오차 ≤ tolerance)
+    def _flatten(self, start, segments):
+        result = []
+        current = start
+        for kind, points in segments:
+            end = points[-1]
+            if kind == "qcurve" and all(_distance(pt, current, end) <= self.tolerance for pt in points[:-1]):
+                kind, points = "line", [end]
+            result.append((kind, points))
+            current = end
+        return result
+
+    # 이어지는 직선 끝점들을 Douglas-Peucker 로 줄임, 곡선 끝점은 그대로 유지
+    def _merge_lines(self, start, segments):
+        result = []
+        run = [start]
+
+        for kind, points in segments:
+            if kind == "line":
+                run.append(points[0])
+                continue
+
+            result.extend(("line", [pt]) for pt in _douglas_peucker(run, self.tolerance)[1:])
+            result.append((kind, points))
+            run = [points[-1]]
+
+        result.extend(("line", [pt]) for pt in _douglas_peucker(run, self.tolerance)[1:])
+        return result
+
+
+# 점 → 선분 a-b 거리
+def _distance(pt, a, b):
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length = dx * dx + dy * dy
+    t = 0.0 if length == 0 else max(0.0, min(1.0, ((pt[0] - a[0]) * dx + (pt[1] - a[1]) * dy) / length))
+    return math.hypot(pt[0] - a[0] - t * dx, pt[1] - a[1] - t * dy)
+
+
+# 양 끝점은 유지하고, 남긴 점을 잇는 선분에서 tolerance 이내인 점 제거
+def _douglas_peucker(points, tolerance):
+    if len(points) < 3:
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        index, farthest = first, -1.0
+        for i in range(first + 1, last):
+            distance = _distance(points[i], points[first], points[last])
+            if distance > farthest:
+                index, farthest = i, distance
+
+        if farthest > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [pt for pt, kept in zip(points, keep) if kept]
@@ -1,77 +1,329 @@
 import os
-import subprocess
-from PIL import Image
+import json
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from fontTools.pens.recordingPen import RecordingPen
+
+from .trace_backend import create_trace_backend, outline_to_svg
+from .raster_preprocess import RasterPreprocessor
+from .image_source import open_image_source, SHEET_COLUMNS
+from .build_trace import BuildTrace
+
+
+MANIFEST_FILE = ".manifest.json"
+MANIFEST_VERSION = 1
 
 
 class PngToSvg:
-    def __init__(self, potrace_path, subtask_call = None, progress_call = None):
-        self.potrace_path = potrace_path
+    def __init__(self, potrace_path, jobs = None, threshold = None, denoise = 0, use_cache = True,
+                 use_pipe = True, backend = "potrace", trace = None, executor = None,
+                 sheet_columns = SHEET_COLUMNS, subtask_call = None, progress_call = None):
+        self.backend = create_trace_backend(backend, potrace_path, use_pipe=use_pipe)
+        self.jobs = jobs if jobs else (os.cpu_count() or 1)
+        self.preprocessor = RasterPreprocessor(threshold=threshold, denoise=denoise)  # threshold None : Pillow 기본 흑백 변환
+        self.use_cache = use_cache
+        self.trace = trace if trace else BuildTrace(enabled=False)
+        self.executor = executor  # 여러 폰트를 함께 빌드할 때 공유하는 스레드 풀
+        self.sheet_columns = sheet_columns
+        self.source = None  # 입력 (폴더 / 압축 파일 / 시트), ImageSource
         self.subtask_call = subtask_call if subtask_call else lambda msg : None
         self.progress_call = progress_call if progress_call else lambda cur, tot: None
 
+        self.errors = []  # (파일 이름, 오류 문구)
+        self.warnings = []  # (파일 이름, 경고 문구) : 캔버스 크기, 가장자리
+        self.skipped = []  # 트레이싱하지 않은 빈 이미지
+        self.outlines = {}  # 직접 변환 결과 : 파일 이름(확장자 X) → 펜 명령 목록
+
     def convert_all(self, input_dir, output_dir):
         try:
             self._set_output_dir(output_dir)
-            png_files = self._get_png_files(input_dir)
+            png_files = self._open_source(input_dir).names()
+            total_files = len(png_files)
+            self.errors = []
+
+            if total_files == 0:
+                self.subtask_call("PNG 파일이 없습니다.")
+                return
+
+            self._convert_changed(output_dir, png_files)
+
+        except Exception as e:
+            raise Exception(f"PNG TO SVG : {e}")
+
+        self._report_errors(total_files)
+
+    # SVG 문자열을 거치지 않고 아웃라인(펜 명령)을 메모리에 바로 보관
+    # debug_dir 를 지정하면 확인용 SVG 도 함께 저장
+    def trace_all(self, input_dir, debug_dir = None):
+        try:
+            png_files = self._open_source(input_dir).names()
             total_files = len(png_files)
+            self.errors = []
+            self.outlines = {}
 
             if total_files == 0:
                 self.subtask_call("PNG 파일이 없습니다.")
                 return
 
-            for i, file in enumerate(png_files):
-                png_path = os.path.join(input_dir, file)
-                svg_file = os.path.splitext(file)[0] + ".svg"
-                svg_path = os.path.join(output_dir, svg_file)
+            if debug_dir is not None:
+                self._set_output_dir(debug_dir)
+
+            tasks = []
+            for file in png_files:
+                svg_path = os.path.join(debug_dir, self._svg_name(file)) if debug_dir else None
+                tasks.append((file, self.source.location(file), svg_path))
+
+            results = self._run_tasks(self._trace_file, tasks, 0, total_files)
+            for file, outline in results.items():
+                self.outlines[os.path.splitext(file)[0]] = outline
 
-                self._convert_file(png_path, svg_path)
+        except Exception as e:
+            raise Exception(f"PNG TO SVG : {e}")
+
+        self._report_errors(total_files)
+
+    # 지정한 PNG 만 다시 변환 (감시 모드), 삭제된 PNG 는 SVG 와 manifest 항목도 삭제
+    def convert_files(self, input_dir, output_dir, png_files):
+        try:
+            self._set_output_dir(output_dir)
+            source = self._open_source(input_dir)
+            recorded = self._load_manifest(output_dir)["files"]
+            files = dict(recorded)
+            hashes = {}
+            tasks = []
+            self.errors = []
+
+            for file in png_files:
+                svg_path = os.path.join(output_dir, self._svg_name(file))
+                files.pop(file, None)
+
+                if source.exists(file):
+                    hashes[file] = source.digest(file)
+                    tasks.append((file, source.location(file), svg_path))
+                elif os.path.exists(svg_path):
+                    os.remove(svg_path)
+
+            results = self._run_tasks(self._convert_file, tasks, 0, len(tasks))
+            for file in results:
+                files[file] = hashes[file]
+            self._remove_stale_svg_files(tasks, results, recorded, hashes)
+            self._save_manifest(output_dir, files)
 
-                self.progress_call(i + 1, total_files)
+        except Exception as e:
+            raise Exception(f"PNG TO SVG : {e}")
+
+        self._report_errors(len(tasks))
+
+    # 지정한 PNG 만 다시 트레이싱 (--direct 감시 모드), 삭제된 PNG 는 아웃라인도 삭제
+    def trace_files(self, input_dir, png_files, debug_dir = None):
+        try:
+            source = self._open_source(input_dir)
+            tasks = []
+            self.errors = []
+
+            for file in png_files:
+                self.outlines.pop(os.path.splitext(file)[0], None)
+                svg_path = os.path.join(debug_dir, self._svg_name(file)) if debug_dir else None
+                if source.exists(file):
+                    tasks.append((file, source.location(file), svg_path))
+
+            results = self._run_tasks(self._trace_file, tasks, 0, len(tasks))
+            for file, outline in results.items():
+                self.outlines[os.path.splitext(file)[0]] = outline
 
         except Exception as e:
             raise Exception(f"PNG TO SVG : {e}")
 
+        self._report_errors(len(tasks))
+
+    def _convert_changed(self, output_dir, png_files):
+        total_files = len(png_files)
+        manifest = self._load_manifest(output_dir)
+        cached = manifest["files"] if self.use_cache else {}
+        hashes = {}
+        files = {}  # 변환 결과가 유효한 파일 → 해시
+        tasks = []
+
+        for file in png_files:
+            svg_path = os.path.join(output_dir, self._svg_name(file))
+            hashes[file] = self.source.digest(file)
+
+            if cached.get(file) == hashes[file] and os.path.exists(svg_path):
+                files[file] = hashes[file]
+            else:
+                tasks.append((file, self.source.location(file), svg_path))
+
+        hits = len(files)
+        self.trace.count("svg_cache_hits", hits)
+        if hits:
+            self.progress_call(hits, total_files)
+
+        results = self._run_tasks(self._convert_file, tasks, hits, total_files)
+        for file in results:
+            files[file] = hashes[file]
+        self._remove_stale_svg_files(tasks, results, manifest["files"], hashes)
+
+        pruned = self._prune_svg_files(manifest["files"], hashes, output_dir)
+        self._save_manifest(output_dir, files)
+
+        self.subtask_call(f"캐시 적중 {hits}개 / 변환 {len(tasks)}개 / 삭제 {pruned}개")
+
+    # PNG 는 묶음 단위로 전처리(RasterPreprocessor) 후 트레이싱 작업으로 제출
+    #   압축 / 시트 입력은 메모리에 읽어 둔 내용을 그대로 전처리에 넘김 (파일을 풀지 않음)
+    # potrace 는 별도 프로세스, NumPy 연산은 GIL 을 놓으므로 스레드 풀로도 코어를 사용
+    #   빈 이미지는 트레이싱하지 않고 이전 변환 결과(SVG)도 삭제
+    def _run_tasks(self, worker, tasks, done, total):
+        results = {}
+        self.warnings = []
+        self.skipped = []
+
+        pool = nullcontext(self.executor) if self.executor else ThreadPoolExecutor(max_workers=self.jobs)
+        with pool as executor:
+            futures = {}
+            prepared = self.preprocessor.process([file for file, _, _ in tasks], executor, opener=self.source.load)
+
+            for (file, png_path, out_path), (_, bitmap, _, warning, error) in zip(tasks, prepared):
+                if warning is not None:
+                    self.warnings.append((file, warning))
+                if error is not None:
+                    self.errors.append((file, error))
+                    self.trace.count("trace_errors")
+                elif bitmap is None:
+                    self.skipped.append(file)
+                    self.trace.count("blank_images")
+                    if out_path is not None and os.path.exists(out_path):
+                        os.remove(out_path)
+                else:
+                    future = self.trace.submit(executor, "trace", file, worker, png_path, bitmap, out_path)
+                    futures[future] = file
+                    continue
+
+                done += 1
+                self.progress_call(done, total)
+
+            for future in as_completed(futures):
+                file = futures[future]
+                try:
+                    results[file] = future.result()
+                    self.trace.count("traced")
+                except Exception as e:
+                    self.errors.append((file, str(e)))
+                    self.trace.count("trace_errors")
+
+                done += 1
+                self.progress_call(done, total)
+
+        self._report_preprocess()
+        return results
+
+    def _report_preprocess(self):
+        if self.skipped:
+            self.subtask_call(f"빈 이미지 {len(self.skipped)}개 건너뜀 : {', '.join(sorted(self.skipped)[:5])}")
+
+        if self.warnings:
+            self.trace.count("canvas_warnings", len(self.warnings))
+            self.subtask_call(f"이미지 경고 {len(self.warnings)}개")
+            for file, msg in sorted(self.warnings)[:10]:
+                self.subtask_call(f"{file} : {msg}")
+
+    def _report_errors(self, total_files):
+        if not self.errors:
+            return
+
+        self.errors.sort()
+        if len(self.errors) == total_files:
+            raise Exception(f"PNG TO SVG : {self.errors[0][1]}")
+
+        self.subtask_call(f"{len(self.errors)}/{total_files}개 파일 변환 실패")
+        for file, msg in self.errors:
+            self.subtask_call(f"{file} : {msg}")
+
+    # 변환 결과에 영향을 주는 설정, 달라지면 캐시 전체 무효
+    def _cache_settings(self):
+        return {
+            "backend": self.backend.settings(),
+            **self.preprocessor.settings(),
+        }
+
+    def _load_manifest(self, output_dir):
+        manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+        empty = {"version": MANIFEST_VERSION, "settings": self._cache_settings(), "files": {}}
+
+        if not os.path.exists(manifest_path):
+            return empty
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return empty
+
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("settings") != self._cache_settings():
+            return empty
+        return manifest
+
+    def _save_manifest(self, output_dir, files):
+        manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+        temp_path = manifest_path + ".tmp"
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "settings": self._cache_settings(),
+            "files": dict(sorted(files.items())),
+        }
+
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(temp_path, manifest_path)
+
+    # PNG 가 삭제된 SVG 정리 (manifest 에 기록된 파일만)
+    def _prune_svg_files(self, manifest_files, hashes, output_dir):
+        pruned = 0
+        for file in manifest_files:
+            if file in hashes:
+                continue
+
+            svg_path = os.path.join(output_dir, self._svg_name(file))
+            if os.path.exists(svg_path):
+                os.remove(svg_path)
+                pruned += 1
+        return pruned
+
+    # 원본 PNG 가 바뀌었는데 다시 변환하지 못한 파일의 이전 SVG 삭제 (바뀌기 전 모양으로 폰트가 만들어지지 않도록)
+    #   manifest 해시가 없으면 원본이 바뀌었는지 알 수 없으므로 SVG 를 그대로 둠
+    def _remove_stale_svg_files(self, tasks, results, recorded, hashes):
+        removed = []
+        for file, _, svg_path in tasks:
+            if file in results or recorded.get(file) in (None, hashes[file]):
+                continue
+            if os.path.exists(svg_path):
+                os.remove(svg_path)
+                removed.append(file)
+
+        if removed:
+            self.subtask_call(f"변환 실패로 이전 SVG {len(removed)}개 삭제 : {', '.join(sorted(removed)[:5])}")
+
+    def _svg_name(self, png_file):
+        return os.path.splitext(png_file)[0] + ".svg"
+
     def _set_output_dir(self, output_dir):
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-    def _get_png_files(self, input_dir):
-        png_files = []
-        for filename in os.listdir(input_dir):
-            if filename.endswith(".png"):
-                png_files.append(filename)
-        return png_files
+    def _open_source(self, input_path):
+        self.source = open_image_source(input_path, self.sheet_columns)
+        return self.source
 
-    def _convert_file(self, input_path, output_path):
-        bmp_path = os.path.splitext(output_path)[0] + ".temp.bmp"
+    def _convert_file(self, input_path, bitmap, output_path):
+        svg_text = self.backend.trace_svg(input_path, bitmap)
 
-        try:
-            img = Image.open(input_path)
-            img.convert("1").save(bmp_path)
-
-            command = [
-                self.potrace_path,
-                bmp_path,
-                "-s",
-                "-o", output_path,
-                "--unit", "1",
-                "-t", "2"
-            ]
-
-            subprocess.run(command, check=True, capture_output=True, text=True,
-                           encoding="utf-8", timeout=20)
-        except subprocess.TimeoutExpired:
-            error_msg = f"'{input_path}' - 변환 시간 초과(20초)"
-            raise Exception(error_msg)
-        except FileNotFoundError:
-            error_msg = f"Potrace('{self.potrace_path}') 실행 불가, README.md를 확인해주세요."
-            raise Exception(error_msg)
-        except subprocess.CalledProcessError as e:
-            error_msg = f"{input_path} 변환 실패 : {e.stderr}"
-            raise Exception(error_msg)
-        finally:
-            if os.path.exists(bmp_path):
-                try:
-                    os.remove(bmp_path)
-                except PermissionError:
-                    pass
\ No newline at end of file
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(svg_text)
+
+    def _trace_file(self, input_path, bitmap, debug_path):
+        pen = RecordingPen()
+        self.backend.draw(input_path, bitmap, pen)
+
+        if debug_path is not None:
+            with open(debug_path, "w", encoding="utf-8") as f:
+                f.write(outline_to_svg(pen.value, *bitmap.size))
+        return pen.value
@@ -0,0 +1,104 @@
+import os
+import numpy as np
+from PIL import Image
+
+from .image_source import SHEET_COLUMNS, open_image_source
+from .syllable_layout import JAMO_MAP, SYLLABLE_BASE, SYLLABLE_COUNT, SYLLABLE_COMPONENTS
+
+
+JAMO_NAMES = {chr(code): name for code, name in JAMO_MAP.items()}
+
+MISSING_COLOR = (255, 220, 220)  # 부품이 빠진 칸 배경
+
+
+# 폰트를 빌드하지 않고 부품 PNG 를 바로 겹쳐 문장 미리보기 이미지 생성
+#   음절 → (초성, 중성, 종성) 부품은 빌드와 같은 SYLLABLE_COMPONENTS 사용
+#   부품은 칸 크기로 줄인 잉크 농도(0~1) 배열로 한 번만 읽어 보관
+#   한 줄의 모든 칸을 한 번에 합성 : 1 - Π(1 - 잉크)
+class SyllablePreview:
+    def __init__(self, image_dir, cell_size = 128, columns = 20, sheet_columns = SHEET_COLUMNS, subtask_call = None):
+        self.image_dir = image_dir
+        self.source = open_image_source(image_dir, sheet_columns)  # 폴더 / 압축 파일 / 시트 PNG
+        self.cell_size = cell_size
+        self.columns = columns
+        self.subtask_call = subtask_call if subtask_call else lambda msg : None
+
+        self.cache = {}  # 부품 이름 → 잉크 배열 [cell, cell] (없으면 None)
+        self.missing = set()  # 빠진 부품 이름
+
+    def render(self, text, output_path):
+        try:
+            lines = self._layout(text)
+            rows = [self._render_row(cells) for cells in lines]
+            sheet = np.concatenate(rows) if rows else np.full((self.cell_size, self.cell_size, 3), 255, np.uint8)
+
+            directory = os.path.dirname(output_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            Image.fromarray(sheet).save(output_path)
+
+        except Exception as e:
+            raise Exception(f"Preview : {e}")
+
+        cell_count = sum(len(cells) for cells in lines)
+        self.subtask_call(f"{cell_count}칸 / 부품 {len(self.cache)}개 → {output_path}")
+        if self.missing:
+            self.subtask_call(f"빠진 부품 {len(self.missing)}개 : {', '.join(sorted(self.missing)[:10])}")
+
+    # 문자마다 부품 이름 목록, 줄바꿈 / columns 칸마다 다음 줄
+    def _layout(self, text):
+        lines = []
+        for line in text.splitlines() or [""]:
+            cells = [self._components(char) for char in line]
+            lines.extend(cells[i:i + self.columns] for i in range(0, max(len(cells), 1), self.columns))
+        return lines
+
+    def _components(self, char):
+        offset = ord(char) - SYLLABLE_BASE
+        if 0 <= offset < SYLLABLE_COUNT:
+            return [name for name in SYLLABLE_COMPONENTS[offset] if name]
+        if char in JAMO_NAMES:
+            return [JAMO_NAMES[char]]
+        return []  # 공백, 한글이 아닌 문자 : 빈 칸
+
+    def _render_row(self, cells):
+        size = self.cell_size
+        names = sorted({name for components in cells for name in components})
+        index = {name: i for i, name in enumerate(names)}
+
+        # 부품 배열 마지막 칸은 빈 부품 (참조 없음)
+        stack = np.zeros((len(names) + 1, size, size), dtype=np.float32)
+        for name, i in index.items():
+            ink = self._load(name)
+            if ink is not None:
+                stack[i] = ink
+
+        refs = np.full((self.columns, 3), len(names), dtype=np.int64)
+        missing = np.zeros(self.columns, dtype=bool)
+        for col, components in enumerate(cells):
+            refs[col, :len(components)] = [index[name] for name in components]
+            missing[col] = any(self._load(name) is None for name in components)
+
+        ink = 1 - np.prod(1 - stack[refs], axis=1)  # [columns, size, size]
+
+        background = np.where(missing[:, None], MISSING_COLOR, 255).astype(np.float32)  # [columns, 3]
+        cell_pixels = background[:, None, None, :] * (1 - ink[..., None])
+        row = cell_pixels.transpose(1, 0, 2, 3).reshape(size, self.columns * size, 3)
+        return np.rint(row).astype(np.uint8)
+
+    # PNG → 칸 크기 잉크 농도 배열 : 검정 = 1, 흰색 / 투명 = 0
+    def _load(self, name):
+        if name in self.cache:
+            return self.cache[name]
+
+        ink = None
+        if self.source.exists(name + ".png"):
+            with self.source.image(name + ".png") as img:
+                img = img.convert("LA").resize((self.cell_size, self.cell_size), Image.LANCZOS)
+            pixels = np.asarray(img, dtype=np.float32) / 255
+            ink = (1 - pixels[..., 0]) * pixels[..., 1]
+        else:
+            self.missing.add(name)
+
+        self.cache[name] = ink
+        return ink
@@ -0,0 +1,116 @@
+import numpy as np
+from PIL import Image
+
+
+CANVAS_SIZE = (1000, 1000)  # README 데이터 규칙 (가로, 세로)
+BATCH_SIZE = 32
+
+
+# 트레이싱 전 PNG 전처리 : 여러 장을 NumPy 배열로 묶어 한 번에 처리
+#   threshold : None 이면 Pillow 기본 흑백 변환 (디더링), 값이 있으면 밝기 < threshold 를 잉크로
+#   denoise   : 0 이 아니면 주변 8칸 중 잉크가 denoise 칸 미만인 잉크 점은 지우고,
+#               8 - denoise 칸 초과인 빈 점은 채움 (티끌 / 바늘구멍 제거)
+#   빈 이미지는 트레이싱하지 않고, 캔버스 크기가 다르거나 잉크가 가장자리에 닿으면 경고
+class RasterPreprocessor:
+    def __init__(self, threshold = None, denoise = 0, canvas_size = CANVAS_SIZE, batch_size = BATCH_SIZE):
+        self.threshold = threshold
+        self.denoise = denoise
+        self.canvas_size = canvas_size
+        self.batch_size = batch_size
+
+    # 결과에 영향을 주는 설정, 달라지면 SVG 캐시 전체 무효
+    def settings(self):
+        return {
+            "threshold": self.threshold,
+            "denoise": self.denoise,
+        }
+
+    # paths 순서대로 (경로, 1비트 이미지, 잉크 bbox (x0, y0, x1, y1), 경고 문구, 오류 문구)
+    #   paths : 파일 경로, 파일 객체 (압축 입력) 또는 Pillow 이미지 (시트 입력)
+    #   opener : 지정하면 묶음마다 opener(path) 로 위 입력을 만듦 (ImageSource.load, 묶음 단위로만 메모리에 둠)
+    #   빈 이미지 / 읽기 실패는 1비트 이미지와 bbox 가 None
+    #   executor : PNG 디코딩에 사용할 스레드 풀 (Pillow 는 디코딩 중 GIL 을 놓음)
+    def process(self, paths, executor = None, opener = None):
+        load = executor.map if executor is not None else map
+
+        for start in range(0, len(paths), self.batch_size):
+            batch = paths[start:start + self.batch_size]
+            inks = list(load(self._try_load, batch, [opener] * len(batch)))
+
+            results = [None] * len(batch)
+            for i, ink in enumerate(inks):
+                if isinstance(ink, Exception):
+                    results[i] = (batch[i], None, None, None, f"{ink}")
+
+            for shape in {ink.shape for ink in inks if not isinstance(ink, Exception)}:
+                indices = [i for i, ink in enumerate(inks)
+                           if not isinstance(ink, Exception) and ink.shape == shape]
+                stack = np.stack([inks[i] for i in indices])
+                if self.denoise:
+                    stack = self._denoise(stack)
+
+                for i, ink, bbox in zip(indices, stack, self._bounding_boxes(stack)):
+                    results[i] = self._result(batch[i], ink, bbox)
+
+            yield from results
+
+    def _result(self, path, ink, bbox):
+        height, width = ink.shape
+        if bbox is None:
+            return path, None, None, None, None
+
+        warning = None
+        if (width, height) != self.canvas_size:
+            warning = f"캔버스 크기 {width}x{height} (규칙 {self.canvas_size[0]}x{self.canvas_size[1]})"
+        elif bbox[0] == 0 or bbox[1] == 0 or bbox[2] == width or bbox[3] == height:
+            warning = "잉크가 캔버스 가장자리에 닿음"
+
+        return path, Image.fromarray(~ink), bbox, warning, None
+
+    def _try_load(self, path, opener = None):
+        try:
+            return self._load(opener(path) if opener is not None else path)
+        except Exception as e:
+            return e
+
+    # 잉크 = True, 투명 배경은 흰색 위에 합성
+    def _load(self, path):
+        if isinstance(path, Image.Image):
+            return self._to_ink(path)
+
+        with Image.open(path) as img:
+            return self._to_ink(img)
+
+    def _to_ink(self, img):
+        if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+            img = Image.alpha_composite(Image.new("RGBA", img.size, "white"), img.convert("RGBA"))
+
+        if self.threshold is None:
+            return ~np.asarray(img.convert("1"))
+        return np.asarray(img.convert("L")) < self.threshold
+
+    def _denoise(self, stack):
+        padded = np.pad(stack, ((0, 0), (1, 1), (1, 1))).astype(np.uint8)
+        height, width = stack.shape[1:]
+
+        neighbors = np.zeros(stack.shape, dtype=np.uint8)
+        for dy in range(3):
+            for dx in range(3):
+                if dy != 1 or dx != 1:
+                    neighbors += padded[:, dy:dy + height, dx:dx + width]
+
+        return np.where(stack, neighbors >= self.denoise, neighbors > 8 - self.denoise)
+
+    # 이미지마다 잉크 bbox (x0, y0, x1, y1), 잉크가 없으면 None
+    def _bounding_boxes(self, stack):
+        rows = stack.any(axis=2)
+        cols = stack.any(axis=1)
+        found = rows.any(axis=1)
+
+        y0 = rows.argmax(axis=1)
+        y1 = rows.shape[1] - rows[:, ::-1].argmax(axis=1)
+        x0 = cols.argmax(axis=1)
+        x1 = cols.shape[1] - cols[:, ::-1].argmax(axis=1)
+
+        return [(int(x0[i]), int(y0[i]), int(x1[i]), int(y1[i])) if found[i] else None
+                for i in range(len(stack))]
@@ -77,3 +77,72 @@ VOWEL_TYPE_HORIZONTAL_IDX = {8, 12, 13, 17, 18}
 # 복합 모음 (Type 3, 6)
 VOWEL_TYPE_MIXED_IDX = {9, 10, 11, 14, 15, 16, 19}
 # (ㅘ, ㅙ, ㅚ, ㅝ, ㅞ, ㅟ, ㅢ)
+
+
+# 한글 음절 (U+AC00 ~ U+D7A3)
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_COUNT = 11172
+
+
+def get_layout_type(v_idx, t_idx) -> int:
+    if t_idx == 0:
+        if v_idx in VOWEL_TYPE_HORIZONTAL_IDX:
+            return 2
+        if v_idx in VOWEL_TYPE_MIXED_IDX:
+            return 3
+        return 1
+    else:
+        if v_idx in VOWEL_TYPE_HORIZONTAL_IDX:
+            return 5
+        if v_idx in VOWEL_TYPE_MIXED_IDX:
+            return 6
+        return 4
+
+
+# 음절 오프셋 → (초성, 중성, 종성 인덱스, 레이아웃 타입)
+SYLLABLE_TABLE = [
+    (i // 588, (i // 28) % 21, i % 28, get_layout_type((i // 28) % 21, i % 28))
+    for i in range(SYLLABLE_COUNT)
+]
+
+# 음절 오프셋 → (초성, 중성, 종성 부품 이름), 종성이 없으면 None
+SYLLABLE_COMPONENTS = [
+    (f"L_{l_idx}_type{layout_type}",
+     f"V_{v_idx}_type{layout_type}",
+     f"T_{t_idx}_type{layout_type}" if t_idx > 0 else None)
+    for l_idx, v_idx, t_idx, layout_type in SYLLABLE_TABLE
+]
+
+
+# 부품 파일 이름 (README 명명 규칙)
+def leading_component_names():
+    return [f"L_{l_idx}_type{layout_type}"
+            for l_idx in range(len(LEADING_CONSONANTS))
+            for layout_type in range(1, 7)]
+
+
+def vowel_component_names():
+    names = []
+    for v_idx in range(len(VOWELS)):
+        types_to_build = []
+        if v_idx in VOWEL_TYPE_VERTICAL_IDX:
+            types_to_build = [1, 4]
+        elif v_idx in VOWEL_TYPE_HORIZONTAL_IDX:
+            types_to_build = [2, 5]
+        elif v_idx in VOWEL_TYPE_MIXED_IDX:
+            types_to_build = [3, 6]
+
+        names.extend(f"V_{v_idx}_type{layout_type}" for layout_type in types_to_build)
+    return names
+
+
+def trailing_component_names():
+    return [f"T_{t_idx}_type{layout_type}"
+            for t_idx in range(1, len(TRAILING_CONSONANTS))
+            for layout_type in range(4, 7)]
+
+
+# 빌드에 필요한 모든 부품 파일 이름 (자모 + 초성 / 중성 / 종성)
+def component_names():
+    return (list(JAMO_MAP.values()) + leading_component_names()
+            + vowel_component_names() + trailing_component_names())
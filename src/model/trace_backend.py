@@ -0,0 +1,327 @@
+import io
+import os
+import tempfile
+import subprocess
+
+import numpy as np
+from fontTools.pens.recordingPen import RecordingPen, replayRecording
+from fontTools.pens.svgPathPen import SVGPathPen
+
+from .glyph_builder import GlyphBuilder
+
+
+POTRACE_ARGS = ["--unit", "1", "-t", "2"]
+
+SVG_TEMPLATE = """<?xml version="1.0" standalone="no"?>
+<svg version="1.0" xmlns="http://www.w3.org/2000/svg"
+ width="{width}.000000pt" height="{height}.000000pt" viewBox="0 0 {width}.000000 {height}.000000"
+ preserveAspectRatio="xMidYMid meet">
+<g transform="translate(0.000000,{height}.000000) scale(1.000000,-1.000000)"
+fill="#000000" stroke="none">
+<path d="{path}"/>
+</g>
+</svg>
+"""
+
+
+# 트레이싱 백엔드 : 1비트 비트맵 → 아웃라인
+#   trace_svg : potrace 형식의 SVG 문자열
+#   draw      : 폰트 좌표계(y 위쪽)의 아웃라인을 펜에 직접 그림
+class PotraceBackend:
+    name = "potrace"
+
+    def __init__(self, potrace_path, use_pipe = True, upm: int = 1000):
+        self.potrace_path = potrace_path
+        self.use_pipe = use_pipe
+        self.upm = upm
+
+    def settings(self) -> dict:
+        return {"name": self.name, "potrace_args": POTRACE_ARGS}
+
+    def trace_svg(self, input_path, bitmap) -> str:
+        if self.use_pipe:
+            return self._trace_pipe(input_path, bitmap)
+        return self._trace_temp_file(input_path, bitmap)
+
+    def draw(self, input_path, bitmap, pen):
+        svg_text = self.trace_svg(input_path, bitmap)
+        GlyphBuilder(self.upm).draw_svg_text(svg_text, pen)  # 작업 스레드마다 별도 파서
+
+    # 비트맵을 PBM 으로 potrace stdin 에 전달, SVG 는 stdout 으로 받음 (임시 파일 없음)
+    def _trace_pipe(self, input_path, bitmap):
+        buffer = io.BytesIO()
+        bitmap.save(buffer, format="PPM")  # 1비트 이미지 → PBM(P4)
+
+        command = [
+            self.potrace_path,
+            "-",
+            "-s",
+            "-o", "-",
+            *POTRACE_ARGS
+        ]
+
+        result = self._run_potrace(input_path, command, input=buffer.getvalue())
+        return result.stdout.decode("utf-8")
+
+    def _trace_temp_file(self, input_path, bitmap):
+        bmp_path = os.path.splitext(input_path)[0] + f".{os.getpid()}.temp.bmp"
+        if not os.path.isdir(os.path.dirname(bmp_path) or "."):  # 압축 / 시트 입력 : 임시 폴더 사용
+            bmp_path = os.path.join(tempfile.gettempdir(), os.path.basename(bmp_path))
+
+        try:
+            bitmap.save(bmp_path)
+
+            command = [
+                self.potrace_path,
+                bmp_path,
+                "-s",
+                "-o", "-",
+                *POTRACE_ARGS
+            ]
+
+            result = self._run_potrace(input_path, command)
+            return result.stdout.decode("utf-8")
+        finally:
+            if os.path.exists(bmp_path):
+                try:
+                    os.remove(bmp_path)
+                except PermissionError:
+                    pass
+
+    def _run_potrace(self, input_path, command, input = None):
+        try:
+            return subprocess.run(command, input=input, check=True, capture_output=True,
+                                  timeout=20)
+        except subprocess.TimeoutExpired:
+            error_msg = f"'{input_path}' - 변환 시간 초과(20초)"
+            raise Exception(error_msg)
+        except FileNotFoundError:
+            error_msg = f"Potrace('{self.potrace_path}') 실행 불가, README.md를 확인해주세요."
+            raise Exception(error_msg)
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode("utf-8", errors="replace") if e.stderr else ""
+            error_msg = f"{input_path} 변환 실패 : {stderr}"
+            raise Exception(error_msg)
+
+
+# 외부 프로그램 없이 NumPy 로 윤곽선 추출 + 베지어 곡선 맞춤
+#   1. 픽셀 경계 edge 를 한 번에 계산하고 다음 edge 를 정렬 + 이진 탐색으로 연결
+#   2. 방향이 바뀌는 꼭짓점만 남긴 뒤 Douglas-Peucker 로 계단 제거
+#   3. potrace 의 smooth 단계와 같은 방식으로 꼭짓점마다 모서리 / 곡선 결정
+class NumpyTraceBackend:
+    name = "numpy"
+
+    # 방향 : 0 = +x, 1 = +y, 2 = -x, 3 = -y (y 위쪽 좌표계)
+    DIRECTION_STEP = np.array([[1, 0], [0, 1], [-1, 0], [0, -1]])
+
+    def __init__(self, turdsize: int = 2, tolerance: float = 1.5, alphamax: float = 1.0):
+        self.turdsize = turdsize
+        self.tolerance = tolerance
+        self.alphamax = alphamax
+
+    def settings(self) -> dict:
+        return {
+            "name": self.name,
+            "turdsize": self.turdsize,
+            "tolerance": self.tolerance,
+            "alphamax": self.alphamax,
+        }
+
+    def trace_svg(self, input_path, bitmap) -> str:
+        pen = RecordingPen()
+        self.draw(input_path, bitmap, pen)
+        return outline_to_svg(pen.value, *bitmap.size)
+
+    def draw(self, input_path, bitmap, pen):
+        for contour in self.trace_polygons(bitmap):
+            self._draw_contour(self._smooth(contour), pen)
+
+    # 비트맵 → 꼭짓점 배열 목록 (시계 방향 = 바깥 윤곽, 반시계 = 구멍)
+    def trace_polygons(self, bitmap) -> list:
+        ink = ~np.asarray(bitmap, dtype=bool)[::-1]  # 검정 = 잉크, 행 번호 = y 좌표
+        height, width = ink.shape
+
+        padded = np.zeros((height + 2, width + 2), dtype=bool)
+        padded[1:-1, 1:-1] = ink
+
+        starts, directions = self._find_edges(padded)
+        if len(starts) == 0:
+            return []
+
+        polygons = []
+        for cycle in self._link_edges(starts, directions, width + 3):
+            cycle_dirs = directions[cycle]
+            turns = cycle_dirs != np.roll(cycle_dirs, 1)
+            corners = starts[cycle[turns]] - 1  # 패딩 보정
+
+            if abs(self._area(corners)) <= self.turdsize:
+                continue
+            polygons.append(self._simplify(corners.astype(float)))
+
+        return polygons
+
+    # 잉크를 오른쪽에 두고 도는 경계 edge (시작점, 방향)
+    def _find_edges(self, padded):
+        # 세로 경계 : x = c 에서 왼쪽 padded[r, c-1], 오른쪽 padded[r, c]
+        left, right = padded[:, :-1], padded[:, 1:]
+        r_up, c_up = np.nonzero(right & ~left)
+        r_down, c_down = np.nonzero(left & ~right)
+
+        # 가로 경계 : y = r 에서 아래 padded[r-1, c], 위 padded[r, c]
+        below, above = padded[:-1, :], padded[1:, :]
+        r_east, c_east = np.nonzero(below & ~above)
+        r_west, c_west = np.nonzero(above & ~below)
+
+        starts = np.concatenate([
+            np.stack([c_east, r_east + 1], axis=1),
+            np.stack([c_up + 1, r_up], axis=1),
+            np.stack([c_west + 1, r_west + 1], axis=1),
+            np.stack([c_down + 1, r_down + 1], axis=1),
+        ])
+        directions = np.concatenate([
+            np.full(len(r_east), 0), np.full(len(r_up), 1),
+            np.full(len(r_west), 2), np.full(len(r_down), 3),
+        ])
+        return starts, directions
+
+    def _link_edges(self, starts, directions, stride):
+        ends = starts + self.DIRECTION_STEP[directions]
+        start_ids = starts[:, 1] * stride + starts[:, 0]
+        end_ids = ends[:, 1] * stride + ends[:, 0]
+
+        order = np.lexsort((directions, start_ids))
+        sorted_ids = start_ids[order]
+        first = np.searchsorted(sorted_ids, end_ids, side="left")
+        count = np.searchsorted(sorted_ids, end_ids, side="right") - first
+
+        # 대각선으로 맞닿은 픽셀(나가는 edge 2개)은 오른쪽으로 꺾어 서로 분리
+        next_edge = order[first]
+        saddle = count == 2
+        if saddle.any():
+            right_turn = (directions[saddle] + 3) % 4
+            candidate = order[first[saddle] + 1]
+            pick_second = directions[candidate] == right_turn
+            next_edge[saddle] = np.where(pick_second, candidate, next_edge[saddle])
+
+        next_list = next_edge.tolist()
+        visited = bytearray(len(next_list))
+        cycles = []
+
+        for begin in range(len(next_list)):
+            if visited[begin]:
+                continue
+            cycle = []
+            edge = begin
+            while not visited[edge]:
+                visited[edge] = 1
+                cycle.append(edge)
+                edge = next_list[edge]
+            cycles.append(np.array(cycle))
+
+        return cycles
+
+    def _area(self, points):
+        x, y = points[:, 0], points[:, 1]
+        return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+    # 닫힌 다각형 Douglas-Peucker (계단 모양 제거)
+    def _simplify(self, points):
+        if len(points) <= 4:
+            return points
+
+        # 첫 점에서 가장 먼 점으로 나눠 두 개의 열린 경로로 처리
+        far = int(np.argmax(np.sum((points - points[0]) ** 2, axis=1)))
+        ring = np.vstack([points, points[:1]])
+        keep = np.zeros(len(ring), dtype=bool)
+        keep[[0, far, len(ring) - 1]] = True
+
+        stack = [(0, far), (far, len(ring) - 1)]
+        while stack:
+            first, last = stack.pop()
+            if last - first < 2:
+                continue
+
+            segment = ring[first + 1:last]
+            start, end = ring[first], ring[last]
+            chord = end - start
+            length = np.hypot(chord[0], chord[1])
+            offsets = segment - start
+            if length == 0:
+                dist = np.hypot(offsets[:, 0], offsets[:, 1])
+            else:
+                dist = np.abs(chord[0] * offsets[:, 1] - chord[1] * offsets[:, 0]) / length
+
+            index = int(np.argmax(dist))
+            if dist[index] > self.tolerance:
+                split = first + 1 + index
+                keep[split] = True
+                stack.append((first, split))
+                stack.append((split, last))
+
+        return ring[keep][:-1]
+
+    # potrace smooth() : 꼭짓점 j 를 앞뒤 변의 중점 사이 곡선 또는 모서리로 변환
+    def _smooth(self, vertex):
+        prev_v = np.roll(vertex, 1, axis=0)
+        next_v = np.roll(vertex, -1, axis=0)
+        mid_prev = (prev_v + vertex) / 2
+        mid_next = (vertex + next_v) / 2
+
+        chord = next_v - prev_v
+        denom = np.sign(chord[:, 0]) * chord[:, 0] + np.sign(chord[:, 1]) * chord[:, 1]
+        cross = (vertex[:, 0] - prev_v[:, 0]) * chord[:, 1] - (vertex[:, 1] - prev_v[:, 1]) * chord[:, 0]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dd = np.abs(cross / denom)
+            alpha = np.where(dd > 1, 1 - 1 / dd, 0) / 0.75
+        alpha = np.where(denom == 0, 4 / 3, alpha)
+
+        corner = alpha >= self.alphamax
+        alpha = np.clip(alpha, 0.55, 1)[:, None]
+        ctrl1 = prev_v + (0.5 + 0.5 * alpha) * (vertex - prev_v)
+        ctrl2 = next_v + (0.5 + 0.5 * alpha) * (vertex - next_v)
+
+        return mid_prev, vertex, ctrl1, ctrl2, mid_next, corner
+
+    def _draw_contour(self, smoothed, pen):
+        mid_prev, vertex, ctrl1, ctrl2, mid_next, corner = smoothed
+        if len(vertex) < 3:
+            return
+
+        to_point = lambda p: (float(p[0]), float(p[1]))
+        pen.moveTo(to_point(mid_prev[0]))
+
+        for i, is_corner in enumerate(corner.tolist()):
+            if is_corner:
+                pen.lineTo(to_point(vertex[i]))
+                pen.lineTo(to_point(mid_next[i]))
+            else:
+                pen.curveTo(to_point(ctrl1[i]), to_point(ctrl2[i]), to_point(mid_next[i]))
+
+        pen.closePath()
+
+
+# 폰트 좌표계 아웃라인 → potrace 와 같은 구조의 SVG
+def outline_to_svg(outline, width, height) -> str:
+    svg_pen = SVGPathPen(None, ntos=_format_number)
+    replayRecording(outline, svg_pen)
+    return SVG_TEMPLATE.format(width=width, height=height, path=svg_pen.getCommands())
+
+
+def _format_number(value):
+    value = round(value, 2)
+    return str(int(value)) if value == int(value) else str(value)
+
+
+TRACE_BACKENDS = {
+    PotraceBackend.name: PotraceBackend,
+    NumpyTraceBackend.name: NumpyTraceBackend,
+}
+
+
+def create_trace_backend(name, potrace_path = None, use_pipe = True):
+    if name == PotraceBackend.name:
+        return PotraceBackend(potrace_path, use_pipe=use_pipe)
+    if name == NumpyTraceBackend.name:
+        return NumpyTraceBackend()
+    raise Exception(f"트레이싱 백엔드 '{name}' 없음 ({', '.join(TRACE_BACKENDS)})")
@@ -0,0 +1,157 @@
+import io
+import os
+
+from fontTools.ttLib import TTFont
+
+from .build_options import WEB_FORMATS
+from .syllable_layout import SYLLABLE_BASE, SYLLABLE_COUNT
+
+
+CSS_FORMAT = {"woff": "woff", "woff2": "woff2"}
+
+
+# KS X 1001 완성형 2350자 (자주 쓰는 음절) : EUC-KR 2바이트로 표현 가능한 음절
+def ksx1001_syllables():
+    syllables = []
+    for code in range(SYLLABLE_BASE, SYLLABLE_BASE + SYLLABLE_COUNT):
+        try:
+            if len(chr(code).encode("euc_kr")) == 2:
+                syllables.append(code)
+        except UnicodeEncodeError:
+            pass
+    return syllables
+
+
+# 음절 순서 : order_path(빈도순 텍스트) 의 음절 → KS X 1001 → 나머지
+def syllable_order(order_path = None):
+    order = []
+    if order_path:
+        with open(order_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        order = [ord(c) for c in text if SYLLABLE_BASE <= ord(c) < SYLLABLE_BASE + SYLLABLE_COUNT]
+
+    order += ksx1001_syllables()
+    order += range(SYLLABLE_BASE, SYLLABLE_BASE + SYLLABLE_COUNT)
+    return list(dict.fromkeys(order))
+
+
+# unicode-range 값 : 연속된 코드 포인트를 구간으로 묶음
+def unicode_range(codes):
+    ranges = []
+    for code in sorted(codes):
+        if ranges and ranges[-1][1] == code - 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+
+    return ", ".join(f"U+{start:04X}" if start == end else f"U+{start:04X}-{end:04X}" for start, end in ranges)
+
+
+# 빌드된 TTF 에서 웹 폰트(WOFF / WOFF2) 와 unicode-range 조각 + @font-face CSS 생성
+#   formats : 전체 폰트를 변환할 형식 목록
+#   slice_size : 0 이 아니면 음절을 slice_size 개씩 나눈 조각 폰트 생성 (자모 등 나머지 문자는 첫 조각)
+class WebFontWriter:
+    def __init__(self, font_path, font_name, formats = None, slice_size = 0, order_path = None,
+                 subtask_call = None):
+        self.font_path = font_path
+        self.font_name = font_name
+        self.formats = formats if formats else []
+        self.slice_size = slice_size
+        self.order_path = order_path
+        self.subtask_call = subtask_call if subtask_call else lambda msg : None
+
+        self.slice_formats = self.formats if self.formats else ["woff2"]  # 조각 폰트 형식 (--web 이 없으면 woff2)
+
+    # 빌드 전에 호출 : 형식 / brotli 확인 (TTF 를 다 만든 뒤에 실패하지 않도록)
+    def check(self):
+        flavors = self.formats + (self.slice_formats if self.slice_size else [])
+        try:
+            for flavor in dict.fromkeys(flavors):
+                self._check_flavor(flavor)
+        except Exception as e:
+            raise Exception(f"Web Font : {e}")
+
+    def write_all(self):
+        try:
+            with open(self.font_path, "rb") as f:
+                data = f.read()
+
+            for flavor in self.formats:
+                path = f"{os.path.splitext(self.font_path)[0]}.{flavor}"
+                font = TTFont(io.BytesIO(data))
+                font.flavor = flavor
+                font.save(path)
+                self.subtask_call(f"{os.path.basename(path)} ({os.path.getsize(path) / 1024:.1f} KB)")
+
+            if self.slice_size:
+                self._write_slices(data)
+
+        except Exception as e:
+            raise Exception(f"Web Font : {e}")
+
+    def _write_slices(self, data):
+        cmap = TTFont(io.BytesIO(data))["cmap"].getBestCmap()
+        mapped = {code for code, glyph_name in cmap.items() if glyph_name != ".notdef"}
+
+        syllables = [code for code in syllable_order(self.order_path) if code in mapped]
+        others = sorted(code for code in mapped
+                        if not SYLLABLE_BASE <= code < SYLLABLE_BASE + SYLLABLE_COUNT)
+
+        slices = [syllables[i:i + self.slice_size] for i in range(0, len(syllables), self.slice_size)]
+        if not slices:
+            slices = [[]]
+        slices[0] = others + slices[0]
+        slices = [codes for codes in slices if codes]
+
+        out_dir = os.path.splitext(self.font_path)[0] + "_web"
+        os.makedirs(out_dir, exist_ok=True)
+        stem = os.path.basename(os.path.splitext(self.font_path)[0])
+
+        rules = []
+        for index, codes in enumerate(slices):
+            sources = []
+            for flavor in self.slice_formats:
+                file_name = f"{stem}.{index:03d}.{flavor}"
+                self._subset(data, codes, flavor, os.path.join(out_dir, file_name))
+                sources.append(f'url("{file_name}") format("{CSS_FORMAT[flavor]}")')
+
+            rules.append(
+                "@font-face {\n"
+                f'  font-family: "{self.font_name}";\n'
+                f"  src: {', '.join(sources)};\n"
+                f"  unicode-range: {unicode_range(codes)};\n"
+                "  font-display: swap;\n"
+                "}\n"
+            )
+
+        css_path = os.path.join(out_dir, stem + ".css")
+        with open(css_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(rules))
+
+        self.subtask_call(f"웹 폰트 조각 {len(slices)}개 ({len(syllables)}개 음절) → {out_dir}")
+
+    def _subset(self, data, codes, flavor, path):
+        from fontTools import subset  # 조각을 만들 때만 불러옴 (불러오는 데만 0.1초 이상)
+
+        options = subset.Options()
+        options.flavor = flavor
+        options.layout_features = ["*"]
+        options.name_IDs = ["*"]
+        options.notdef_outline = True
+        options.recalc_bounds = False  # 조각에서도 음절 bbox 는 빌드 때 계산한 값 사용
+
+        font = TTFont(io.BytesIO(data))
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codes)
+        subsetter.subset(font)
+        subset.save_font(font, path, options)
+
+    def _check_flavor(self, flavor):
+        if flavor not in WEB_FORMATS:
+            raise Exception(f"지원하지 않는 웹 폰트 형식 : {flavor}")
+
+        if flavor == "woff2":
+            try:
+                import brotli  # noqa: F401
+            except ImportError:
+                raise Exception("woff2 출력에는 brotli 패키지가 필요합니다. (pip install brotli)")
@@ -0,0 +1,216 @@
+import os
+import sys
+import json
+import time
+import shutil
+import random
+import hashlib
+import argparse
+import tempfile
+import tracemalloc
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.font_builder import FontBuilder
+from model.syllable_layout import component_names
+from model.trace_backend import TRACE_BACKENDS
+
+
+STAGES = ["convert_all", "build_svg_to_glyph", "build_syllable_glyphs", "fill_tables", "save_font"]
+BASELINE_VERSION = 1
+
+
+# 부품 이름으로 시드를 정해 항상 같은 이미지 생성
+#   complexity : 획 수 (직선 + 호)
+def draw_component(name, resolution, complexity):
+    seed = int(hashlib.md5(name.encode()).hexdigest()[:8], 16)
+    rng = random.Random(seed)
+
+    img = Image.new("L", (resolution, resolution), 255)
+    draw = ImageDraw.Draw(img)
+    width = max(resolution // 25, 1)
+    margin = resolution // 10
+
+    def point():
+        return (rng.randint(margin, resolution - margin), rng.randint(margin, resolution - margin))
+
+    for i in range(complexity):
+        if i % 3 == 2:
+            x0, y0 = point()
+            size = rng.randint(resolution // 10, resolution // 4)
+            draw.arc((x0 - size, y0 - size, x0 + size, y0 + size),
+                     rng.randint(0, 180), rng.randint(181, 360), fill=0, width=width)
+        else:
+            draw.line([point(), point(), point()], fill=0, width=width, joint="curve")
+
+    return img
+
+
+def generate_fixtures(png_dir, names, resolution, complexity):
+    os.makedirs(png_dir, exist_ok=True)
+    for name in names:
+        draw_component(name, resolution, complexity).save(os.path.join(png_dir, name + ".png"))
+
+
+def run_stages(work_dir, args, memory):
+    png_dir = os.path.join(work_dir, "png")
+    svg_dir = os.path.join(work_dir, "svg")
+    font_path = os.path.join(work_dir, "font", "Benchmark.ttf")
+    shutil.rmtree(svg_dir, ignore_errors=True)
+
+    builder = FontBuilder(png_dir, svg_dir, font_path, args.potrace_path, font_name="Benchmark",
+                          jobs=args.jobs, svg_cache=False, glyph_cache=False, trace_backend=args.backend)
+    builder._build_notdef_glyph()
+    builder._build_null_glyph()
+    builder._build_nonmarkingreturn_glyph()
+
+    stages = [
+        ("convert_all", lambda: builder.png_converter.convert_all(png_dir, svg_dir),
+         lambda: len(os.listdir(png_dir))),
+        ("build_svg_to_glyph", builder._build_base_glyphs,
+         lambda: len(builder.glyphs)),
+        ("build_syllable_glyphs", builder._build_syllable_glyphs,
+         lambda: len(builder.composite_names)),
+        ("fill_tables", lambda: (builder._setup_glyph_order(), builder._fill_tables()),
+         lambda: len(builder.glyph_order)),
+        ("save_font", builder._save_font,
+         lambda: len(builder.glyph_order)),
+    ]
+
+    results = {}
+    for name, func, count in stages:
+        if memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+
+        result = {"seconds": elapsed, "glyphs": count()}
+        result["glyphs_per_s"] = result["glyphs"] / elapsed if elapsed > 0 else 0.0
+        if memory:
+            result["peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+        results[name] = result
+
+    return results
+
+
+# 시간은 반복 중 최솟값, 메모리는 tracemalloc 을 켠 별도 1회 실행 (추적 비용이 시간에 섞이지 않도록)
+def benchmark(work_dir, args):
+    timings = [run_stages(work_dir, args, memory=False) for _ in range(args.repeat)]
+    memory = run_stages(work_dir, args, memory=True)
+
+    results = {}
+    for name in STAGES:
+        best = min((timing[name] for timing in timings), key=lambda r: r["seconds"])
+        results[name] = dict(best, peak_mb=memory[name]["peak_mb"])
+    return results
+
+
+def settings(args, count):
+    return {
+        "backend": args.backend,
+        "resolution": args.resolution,
+        "complexity": args.complexity,
+        "components": count,
+        "jobs": args.jobs,
+    }
+
+
+# 기준값보다 허용 비율 + 최소 차이 이상 느려지거나 메모리를 더 쓰면 회귀
+def check_regressions(results, baseline, tolerance, min_seconds, min_mb):
+    failures = []
+    for name in STAGES:
+        if name not in baseline["stages"]:
+            continue
+        base = baseline["stages"][name]
+        current = results[name]
+
+        limit = max(base["seconds"] * (1 + tolerance), base["seconds"] + min_seconds)
+        if current["seconds"] > limit:
+            failures.append(f"{name} : {current['seconds']:.3f}s > {limit:.3f}s (기준 {base['seconds']:.3f}s)")
+
+        limit = max(base["peak_mb"] * (1 + tolerance), base["peak_mb"] + min_mb)
+        if current["peak_mb"] > limit:
+            failures.append(f"{name} : {current['peak_mb']:.1f}MB > {limit:.1f}MB (기준 {base['peak_mb']:.1f}MB)")
+    return failures
+
+
+def print_results(results, baseline):
+    print(f"{'stage':<24}{'seconds':>10}{'glyphs/s':>12}{'peak MB':>10}{'기준 대비':>10}")
+    for name in STAGES:
+        r = results[name]
+        ratio = ""
+        if baseline and name in baseline["stages"] and baseline["stages"][name]["seconds"] > 0:
+            ratio = f"{r['seconds'] / baseline['stages'][name]['seconds']:.2f}x"
+        print(f"{name:<24}{r['seconds']:>10.3f}{r['glyphs_per_s']:>12.0f}{r['peak_mb']:>10.1f}{ratio:>10}")
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    return baseline if baseline.get("version") == BASELINE_VERSION else None
+
+
+def main():
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--resolution", dest="resolution", type=int, default=1000)
+    parser.add_argument("-c", "--complexity", dest="complexity", type=int, default=4)
+    parser.add_argument("-b", "--backend", dest="backend", choices=list(TRACE_BACKENDS), default="numpy")
+    parser.add_argument("-p", "--potrace", dest="potrace_path",
+                        default=os.path.join(base_dir, "potrace.exe") if os.name == "nt" else "potrace")
+    parser.add_argument("-j", "--jobs", dest="jobs", type=int, default=1)
+    parser.add_argument("-n", "--repeat", dest="repeat", type=int, default=1)
+    parser.add_argument("-w", "--work-dir", dest="work_dir", default=None)
+    parser.add_argument("--baseline", dest="baseline", default=os.path.join(base_dir, "benchmark_baseline.json"))
+    parser.add_argument("--save-baseline", dest="save_baseline", action="store_true")
+    parser.add_argument("--tolerance", dest="tolerance", type=float, default=0.25)
+    parser.add_argument("--min-seconds", dest="min_seconds", type=float, default=0.05)
+    parser.add_argument("--min-mb", dest="min_mb", type=float, default=5.0)
+    args = parser.parse_args()
+
+    work_dir = args.work_dir if args.work_dir else tempfile.mkdtemp(prefix="imgtofont-bench-")
+
+    try:
+        names = component_names()
+        print(f"부품 이미지 {len(names)}개 생성 ({args.resolution}px, 획 {args.complexity}개)")
+        generate_fixtures(os.path.join(work_dir, "png"), names, args.resolution, args.complexity)
+
+        results = benchmark(work_dir, args)
+    finally:
+        if args.work_dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    current = {"version": BASELINE_VERSION, "settings": settings(args, len(names)), "stages": results}
+    baseline = load_baseline(args.baseline)
+    if baseline and baseline["settings"] != current["settings"]:
+        print("기준값과 설정이 달라 비교하지 않음")
+        baseline = None
+
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=1)
+        print(f"기준값 저장 : {args.baseline}")
+        return
+
+    if baseline:
+        failures = check_regressions(results, baseline, args.tolerance, args.min_seconds, args.min_mb)
+        if failures:
+            print("성능 회귀 :")
+            for failure in failures:
+                print(f"    └─ {failure}")
+            sys.exit(1)
+        print("성능 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+from PIL import Image, ImageDraw
+from fontTools.pens.basePen import BasePen
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.trace_backend import PotraceBackend, NumpyTraceBackend
+
+
+# 아웃라인을 다각형으로 근사 (곡선은 일정 간격으로 샘플링)
+class PolygonPen(BasePen):
+    def __init__(self, steps=8):
+        super().__init__(None)
+        self.steps = steps
+        self.polygons = []
+        self.current = []
+        self.segments = 0
+
+    def _moveTo(self, pt):
+        self.current = [pt]
+
+    def _lineTo(self, pt):
+        self.segments += 1
+        self.current.append(pt)
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        self.segments += 1
+        p0, p1, p2, p3 = map(np.array, (self._getCurrentPoint(), pt1, pt2, pt3))
+        for t in np.linspace(0, 1, self.steps + 1)[1:]:
+            point = (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t ** 2 * p2 + t ** 3 * p3
+            self.current.append(tuple(point))
+
+    def _closePath(self):
+        self.polygons.append(self.current)
+        self.current = []
+
+
+# 아웃라인을 다시 래스터화해 원본 비트맵과 IoU 비교 (even-odd)
+def rasterize(pen, size):
+    width, height = size
+    result = np.zeros((height, width), dtype=bool)
+
+    for polygon in pen.polygons:
+        if len(polygon) < 3:
+            continue
+        mask = Image.new("1", size, 0)
+        ImageDraw.Draw(mask).polygon([(x, height - y) for x, y in polygon], fill=1)
+        result ^= np.asarray(mask, dtype=bool)
+
+    return result
+
+
+def benchmark(backend, png_paths):
+    elapsed = 0
+    segments = 0
+    ious = []
+
+    for png_path in png_paths:
+        bitmap = Image.open(png_path).convert("1")
+        ink = ~np.asarray(bitmap, dtype=bool)
+        pen = PolygonPen()
+
+        start = time.perf_counter()
+        backend.draw(png_path, bitmap, pen)
+        elapsed += time.perf_counter() - start
+
+        segments += pen.segments
+        traced = rasterize(pen, bitmap.size)
+        union = (traced | ink).sum()
+        ious.append((traced & ink).sum() / union if union else 1.0)
+
+    return elapsed, segments, float(np.mean(ious))
+
+
+def main():
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", dest="image_dir", default=os.path.join(base_dir, "image", "png"))
+    parser.add_argument("-l", "--limit", dest="limit", type=int, default=30)
+    parser.add_argument("-p", "--potrace", dest="potrace_path",
+                        default=os.path.join(base_dir, "potrace.exe") if os.name == "nt" else "potrace")
+    args = parser.parse_args()
+
+    png_files = sorted(f for f in os.listdir(args.image_dir) if f.endswith(".png"))[:args.limit]
+    png_paths = [os.path.join(args.image_dir, f) for f in png_files]
+
+    print(f"{len(png_paths)}개 이미지")
+    print(f"{'backend':<10}{'ms/image':>10}{'segments':>10}{'IoU':>10}")
+
+    for backend in (PotraceBackend(args.potrace_path), NumpyTraceBackend()):
+        try:
+            elapsed, segments, iou = benchmark(backend, png_paths)
+        except Exception as e:
+            print(f"{backend.name:<10} 실행 불가 : {e}")
+            continue
+
+        ms = elapsed * 1000 / max(len(png_paths), 1)
+        print(f"{backend.name:<10}{ms:>10.1f}{segments:>10}{iou:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import os
+import sys
+import argparse
+
+import numpy as np
+from fontTools.ttLib import TTFont
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.gsub_layout import read_ccmp_substitutions
+
+
+# 글리프 윤곽선 (좌표 배열 [N, 2], 윤곽선 끝점, on-curve 플래그), 합성 글리프는 부품을 위치만큼 옮겨 이어 붙임
+def outline(glyf, glyph_name, cache):
+    if glyph_name not in cache:
+        glyph = glyf[glyph_name]
+        if glyph.isComposite():
+            cache[glyph_name] = join([(outline(glyf, comp.glyphName, cache), comp.x, comp.y)
+                                      for comp in glyph.components])
+        else:
+            coords, ends, flags = glyph.getCoordinates(glyf)
+            cache[glyph_name] = (np.array(coords.array, dtype=np.int64).reshape(-1, 2),
+                                 list(ends), [flag & 0x01 for flag in flags])
+    return cache[glyph_name]
+
+
+def join(parts):
+    coordinates, end_points, flags = [np.empty((0, 2), dtype=np.int64)], [], []
+    count = 0
+    for (coords, ends, part_flags), x, y in parts:
+        coordinates.append(coords + (x, y))
+        end_points.extend(end + count for end in ends)
+        flags.extend(part_flags)
+        count += len(coords)
+    return np.concatenate(coordinates), end_points, flags
+
+
+# 문자 하나를 그린 결과 (윤곽선, 전체 너비)
+#   gsub 폰트는 ccmp 다중 치환을 적용한 뒤 글리프를 너비만큼 이어서 그림
+def render(font, cmap, substitutions, char_code, cache):
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+    glyph_name = cmap.get(char_code, ".notdef")
+
+    parts = []
+    x = 0
+    for name in substitutions.get(glyph_name, [glyph_name]):
+        parts.append((outline(glyf, name, cache), x, 0))
+        x += hmtx[name][0]
+    return join(parts), x
+
+
+def same(expected, actual):
+    (expected_coords, expected_ends, expected_flags), expected_width = expected
+    (actual_coords, actual_ends, actual_flags), actual_width = actual
+    return (np.array_equal(expected_coords, actual_coords) and expected_ends == actual_ends
+            and expected_flags == actual_flags and expected_width == actual_width)
+
+
+def compare(composite_path, gsub_path):
+    composite = TTFont(composite_path)
+    gsub = TTFont(gsub_path)
+
+    composite_cmap = composite.getBestCmap()
+    gsub_cmap = gsub.getBestCmap()
+    substitutions = read_ccmp_substitutions(gsub)
+
+    codes = sorted(set(composite_cmap) | set(gsub_cmap))
+    composite_cache, gsub_cache = {}, {}
+    mismatches = [
+        char_code for char_code in codes
+        if not same(render(composite, composite_cmap, {}, char_code, composite_cache),
+                    render(gsub, gsub_cmap, substitutions, char_code, gsub_cache))
+    ]
+
+    print(f"문자 {len(codes)}개 비교 / ccmp 치환 {len(substitutions)}개")
+    print(f"composite : 글리프 {len(composite.getGlyphOrder())}개, {os.path.getsize(composite_path) / 1024:.1f} KB")
+    print(f"gsub      : 글리프 {len(gsub.getGlyphOrder())}개, {os.path.getsize(gsub_path) / 1024:.1f} KB")
+    return mismatches
+
+
+# 같은 부품으로 --mode composite / --mode gsub 로 빌드한 두 폰트가 모든 문자를 같은 윤곽선으로 그리는지 확인
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("composite_path")
+    parser.add_argument("gsub_path")
+    args = parser.parse_args()
+
+    mismatches = compare(args.composite_path, args.gsub_path)
+    if mismatches:
+        print(f"다르게 그려지는 문자 {len(mismatches)}개 :")
+        for char_code in mismatches[:20]:
+            print(f"    └─ U+{char_code:04X} {chr(char_code)}")
+        sys.exit(1)
+    print("두 폰트가 모든 문자를 같게 그림")
+
+
+if __name__ == "__main__":
+    main()
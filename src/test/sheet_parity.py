@@ -0,0 +1,119 @@
+import os
+import sys
+import argparse
+import tempfile
+
+import numpy as np
+from PIL import Image
+from fontTools.ttLib import TTFont
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.font_builder import FontBuilder
+from model.image_source import SHEET_COLUMNS
+from model.raster_preprocess import CANVAS_SIZE
+from model.syllable_layout import component_names
+
+
+# PNG 폴더의 부품을 component_names() 순서로 칸마다 붙인 시트 PNG 저장
+def write_sheet(image_dir, sheet_path, cell, columns):
+    names = component_names()
+    rows = -(-len(names) // columns)
+    sheet = Image.new("L", (columns * cell, rows * cell), 255)
+
+    for i, name in enumerate(names):
+        path = os.path.join(image_dir, name + ".png")
+        if not os.path.exists(path):
+            continue
+        with Image.open(path) as img:
+            img = Image.alpha_composite(Image.new("RGBA", img.size, "white"), img.convert("RGBA")).convert("L")
+        if img.size != (cell, cell):
+            img = img.resize((cell, cell), Image.LANCZOS)
+        sheet.paste(img, ((i % columns) * cell, (i // columns) * cell))
+
+    Image.MAX_IMAGE_PIXELS = None  # 1000px 칸 시트는 Pillow 기본 제한보다 큼
+    sheet.save(sheet_path)
+
+
+def build(image_dir, font_path, backend, columns):
+    builder = FontBuilder(image_dir, os.path.dirname(font_path), font_path, "potrace", trace_backend=backend,
+                          direct=True, glyph_cache=False, sheet_columns=columns)
+    builder.build_all()
+
+
+# 글리프 이름 → (좌표 배열, 윤곽선 끝점, 너비), 합성 글리프는 부품 이름과 위치
+def glyphs(font_path):
+    font = TTFont(font_path)
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+
+    result = {}
+    for name in font.getGlyphOrder():
+        glyph = glyf[name]
+        if glyph.isComposite():
+            result[name] = ([(comp.glyphName, comp.x, comp.y) for comp in glyph.components], None, hmtx[name][0])
+        else:
+            coords, ends, _ = glyph.getCoordinates(glyf)
+            result[name] = (np.array(coords.array, dtype=np.int64).reshape(-1, 2), list(ends), hmtx[name][0])
+    return result
+
+
+def same(expected, actual):
+    if isinstance(expected[0], list) or isinstance(actual[0], list):
+        return expected == actual
+    return np.array_equal(expected[0], actual[0]) and expected[1:] == actual[1:]
+
+
+# bounds 차이 (가장 크게 어긋난 변의 폰트 단위 거리), 윤곽선이 없으면 None
+def bounds_error(expected, actual):
+    if isinstance(expected[0], list) or not len(expected[0]) or not len(actual[0]):
+        return None
+    expected_box = np.concatenate([expected[0].min(axis=0), expected[0].max(axis=0)])
+    actual_box = np.concatenate([actual[0].min(axis=0), actual[0].max(axis=0)])
+    return int(np.abs(expected_box - actual_box).max())
+
+
+# 같은 부품 PNG 를 폴더 / 시트 PNG 로 입력해 빌드한 두 폰트가 글리프마다 같은지 확인
+#   칸 크기가 캔버스(1000px)와 같으면 모든 글리프가 같아야 하고, 작으면 리샘플링 오차만큼 어긋남 (--tolerance)
+def main():
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", dest="image_dir", default=os.path.join(base_dir, "image", "png"))
+    parser.add_argument("--cell", type=int, default=CANVAS_SIZE[0], help="시트 칸 크기 (px)")
+    parser.add_argument("--sheet-columns", dest="columns", type=int, default=SHEET_COLUMNS)
+    parser.add_argument("-b", "--backend", default="potrace")
+    parser.add_argument("--tolerance", type=int, default=0, help="작은 칸 시트에서 허용할 bounds 차이 (폰트 단위)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        sheet_path = os.path.join(work_dir, "sheet.png")
+        write_sheet(args.image_dir, sheet_path, args.cell, args.columns)
+
+        directory_font = os.path.join(work_dir, "dir", "Font.ttf")
+        sheet_font = os.path.join(work_dir, "sheet", "Font.ttf")
+        build(args.image_dir, directory_font, args.backend, args.columns)
+        build(sheet_path, sheet_font, args.backend, args.columns)
+
+        expected = glyphs(directory_font)
+        actual = glyphs(sheet_font)
+
+    names = sorted(set(expected) | set(actual))
+    mismatches = [name for name in names
+                  if name not in expected or name not in actual or not same(expected[name], actual[name])]
+    if args.tolerance:  # 리샘플링으로 점 위치는 달라지므로 bounds 만 비교
+        mismatches = [name for name in mismatches if name not in expected or name not in actual
+                      or (bounds_error(expected[name], actual[name]) or 0) > args.tolerance]
+
+    print(f"글리프 {len(names)}개 비교 (시트 칸 {args.cell}px, 가로 {args.columns}칸)")
+    if mismatches:
+        print(f"다른 글리프 {len(mismatches)}개 :")
+        for name in mismatches[:20]:
+            error = bounds_error(expected[name], actual[name]) if name in expected and name in actual else None
+            print(f"    └─ {name}" + (f" : bounds 차이 {error}" if error is not None else ""))
+        sys.exit(1)
+    print("폴더 / 시트 입력 폰트의 모든 글리프가 같음" + (f" (bounds 차이 {args.tolerance} 이내)" if args.tolerance else ""))
+
+
+if __name__ == "__main__":
+    main()
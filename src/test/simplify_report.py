@@ -0,0 +1,65 @@
+import os
+import sys
+import argparse
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.glyph_builder import compile_component_glyph, count_points
+from model.syllable_layout import SYLLABLE_COMPONENTS, component_names
+
+
+# 허용 오차 하나로 모든 부품 컴파일 → {부품 이름: (점 수, glyf 바이트)}, 단순화 전 점 수
+def measure(svg_paths, tolerance):
+    results, source = {}, {}
+    for name, path in svg_paths.items():
+        glyph = compile_component_glyph("svg", path, 1000, tolerance)
+        results[name] = (count_points(glyph), len(glyph.compile(None)))
+        source[name] = getattr(glyph, "source_points", results[name][0])
+    return results, source
+
+
+# SVG 폴더의 부품을 허용 오차마다 컴파일해 부품 점 수 / 음절 참조 점 수 / glyf 크기 비교 (--simplify 값 선택용)
+def main():
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-s", "--svg", dest="svg_dir", default=os.path.join(base_dir, "image", "svg"))
+    parser.add_argument("-t", "--tolerance", dest="tolerances", type=float, nargs="+", default=[0.5, 1, 2, 4])
+    parser.add_argument("--detail", type=int, default=10, help="점이 많이 줄어든 부품 출력 수")
+    args = parser.parse_args()
+
+    svg_paths = {name: os.path.join(args.svg_dir, name + ".svg") for name in component_names()}
+    svg_paths = {name: path for name, path in svg_paths.items() if os.path.exists(path)}
+    if not svg_paths:
+        print(f"{args.svg_dir} 에 부품 SVG 없음")
+        sys.exit(1)
+
+    usage = Counter(name for components in SYLLABLE_COMPONENTS for name in components if name)
+
+    rows, source = [], None
+    for tolerance in args.tolerances:
+        results, source = measure(svg_paths, tolerance)
+        rows.append((tolerance, results))
+
+    def print_row(label, points, size):
+        referenced = sum(count * usage[name] for name, count in points.items())
+        print(f"{label:<10} {sum(points.values()):>10,} {referenced:>14,} {size:>10}")
+
+    print(f"부품 {len(svg_paths)}개 ({args.svg_dir})")
+    print(f"{'허용 오차':<10} {'부품 점':>10} {'음절 참조 점':>14} {'glyf KB':>10}")
+    print_row("단순화 전", source, "-")
+    for tolerance, results in rows:
+        size = sum(glyf_bytes for _, glyf_bytes in results.values()) / 1024
+        print_row(f"{tolerance:g}", {name: points for name, (points, _) in results.items()}, f"{size:.1f}")
+
+    if args.detail:
+        tolerance, results = rows[-1]
+        largest = sorted(results, key=lambda name: results[name][0] - source[name])[:args.detail]
+        print(f"\n점이 많이 줄어든 부품 (허용 오차 {tolerance:g})")
+        for name in largest:
+            print(f"    └─ {name} : {source[name]} → " + " / ".join(str(row[name][0]) for _, row in rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import sys
 import os
+import unicodedata
 
 class OutputView:
     def display_welcome(self):
@@ -45,5 +46,81 @@ class OutputView:
         self.display_subtask(f"크기 : {size_kb:.1f} KB")
         print("=" * 40)
 
+    def display_profile(self, summary):
+        print()
+        print(f"{self._pad('단계', 24)}{'wall(s)':>9}{'cpu(s)':>9}{'RSS(MB)':>9}")
+        for stage in summary["stages"]:
+            rss = f"{stage['peak_rss_kb'] / 1024:.1f}" if stage["peak_rss_kb"] is not None else "-"
+            print(f"{self._pad(stage['name'], 24)}{stage['wall']:>9.3f}{stage['cpu']:>9.3f}{rss:>9}")
+        print(f"{self._pad('합계', 24)}{summary['total_wall']:>9.3f}{summary['total_cpu']:>9.3f}")
+
+        for name, value in summary["counters"].items():
+            self.display_subtask(f"{name} : {value}")
+        print("=" * 40)
+
+    def display_plan(self, planner, limit = 20):
+        print(f"PNG {len(planner.png_names)}개 / SVG {len(planner.svg_names)}개 ({planner.elapsed * 1000:.1f}ms)")
+
+        if planner.missing_jamo:
+            print(f"빠진 자모 {len(planner.missing_jamo)}개 → .notdef")
+            for code, name in planner.missing_jamo[:limit]:
+                self.display_subtask(f"{name} ({chr(code)})")
+
+        if planner.missing:
+            print(f"빠진 부품 {len(planner.missing)}개 → 음절 {planner.broken_syllables}개 .notdef")
+            for name, count in planner.missing[:limit]:
+                self.display_subtask(f"{name} : 음절 {count}개")
+            if len(planner.missing) > limit:
+                self.display_subtask(f"... 외 {len(planner.missing) - limit}개")
+
+        if planner.derived:
+            print(f"레이아웃 명세로 기본 그림을 변환해 만들 부품 {len(planner.derived)}개")
+        if planner.svg_only:
+            print(f"PNG 없이 SVG 만 있는 부품 {len(planner.svg_only)}개 (이전 변환 결과 사용)")
+        if planner.unknown:
+            print(f"명명 규칙에 없는 파일 {len(planner.unknown)}개 (빌드에 사용 안 함)")
+            for name in planner.unknown[:limit]:
+                self.display_subtask(name)
+
+        if not planner.missing and not planner.missing_jamo:
+            print("모든 부품이 있습니다.")
+        print("=" * 40)
+
+    def display_verify(self, verifier, limit = 20):
+        print(f"글리프 {verifier.glyph_count}개 / 코드 포인트 {verifier.checked}개 검사 ({verifier.elapsed * 1000:.1f}ms)")
+
+        problems = [
+            (".notdef 로 보이는 글자", [f"U+{code:04X} ({chr(code)})" for code in verifier.notdef]),
+            ("그릴 것이 없는 글리프", [f"U+{code:04X} ({chr(code)}) → {name}" for code, name in verifier.empty]),
+            ("잘못된 부품 참조", [f"{name} : {msg}" for name, msg in verifier.bad_references]),
+            ("bounds 불일치", [f"{name} : {stored} → 실제 {actual}" for name, stored, actual in verifier.bad_bounds]),
+        ]
+        for title, items in problems:
+            if not items:
+                continue
+            print(f"{title} {len(items)}개")
+            for item in items[:limit]:
+                self.display_subtask(item)
+            if len(items) > limit:
+                self.display_subtask(f"... 외 {len(items) - limit}개")
+
+        if verifier.ok():
+            print("모든 음절 / 자모가 글리프에 연결되어 있고 참조 / bounds 가 올바릅니다.")
+
+        if verifier.compare_path is not None:
+            print(f"{verifier.compare_path} 와 비교 : 바뀐 글리프 {len(verifier.changed)}개 / "
+                  f"추가 {len(verifier.added)}개 / 삭제 {len(verifier.removed)}개 / cmap 변경 {verifier.cmap_changes}개")
+            for label, names in (("바뀜", verifier.changed), ("추가", verifier.added), ("삭제", verifier.removed)):
+                for name in names[:limit]:
+                    self.display_subtask(f"{label} : {name}")
+                if len(names) > limit:
+                    self.display_subtask(f"{label} : ... 외 {len(names) - limit}개")
+        print("=" * 40)
+
+    # 한글은 터미널에서 두 칸 차지
+    def _pad(self, text, width):
+        text_width = sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+        return text + " " * max(width - text_width, 0)
+
     def display_error(self, error_message: str):
         print(f"[오류] {error_message}")